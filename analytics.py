@@ -0,0 +1,239 @@
+"""
+timetable.json 교수별 강의 통계 엔진
+
+find_top_professor.py / verify_top_professor.py / analyze_by_session.py / deep_dive_professors.py가
+각자 파일을 다시 읽어 따로 세던 값을 한 번의 순회로 모두 계산합니다.
+ - slots:    강의 시간(슬롯) 수 (주 2회 수업이면 2)
+ - courses:  고유 과목 수 (과목코드 + 분반)
+ - sessions: 주간 수업 세션 수 (과목코드 + 분반 + 요일, 온라인 제외)
+ - subjects: 과목명별 슬롯 수, course_list: 고유 과목별 (과목명, 시간) 목록
+
+계산 결과는 입력 파일의 SHA-256을 키로 .analytics_cache.json에 저장해 두고,
+timetable.json이 바뀌지 않았으면 다시 계산하지 않습니다.
+--db timetable.db를 주면 JSON 대신 SQLite 저장소(timetable_db.py)에서 같은 통계를 SQL 집계로 읽습니다.
+
+사용법:
+    python3 analytics.py top --by courses -n 5
+    python3 analytics.py --db timetable.db professor 권인선
+"""
+import argparse
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+from timetable_db import SchemaVersionError, connect
+
+TIMETABLE_FILE = 'timetable.json'
+CACHE_FILE = '.analytics_cache.json'
+CACHE_VERSION = 1
+
+# timetable_db.py의 timetable 뷰에 대한 집계 (교수 / 과목 순서는 처음 나온 행 순서)
+PROFESSOR_SQL = """
+SELECT professor, COUNT(*) AS slots,
+       COUNT(DISTINCT CASE WHEN code != '' AND class_number != '' THEN code || '|' || class_number END) AS courses,
+       COUNT(DISTINCT CASE WHEN day != 'ONLINE' THEN code || '|' || class_number || '|' || day END) AS sessions
+FROM timetable WHERE professor != '' GROUP BY professor ORDER BY MIN(seq)
+"""
+SUBJECT_SQL = """
+SELECT professor, subject, COUNT(*) AS slots
+FROM timetable WHERE professor != '' GROUP BY professor, subject ORDER BY MIN(seq)
+"""
+# 고유 과목별 시간 목록 - subject는 SQLite 규칙상 MIN(seq) 행의 값
+COURSE_TIME_SQL = """
+SELECT professor, code, class_number, subject, day || ' ' || start || '-' || "end" AS time_info, MIN(seq)
+FROM timetable WHERE professor != '' AND code != '' AND class_number != ''
+GROUP BY professor, code, class_number, day, start, "end" ORDER BY MIN(seq)
+"""
+
+METRICS = {
+    'slots': "강의 시간(슬롯)",
+    'courses': "고유 과목 수",
+    'sessions': "주간 수업 세션",
+}
+
+
+def compute_aggregates(data):
+    """교수별 통계를 한 번의 순회로 계산 (교수 순서는 데이터에 처음 나온 순서)"""
+    slots = defaultdict(int)
+    subjects = defaultdict(lambda: defaultdict(int))
+    courses = defaultdict(dict)
+    sessions = defaultdict(set)
+
+    for item in data:
+        prof = item.get('professor')
+        if not prof:
+            continue
+        slots[prof] += 1
+        subjects[prof][item.get('subject')] += 1
+
+        code, class_number = item.get('code'), item.get('class_number')
+        if code and class_number:
+            course = courses[prof].setdefault(f"{code}|{class_number}", {
+                "code": code,
+                "class_number": class_number,
+                "subject": item.get('subject'),
+                "times": []
+            })
+            time_info = f"{item.get('day')} {item.get('start')}-{item.get('end')}"
+            if time_info not in course["times"]:
+                course["times"].append(time_info)
+
+        if item.get('day') != 'ONLINE':
+            sessions[prof].add((code, class_number, item.get('day')))
+
+    return {
+        prof: {
+            "slots": count,
+            "courses": len(courses[prof]),
+            "sessions": len(sessions[prof]),
+            "subjects": dict(subjects[prof]),
+            "course_list": list(courses[prof].values())
+        }
+        for prof, count in slots.items()
+    }
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Analytics:
+    def __init__(self, professors):
+        self.professors = professors    # {교수: 통계 dict}
+
+    @classmethod
+    def load(cls, path=TIMETABLE_FILE, cache_file=CACHE_FILE, use_cache=True):
+        """path를 읽어 통계 계산 (입력 해시가 같으면 캐시 사용)"""
+        key = f"{CACHE_VERSION}:{file_digest(path)}"
+        if use_cache and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get("key") == key:
+                    return cls(cached["professors"])
+            except (json.JSONDecodeError, KeyError):
+                pass
+
+        with open(path, 'r', encoding='utf-8') as f:
+            professors = compute_aggregates(json.load(f))
+        if use_cache:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "professors": professors}, f, ensure_ascii=False)
+        return cls(professors)
+
+    @classmethod
+    def from_db(cls, path):
+        """timetable.db에서 SQL 집계로 같은 통계를 읽음 (캐시 없음, 스키마 버전이 다르면 SchemaVersionError)"""
+        conn = connect(path)
+        try:
+            professors = {
+                row['professor']: {
+                    "slots": row['slots'], "courses": row['courses'], "sessions": row['sessions'],
+                    "subjects": {}, "course_list": []
+                }
+                for row in conn.execute(PROFESSOR_SQL)
+            }
+            for row in conn.execute(SUBJECT_SQL):
+                professors[row['professor']]["subjects"][row['subject']] = row['slots']
+            courses = {}
+            for row in conn.execute(COURSE_TIME_SQL):
+                key = (row['professor'], row['code'], row['class_number'])
+                if key not in courses:
+                    courses[key] = {"code": row['code'], "class_number": row['class_number'],
+                                    "subject": row['subject'], "times": []}
+                    professors[row['professor']]["course_list"].append(courses[key])
+                courses[key]["times"].append(row['time_info'])
+        finally:
+            conn.close()
+        return cls(professors)
+
+    def top(self, metric='slots', n=5):
+        """metric 기준 상위 n명 [(교수, 값)] (동점이면 데이터에 먼저 나온 순)"""
+        if metric not in METRICS:
+            raise ValueError(f"지원하지 않는 기준: {metric}")
+        ranked = sorted(
+            ((prof, stats[metric]) for prof, stats in self.professors.items() if stats[metric]),
+            key=lambda x: x[1], reverse=True
+        )
+        return ranked[:n]
+
+    def professor(self, name):
+        """교수 한 명의 통계 dict (없으면 None)"""
+        return self.professors.get(name)
+
+
+def load_analytics(db=None):
+    """db(timetable.db 경로)가 있으면 SQL 집계, 없으면 timetable.json (+ 캐시)"""
+    return Analytics.from_db(db) if db else Analytics.load()
+
+
+def add_db_argument(parser):
+    parser.add_argument('--db', help="timetable.json 대신 SQLite 저장소에서 집계 (예: timetable.db)")
+
+
+def print_top(analytics, metric, n=5, unit="개"):
+    for i, (prof, count) in enumerate(analytics.top(metric, n), 1):
+        print(f"{i}위: {prof} 교수님 ({count}{unit})")
+
+
+def print_subject_breakdown(stats):
+    print(f"총 강의 슬롯 수: {stats['slots']}개")
+    print("과목별 강의 횟수:")
+    for subject, count in sorted(stats['subjects'].items(), key=lambda x: x[1], reverse=True):
+        print(f"- {subject}: {count}회")
+
+
+def print_course_list(stats):
+    print(f"총 고유 과목 수: {stats['courses']}개")
+    print("과목 목록 (과목코드, 과목명, 분반):")
+    for course in stats['course_list']:
+        print(f"- {course['subject']} ({course['code']}, {course['class_number']}분반)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교수별 강의 통계")
+    parser.add_argument('--timetable', default=TIMETABLE_FILE)
+    parser.add_argument('--no-cache', action='store_true', help="캐시를 쓰지 않고 다시 계산")
+    add_db_argument(parser)
+    sub = parser.add_subparsers(dest='command', required=True)
+    top = sub.add_parser('top', help="상위 교수 목록")
+    top.add_argument('--by', choices=list(METRICS), default='slots')
+    top.add_argument('-n', type=int, default=5)
+    prof = sub.add_parser('professor', help="교수 한 명의 상세 통계")
+    prof.add_argument('name')
+    args = parser.parse_args()
+
+    try:
+        if args.db:
+            analytics = Analytics.from_db(args.db)
+        else:
+            analytics = Analytics.load(args.timetable, use_cache=not args.no_cache)
+    except FileNotFoundError:
+        print(f"🔴 {args.db or args.timetable} 파일을 찾을 수 없습니다.")
+        return
+    except SchemaVersionError as e:
+        print(f"🔴 {e}")
+        return
+
+    if args.command == 'top':
+        print(f"--- {METRICS[args.by]} 기준 TOP {args.n} ---")
+        print_top(analytics, args.by, args.n)
+        return
+
+    stats = analytics.professor(args.name)
+    if stats is None:
+        print(f"{args.name} 교수님의 데이터를 찾을 수 없습니다.")
+        return
+    print(f"--- {args.name} 교수님 상세 분석 ---")
+    print(f"주간 수업 세션: {stats['sessions']}개")
+    print_subject_breakdown(stats)
+    print_course_list(stats)
+
+
+if __name__ == "__main__":
+    main()
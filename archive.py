@@ -0,0 +1,259 @@
+"""
+학기별 시간표 보관소 (archive/)
+
+converter.py는 실행할 때마다 timetable.json을 덮어쓰므로, 학기마다 변환 결과를
+압축된 불변 파티션으로 보관하고 학기를 넘나드는 질의를 지원합니다.
+ - archive/<학기>.<해시>.ndjson.gz   학기 파티션 (한 줄에 세션 하나, gzip, 한 번 쓰면 바뀌지 않음)
+ - archive/index.json                학기 목록 + 교수/강의실/과목코드별 학기 요약
+
+요약 질의(교수 학기별 강의량, 강의실 학기별 사용량, 과목 마지막 개설 학기)는 index.json만으로 답하고,
+세부 행이 필요한 질의(--detail)는 인덱스에서 해당 학기 파티션만 골라 한 줄씩 읽습니다.
+
+사용법:
+    python3 archive.py add 2025-2                     # timetable.json을 2025-2학기로 보관
+    python3 archive.py terms
+    python3 archive.py professor 홍길동 [--since 2021-1] [--detail]
+    python3 archive.py room 아펜젤러관 A516
+    python3 archive.py course GEN22102 [--detail]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from occupancy import room_key
+from streaming import json_default
+from time_slots import time_to_minutes
+
+ARCHIVE_DIR = 'archive'
+INDEX_NAME = 'index.json'
+HASH_LENGTH = 12
+FORMAT_VERSION = 1
+# 학기 이름: 2025-1, 2025-2, 2025-S(여름), 2025-W(겨울) -> 문자열 정렬 = 시간 순
+TERM_RE = re.compile(r'^\d{4}-[12SW]$')
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def session_minutes(item):
+    try:
+        return max(time_to_minutes(item['end']) - time_to_minutes(item['start']), 0)
+    except (KeyError, AttributeError, ValueError):
+        return 0
+
+
+def summarize(timetable):
+    """학기 하나의 요약: {'professors': {이름: [세션, 주당 분]}, 'rooms': {...}, 'courses': {코드: 분반 수}}"""
+    professors = defaultdict(lambda: [0, 0])
+    rooms = defaultdict(lambda: [0, 0])
+    sections = defaultdict(set)
+    for item in timetable:
+        minutes = session_minutes(item)
+        for name in (item.get('professor') or '').split(','):
+            name = name.strip()
+            if name:
+                professors[name][0] += 1
+                professors[name][1] += minutes
+        building = (item.get('building_name') or '').strip()
+        room = (item.get('classroom') or '').strip()
+        if building and room and item.get('day') != 'ONLINE':
+            stats = rooms[room_key(building, room)]
+            stats[0] += 1
+            stats[1] += minutes
+        code = (item.get('code') or '').strip()
+        if code:
+            sections[code].add(item.get('class_number') or '')
+    return {
+        "professors": dict(professors),
+        "rooms": dict(rooms),
+        "courses": {code: len(classes) for code, classes in sections.items()},
+    }
+
+
+class Archive:
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, INDEX_NAME)
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {"version": FORMAT_VERSION, "terms": {}, "professors": {}, "rooms": {}, "courses": {}}
+
+    @property
+    def terms(self):
+        return sorted(self.index["terms"])
+
+    def _save_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def add(self, term, timetable, source=None):
+        """학기 파티션 추가 -> 파티션 항목 (같은 내용이면 그대로, 다른 내용으로 덮어쓰기는 거부)"""
+        if not TERM_RE.match(term):
+            raise ArchiveError(f"학기 이름은 YYYY-1, YYYY-2, YYYY-S, YYYY-W 형식이어야 합니다: {term}")
+        lines = ''.join(json.dumps(item, ensure_ascii=False, separators=(',', ':'), default=json_default) + '\n' for item in timetable)
+        data = lines.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        existing = self.index["terms"].get(term)
+        if existing:
+            if existing["sha256"] == digest:
+                return existing
+            raise ArchiveError(f"{term}학기는 이미 다른 내용으로 보관되어 있습니다 ({existing['path']}).")
+
+        os.makedirs(self.root, exist_ok=True)
+        name = f"{term}.{digest[:HASH_LENGTH]}.ndjson.gz"
+        tmp_path = os.path.join(self.root, name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            # mtime=0: 같은 내용이면 같은 압축 바이트
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        os.replace(tmp_path, os.path.join(self.root, name))
+
+        summary = summarize(timetable)
+        entry = {
+            "path": name,
+            "sha256": digest,
+            "sessions": len(timetable),
+            "sections": sum(summary["courses"].values()),
+            "bytes": os.path.getsize(os.path.join(self.root, name)),
+            "source": source,
+            "archived": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }
+        self.index["terms"][term] = entry
+        for kind in ("professors", "rooms", "courses"):
+            for key, value in summary[kind].items():
+                self.index[kind].setdefault(key, {})[term] = value
+        self._save_index()
+        return entry
+
+    def iter_term(self, term):
+        """학기 파티션의 세션을 한 줄씩 읽어 yield (파티션 전체를 메모리에 올리지 않음)"""
+        entry = self.index["terms"].get(term)
+        if entry is None:
+            raise ArchiveError(f"보관되지 않은 학기입니다: {term}")
+        with gzip.open(os.path.join(self.root, entry["path"]), 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _select(self, terms_by_key, since=None, until=None):
+        return {
+            term: value for term, value in sorted(terms_by_key.items())
+            if (since is None or term >= since) and (until is None or term <= until)
+        }
+
+    def professor_load(self, name, since=None, until=None):
+        """{학기: [세션 수, 주당 강의 분]} - 인덱스만 사용"""
+        return self._select(self.index["professors"].get(name, {}), since, until)
+
+    def room_usage(self, building, room, since=None, until=None):
+        """{학기: [세션 수, 주당 사용 분]} - 인덱스만 사용"""
+        return self._select(self.index["rooms"].get(room_key(building, room), {}), since, until)
+
+    def course_terms(self, code):
+        """{학기: 분반 수} (학기 순)"""
+        return self._select(self.index["courses"].get(code, {}))
+
+    def last_offered(self, code):
+        terms = self.course_terms(code)
+        return max(terms) if terms else None
+
+    def sessions(self, terms, predicate):
+        """지정한 학기 파티션만 열어 predicate를 만족하는 (학기, 세션) yield"""
+        for term in terms:
+            for item in self.iter_term(term):
+                if predicate(item):
+                    yield term, item
+
+
+def teaches(name):
+    return lambda item: name in [p.strip() for p in (item.get('professor') or '').split(',')]
+
+
+def print_load(title, load, unit):
+    if not load:
+        print(f"🔴 {title}: 보관된 기록이 없습니다.")
+        return
+    print(f"--- {title} ---")
+    for term, (sessions, minutes) in load.items():
+        print(f"  {term}: {sessions}개 세션, 주당 {minutes / 60:.1f}시간 {unit}")
+    total_minutes = sum(minutes for _, minutes in load.values())
+    print(f"  합계: {len(load)}개 학기, 학기 평균 주당 {total_minutes / 60 / len(load):.1f}시간")
+
+
+def print_sessions(rows):
+    for term, item in rows:
+        print(f"  [{term}] {item.get('day')} {item.get('start')}-{item.get('end')} "
+              f"{item.get('subject')} ({item.get('code')}-{item.get('class_number')}) "
+              f"{item.get('building_name')} {item.get('classroom')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학기별 시간표 보관소")
+    parser.add_argument('--root', default=ARCHIVE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    add = sub.add_parser('add', help="timetable.json을 학기 파티션으로 보관")
+    add.add_argument('term')
+    add.add_argument('--timetable', default='timetable.json')
+    sub.add_parser('terms', help="보관된 학기 목록")
+    professor = sub.add_parser('professor', help="교수 학기별 강의량")
+    professor.add_argument('name')
+    room = sub.add_parser('room', help="강의실 학기별 사용량")
+    room.add_argument('building')
+    room.add_argument('room')
+    course = sub.add_parser('course', help="과목코드 개설 학기")
+    course.add_argument('code')
+    for query in (professor, room):
+        query.add_argument('--since', help="시작 학기 (예: 2021-1)")
+        query.add_argument('--until', help="끝 학기")
+    for query in (professor, course):
+        query.add_argument('--detail', action='store_true', help="해당 학기 파티션에서 세션 목록 출력")
+    args = parser.parse_args()
+
+    archive = Archive(args.root)
+    try:
+        if args.command == 'add':
+            with open(args.timetable, 'r', encoding='utf-8') as f:
+                timetable = json.load(f)
+            entry = archive.add(args.term, timetable, args.timetable)
+            print(f"✅ {args.term}학기 보관 완료: {args.root}/{entry['path']} "
+                  f"(세션 {entry['sessions']}개, {entry['bytes'] / 1024:.0f}KB)")
+        elif args.command == 'terms':
+            for term in archive.terms:
+                entry = archive.index["terms"][term]
+                print(f"  {term}: 세션 {entry['sessions']}개, 분반 {entry['sections']}개 ({entry['path']})")
+            print(f"총 {len(archive.terms)}개 학기")
+        elif args.command == 'professor':
+            load = archive.professor_load(args.name, args.since, args.until)
+            print_load(f"{args.name} 교수 학기별 강의량", load, "강의")
+            if args.detail:
+                print_sessions(archive.sessions(load, teaches(args.name)))
+        elif args.command == 'room':
+            load = archive.room_usage(args.building, args.room, args.since, args.until)
+            print_load(f"{args.building} {args.room} 학기별 사용량", load, "사용")
+        elif args.command == 'course':
+            terms = archive.course_terms(args.code)
+            if not terms:
+                print(f"🔴 {args.code}: 보관된 학기에 개설 기록이 없습니다.")
+                return
+            print(f"{args.code} 개설 학기: " + ', '.join(f"{t}({n}개 분반)" for t, n in terms.items()))
+            print(f"마지막 개설: {archive.last_offered(args.code)}")
+            if args.detail:
+                last = archive.last_offered(args.code)
+                print_sessions(archive.sessions([last], lambda item: item.get('code') == args.code))
+    except ArchiveError as e:
+        print(f"🔴 {e}")
+
+
+if __name__ == "__main__":
+    main()
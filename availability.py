@@ -0,0 +1,239 @@
+"""
+강의실/교수 가용 시간 구간 인덱스
+
+timetable.json을 읽어 강의실별, 교수별로 요일마다 "사용 중" 구간을 정렬/병합해 두고,
+그 사이의 빈 구간(gap) 목록도 함께 만들어 둡니다. 질의는 bisect로 처리합니다.
+ - 구간 전체가 비어 있는 강의실          free_rooms()
+ - 강의실/교수가 다음에 비는 시각         next_free()
+ - 하루 중 가장 긴 빈 구간               longest_free_window()
+ - 건물 안에서 N분 이상 비어 있는 강의실  rooms_free_for()
+
+빈 구간은 occupancy.py와 같은 운영 시간(07:00~23:00) 안에서만 계산합니다.
+
+사용법:
+    python3 availability.py free MON 10:00 12:00 --building 우남관
+    python3 availability.py next-free --room 우남관-W106 MON 10:30
+    python3 availability.py longest --professor 홍길동 TUE
+    python3 availability.py window 우남관 WED 90 --after 13:00
+"""
+import argparse
+import json
+from bisect import bisect_right
+from collections import defaultdict
+
+from occupancy import DAY_END_MINUTE, DAY_START_MINUTE, DAYS, room_key
+from time_slots import minutes_to_time, time_to_minutes
+
+
+def merge_intervals(intervals):
+    """겹치거나 맞닿은 구간을 합쳐 시작 시각 순으로 반환"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+class DaySchedule:
+    """한 대상(강의실/교수)의 하루치 사용 구간과 빈 구간"""
+
+    def __init__(self, intervals):
+        self.busy = merge_intervals(intervals)
+        self.starts = [s for s, _ in self.busy]
+        self.ends = [e for _, e in self.busy]
+
+        self.gaps = []
+        cursor = DAY_START_MINUTE
+        for start, end in self.busy:
+            if start > cursor:
+                self.gaps.append((cursor, min(start, DAY_END_MINUTE)))
+            cursor = max(cursor, end)
+        if cursor < DAY_END_MINUTE:
+            self.gaps.append((cursor, DAY_END_MINUTE))
+        self.gaps = [(s, e) for s, e in self.gaps if e > s]
+        self.gap_starts = [s for s, _ in self.gaps]
+        self.longest = max(self.gaps, key=lambda g: g[1] - g[0], default=None)
+
+    def is_free(self, start, end):
+        # start 이전에 시작한 마지막 구간이 start 이후까지 이어지거나, [start, end) 안에서 시작하는 구간이 있으면 사용 중
+        i = bisect_right(self.starts, start)
+        if i and self.ends[i - 1] > start:
+            return False
+        return i >= len(self.starts) or self.starts[i] >= end
+
+    def next_free(self, minute):
+        """minute 이후 처음으로 비는 시각 (병합된 구간이므로 구간 끝은 항상 빈 시각)"""
+        i = bisect_right(self.starts, minute)
+        if i and self.ends[i - 1] > minute:
+            return self.ends[i - 1]
+        return minute
+
+    def first_gap(self, minutes, after=DAY_START_MINUTE):
+        """after 이후 minutes분 이상 이어지는 첫 빈 구간 (시작 시각은 after로 잘라냄)"""
+        i = max(bisect_right(self.gap_starts, after) - 1, 0)
+        for start, end in self.gaps[i:]:
+            start = max(start, after)
+            if end - start >= minutes:
+                return start, end
+        return None
+
+
+EMPTY_DAY = DaySchedule([])
+
+
+class AvailabilityIndex:
+    def __init__(self, rooms, professors):
+        self.rooms = rooms              # {room_key: {day: DaySchedule}}
+        self.professors = professors    # {이름: {day: DaySchedule}}
+        self.buildings = defaultdict(list)
+        for key in rooms:
+            self.buildings[key.split('-', 1)[0]].append(key)
+
+    @classmethod
+    def build(cls, timetable):
+        room_intervals = defaultdict(lambda: defaultdict(list))
+        professor_intervals = defaultdict(lambda: defaultdict(list))
+
+        for item in timetable:
+            targets = []
+            building = (item.get('building_name') or '').strip()
+            room = (item.get('classroom') or '').strip()
+            if building and room:
+                targets.append(room_intervals[room_key(building, room)])
+            professor = (item.get('professor') or '').strip()
+            if professor and not professor.isdigit():
+                # 온라인 강의만 있는 교수도 "하루 종일 비어 있음"으로 조회되도록 먼저 등록
+                targets.extend(professor_intervals[name.strip()] for name in professor.split(',') if name.strip())
+
+            day = item.get('day')
+            if day not in DAYS or not item.get('start') or not item.get('end'):
+                continue
+            interval = (time_to_minutes(item['start']), time_to_minutes(item['end']))
+            for days in targets:
+                days[day].append(interval)
+
+        def freeze(grouped):
+            return {
+                key: {day: DaySchedule(intervals) for day, intervals in days.items()}
+                for key, days in grouped.items()
+            }
+
+        return cls(freeze(room_intervals), freeze(professor_intervals))
+
+    @classmethod
+    def load(cls, path='timetable.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.build(json.load(f))
+
+    def _schedule(self, table, key, day):
+        if key not in table:
+            raise KeyError(key)
+        return table[key].get(day, EMPTY_DAY)
+
+    def room_schedule(self, key, day):
+        return self._schedule(self.rooms, key, day)
+
+    def professor_schedule(self, name, day):
+        return self._schedule(self.professors, name, day)
+
+    def free_rooms(self, day, start, end, building=None):
+        """day의 start~end 동안 비어 있는 강의실 키 목록 (end <= start면 ValueError)"""
+        start, end = time_to_minutes(start), time_to_minutes(end)
+        if end <= start:
+            raise ValueError("끝 시각은 시작 시각보다 늦어야 합니다.")
+        keys = self.buildings.get(building, []) if building else self.rooms
+        return sorted(
+            key for key in keys
+            if self.rooms[key].get(day, EMPTY_DAY).is_free(start, end)
+        )
+
+    def next_free(self, schedule, time):
+        return minutes_to_time(schedule.next_free(time_to_minutes(time)))
+
+    def longest_free_window(self, schedule):
+        if schedule.longest is None:
+            return None
+        return tuple(minutes_to_time(m) for m in schedule.longest)
+
+    def rooms_free_for(self, building, day, minutes, after=None):
+        """building에서 after 이후 minutes분 이상 연속으로 비는 강의실 -> [(키, 시작, 끝)] (빨리 비는 순)"""
+        after = time_to_minutes(after) if after else DAY_START_MINUTE
+        results = []
+        for key in self.buildings.get(building, []):
+            gap = self.rooms[key].get(day, EMPTY_DAY).first_gap(minutes, after)
+            if gap:
+                results.append((key, minutes_to_time(gap[0]), minutes_to_time(gap[1])))
+        return sorted(results, key=lambda r: (r[1], r[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의실/교수 가용 시간 조회")
+    parser.add_argument('--timetable', default='timetable.json')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    free = sub.add_parser('free', help="구간 전체가 비어 있는 강의실")
+    free.add_argument('day', choices=DAYS)
+    free.add_argument('start', help="HH:MM")
+    free.add_argument('end', help="HH:MM")
+    free.add_argument('--building', help="건물명으로 제한")
+
+    for name, help_text in (('next-free', "다음에 비는 시각"), ('longest', "가장 긴 빈 구간")):
+        command = sub.add_parser(name, help=help_text)
+        target = command.add_mutually_exclusive_group(required=True)
+        target.add_argument('--room', help="건물-호실 (예: 우남관-W105)")
+        target.add_argument('--professor', help="교수 이름")
+        command.add_argument('day', choices=DAYS)
+        if name == 'next-free':
+            command.add_argument('time', help="HH:MM")
+
+    window = sub.add_parser('window', help="N분 이상 비어 있는 강의실")
+    window.add_argument('building')
+    window.add_argument('day', choices=DAYS)
+    window.add_argument('minutes', type=int)
+    window.add_argument('--after', help="HH:MM 이후만")
+    args = parser.parse_args()
+
+    index = AvailabilityIndex.load(args.timetable)
+
+    if args.command == 'free':
+        try:
+            rooms = index.free_rooms(args.day, args.start, args.end, args.building)
+        except ValueError as e:
+            print(f"🔴 {e}")
+            return
+        print(f"{args.day} {args.start}-{args.end} 빈 강의실: {len(rooms)}개")
+        for key in rooms:
+            print(f"  {key}")
+        return
+
+    if args.command == 'window':
+        rooms = index.rooms_free_for(args.building, args.day, args.minutes, args.after)
+        print(f"{args.building} {args.day} {args.minutes}분 이상 빈 강의실: {len(rooms)}개")
+        for key, start, end in rooms:
+            print(f"  {key}: {start}~{end}")
+        return
+
+    target = args.room or args.professor
+    try:
+        if args.room:
+            schedule = index.room_schedule(args.room, args.day)
+        else:
+            schedule = index.professor_schedule(args.professor, args.day)
+    except KeyError:
+        print(f"🔴 '{target}'을(를) 시간표에서 찾을 수 없습니다.")
+        return
+
+    if args.command == 'next-free':
+        print(f"{target} {args.day}: {index.next_free(schedule, args.time)}부터 비어 있음")
+    else:
+        window = index.longest_free_window(schedule)
+        if window:
+            print(f"{target} {args.day} 가장 긴 빈 시간: {window[0]}~{window[1]}")
+        else:
+            print(f"{target} {args.day}: 빈 시간 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+데이터 파이프라인 벤치마크
+
+실제 `개설강좌 리스트.json`과 이를 N배로 불린 입력(기본 1x, 10x, 100x, 1000x)에 대해
+각 단계의 실행 시간, 초당 처리 레코드 수, 최대 메모리(tracemalloc peak)를 측정하고
+커밋 간에 비교할 수 있도록 JSON 리포트로 저장합니다.
+
+측정 단계:
+    converter.convert_timetable_data            (원본 읽기 + 변환 + timetable.json 쓰기)
+    converter.write_derived_outputs             (columnar / 요일별 샤드 / 검색 색인 쓰기)
+    convert_school_to_webapp.parse_time_slot   (원본의 강의실/강의시간 문자열 전체)
+    convert_school_to_webapp.main
+    normalize_timetable.normalize_record        (원본 레코드 전체)
+    create_lookups.create_lookup_files
+    verify_times.verify_timetable_times
+
+각 스크립트는 현재 디렉터리 기준 고정 파일명을 쓰므로, 배율마다 임시 작업 디렉터리에
+입력을 만들고 그 안에서 실행합니다 (저장소의 파일은 건드리지 않음).
+N배 입력은 원본 레코드를 N번 반복하되 2번째 복사본부터 과목코드에 '-<번호>'를 붙여 분반이 겹치지 않게 합니다.
+--synthetic을 주면 대신 synthetic_export.py 생성기로 같은 규모의 입력을 만듭니다 (강의실/교수 수는 분반 수에 비례).
+
+사용법:
+    python3 benchmark.py                          # benchmark_report.json
+    python3 benchmark.py --scales 1 10 --repeat 3
+    python3 benchmark.py --compare old_report.json
+    python3 benchmark.py --scales 1000 --no-memory   # tracemalloc 측정은 실행을 수 배 느리게 함
+    python3 benchmark.py --synthetic --seed 7
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import convert_school_to_webapp
+import converter
+import create_lookups
+import normalize_timetable
+import verify_times
+from session import load_sessions
+from streaming import JSONArrayWriter, iter_json_array
+from synthetic_export import write_export
+from time_slots import clear_cache
+
+SOURCE_FILE = '개설강좌 리스트.json'
+REPORT_FILE = 'benchmark_report.json'
+DEFAULT_SCALES = [1, 10, 100, 1000]
+# 2: converter.convert_timetable_data에서 파생 출력 쓰기를 converter.write_derived_outputs로 분리
+FORMAT_VERSION = 2
+CONVERTER_STAGE = 'converter.convert_timetable_data'
+DERIVED_STAGE = 'converter.write_derived_outputs'
+
+
+def load_source(path=SOURCE_FILE):
+    """(헤더 행 또는 None, 데이터 레코드 목록)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    if records and converter.is_header_row(records[0]):
+        return records[0], records[1:]
+    return None, records
+
+
+def write_scaled_source(header, records, scale, path):
+    """원본 레코드를 scale번 반복한 입력 파일 (반복할 때마다 과목코드를 바꿔 분반이 겹치지 않게 함)"""
+    with JSONArrayWriter(path) as writer:
+        if header is not None:
+            writer.write(header)
+        for copy in range(scale):
+            for record in records:
+                if copy:
+                    record = dict(record, 과목코드=f"{record.get('과목코드', '')}-{copy}")
+                writer.write(record)
+    return writer.count - (header is not None)
+
+
+def write_synthetic_source(records, scale, seed, path):
+    """원본과 같은 분반 수 x scale의 합성 입력 (강의실/교수 수는 생성기 기본값 - 분반 수에 비례)"""
+    sections = len(records) * scale
+    write_export(path, sections=sections, seed=seed)
+    return sections
+
+
+def run_parse_time_slot(work):
+    for time_str in work['slot_strings']:
+        convert_school_to_webapp.parse_time_slot(time_str)
+    return len(work['slot_strings'])
+
+
+def run_normalize_record(work):
+    with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    for record in records:
+        normalize_timetable.normalize_record(record)
+    return len(records)
+
+
+def run_convert_school_main(work):
+    argv = sys.argv
+    sys.argv = ['convert_school_to_webapp.py']
+    try:
+        convert_school_to_webapp.main()
+    finally:
+        sys.argv = argv
+    return work['records']
+
+
+def run_converter(work):
+    converter.convert_timetable_data(SOURCE_FILE, derived=False)
+    return work['records']
+
+
+def run_derived_outputs(work):
+    converter.write_derived_outputs(work['converted'])
+    return len(work['converted'])
+
+
+def run_create_lookups(work):
+    create_lookups.create_lookup_files()
+    with open('timetable.json', 'r', encoding='utf-8') as f:
+        return len(json.load(f))
+
+
+def run_verify_times(work):
+    verify_times.verify_timetable_times()
+    return work['records']
+
+
+# (이름, 실행 함수) - 순서대로 실행 (create_lookups / verify_times는 converter 출력을 사용)
+STAGES = [
+    (CONVERTER_STAGE, run_converter),
+    (DERIVED_STAGE, run_derived_outputs),
+    ('convert_school_to_webapp.parse_time_slot', run_parse_time_slot),
+    ('convert_school_to_webapp.main', run_convert_school_main),
+    ('normalize_timetable.normalize_record', run_normalize_record),
+    ('create_lookups.create_lookup_files', run_create_lookups),
+    ('verify_times.verify_timetable_times', run_verify_times),
+]
+
+
+def run_stage(func, work):
+    """(처리 레코드 수, 소요 시간) - 스크립트 출력은 숨김, 슬롯 파서 캐시는 매번 비움"""
+    clear_cache()
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        count = func(work)
+        elapsed = time.perf_counter() - started
+    return count, elapsed
+
+
+def measure_stage(func, work, repeat, memory):
+    count, best = run_stage(func, work)
+    for _ in range(repeat - 1):
+        best = min(best, run_stage(func, work)[1])
+    result = {
+        "records": count,
+        "seconds": round(best, 4),
+        "records_per_sec": round(count / best, 1) if best else None,
+    }
+    if memory:
+        # tracemalloc은 실행을 느리게 하므로 시간 측정과 별도로 한 번 더 실행
+        tracemalloc.start()
+        try:
+            run_stage(func, work)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def benchmark_scale(header, records, scale, stages, repeat, memory, workdir=None, seed=None):
+    """seed가 None이면 원본 반복 입력, 아니면 해당 시드의 합성 입력"""
+    work_dir = tempfile.mkdtemp(prefix=f'bench-{scale}x-', dir=workdir)
+    cwd = os.getcwd()
+    try:
+        os.chdir(work_dir)
+        if seed is None:
+            count = write_scaled_source(header, records, scale, SOURCE_FILE)
+            slot_strings = [r.get('강의실/강의시간', '') for r in records] * scale
+        else:
+            count = write_synthetic_source(records, scale, seed, SOURCE_FILE)
+            slot_strings = [r.get('강의실/강의시간', '') for r in iter_json_array(SOURCE_FILE) if '과목코드' in r]
+        work = {"records": count, "slot_strings": slot_strings}
+        names = dict(stages)
+        if CONVERTER_STAGE not in names or DERIVED_STAGE in names:
+            # 뒤 단계가 읽을 timetable.json 준비 (측정하지 않음)
+            run_stage(run_converter, work)
+        if DERIVED_STAGE in names:
+            work['converted'] = load_sessions('timetable.json')
+        result = {"scale": scale, "records": count, "input_bytes": os.path.getsize(SOURCE_FILE), "stages": {}}
+        for name, func in stages:
+            stats = measure_stage(func, work, repeat, memory)
+            result["stages"][name] = stats
+            print_stage(name, stats)
+        return result
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def print_stage(name, stats):
+    line = f"  {name:<42} {stats['seconds']:>9.3f}s  {stats['records_per_sec'] or 0:>12,.0f} rec/s"
+    if "peak_memory_bytes" in stats:
+        line += f"  peak {stats['peak_memory_bytes'] / 1024 / 1024:>8.1f}MB"
+    print(line)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(old, new):
+    """두 리포트에서 같은 배율/단계의 시간 비교 출력"""
+    old_results = {r["scale"]: r["stages"] for r in old["results"]}
+    print(f"\n--- {old.get('commit')} 대비 {new.get('commit')} ---")
+    if old.get("version") != new.get("version"):
+        print(f"⚠️  리포트 형식이 다릅니다 (v{old.get('version')} -> v{new.get('version')}): "
+              f"v1의 {CONVERTER_STAGE}에는 파생 출력 쓰기가 포함되어 있습니다.")
+    for result in new["results"]:
+        before = old_results.get(result["scale"])
+        if not before:
+            continue
+        print(f"[{result['scale']}x]")
+        for name, stats in result["stages"].items():
+            if name not in before:
+                continue
+            old_seconds, seconds = before[name]["seconds"], stats["seconds"]
+            change = (seconds - old_seconds) / old_seconds if old_seconds else 0.0
+            mark = '🔴' if change > 0.1 else ('✅' if change < -0.1 else '  ')
+            print(f"  {mark} {name:<42} {old_seconds:>9.3f}s -> {seconds:>9.3f}s ({change:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 파이프라인 벤치마크")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, help="입력 배율 목록")
+    parser.add_argument('--stages', nargs='+', choices=[name for name, _ in STAGES], help="측정할 단계 (기본: 전체)")
+    parser.add_argument('--repeat', type=int, default=1, help="단계별 반복 횟수 (가장 빠른 값 기록)")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument('--source', default=SOURCE_FILE)
+    parser.add_argument('--output', default=REPORT_FILE)
+    parser.add_argument('--workdir', help="임시 작업 디렉터리 위치 (기본: 시스템 임시 디렉터리)")
+    parser.add_argument('--compare', help="비교할 이전 리포트 JSON")
+    parser.add_argument('--synthetic', action='store_true', help="원본 반복 대신 합성 생성기 입력 사용")
+    parser.add_argument('--seed', type=int, default=0, help="--synthetic 시드")
+    args = parser.parse_args()
+
+    stages = [(name, func) for name, func in STAGES if not args.stages or name in args.stages]
+    header, records = load_source(args.source)
+    report = {
+        "version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "source": {"file": args.source, "records": len(records), "bytes": os.path.getsize(args.source)},
+        "input": f"synthetic(seed={args.seed})" if args.synthetic else "replicated",
+        "repeat": args.repeat,
+        "results": [],
+    }
+
+    for scale in args.scales:
+        print(f"📊 {scale}x ({len(records) * scale:,}개 레코드)")
+        report["results"].append(
+            benchmark_scale(header, records, scale, stages, args.repeat, not args.no_memory, args.workdir,
+                            args.seed if args.synthetic else None)
+        )
+        # 배율마다 저장: 큰 배율에서 중단해도 앞의 결과는 남음
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ {args.output} 저장 완료")
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_reports(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
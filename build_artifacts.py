@@ -0,0 +1,132 @@
+"""
+정적 데이터 파일 배포용 빌드 (콘텐츠 해시 파일명 + 사전 압축 + manifest)
+
+timetable.json 등 앱이 받는 JSON 파일을 dist/ 아래에 내용 해시가 들어간 이름으로 복사하고,
+.gz / .br(brotli 모듈이 있을 때만) 압축본을 함께 만듭니다.
+dist/manifest.json이 논리 이름 -> 해시 파일 경로(manifest 기준 상대 경로)를 알려 주므로,
+script.js와 sw.js는 내용이 바뀐 파일만 새로 받고 나머지는 브라우저/CDN 캐시를 그대로 씁니다.
+
+    dist/manifest.json
+    dist/timetable.columnar.3f9a0c1d2e4b.json (+ .gz, .br)
+    ...
+
+사용법: python3 build_artifacts.py [--out dist]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 12
+FORMAT_VERSION = 1
+
+# 앱(script.js)이 받아 가는 데이터 파일
+ARTIFACTS = [
+    'timetable.columnar.json',
+    'timetable.json',
+    'professors.json',
+    'classrooms.json',
+    'room_occupancy.json',
+    'shards/index.json',
+    'search_index.json',
+]
+
+
+def hashed_name(name, digest):
+    # 하위 디렉터리 파일은 dist/ 바로 아래로 평탄화 (shards/index.json -> shards-index.<해시>.json)
+    stem, ext = os.path.splitext(name.replace('/', '-'))
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def write_bytes(path, data):
+    """내용이 같으면 다시 쓰지 않음 (mtime 유지 -> rsync/CDN 업로드 최소화)"""
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_artifact(name, out_dir):
+    with open(name, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    target = hashed_name(name, digest)
+
+    # path는 manifest.json 위치 기준 상대 경로
+    entry = {"path": target, "sha256": digest, "bytes": len(data)}
+    files = {target: data}
+
+    # mtime=0: 같은 입력이면 같은 .gz 바이트
+    files[target + '.gz'] = gzip.compress(data, compresslevel=9, mtime=0)
+    entry["gzip_bytes"] = len(files[target + '.gz'])
+    if brotli is not None:
+        files[target + '.br'] = brotli.compress(data, quality=11)
+        entry["br_bytes"] = len(files[target + '.br'])
+
+    written = sum(write_bytes(os.path.join(out_dir, fname), payload) for fname, payload in files.items())
+    return entry, set(files), written
+
+
+def build_artifacts(out_dir=DIST_DIR, names=ARTIFACTS):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {"version": FORMAT_VERSION, "files": {}}
+    keep = {MANIFEST_NAME}
+    written = 0
+
+    for name in names:
+        if not os.path.exists(name):
+            print(f"  ⚠️ {name} 없음 - 건너뜀")
+            continue
+        entry, files, count = build_artifact(name, out_dir)
+        manifest["files"][name] = entry
+        keep |= files
+        written += count
+
+    # 빌드 식별자: 포함된 파일 해시 전체의 해시 (서비스 워커 캐시 정리에 사용)
+    manifest["build"] = hashlib.sha256(
+        ''.join(entry["sha256"] for entry in manifest["files"].values()).encode('ascii')
+    ).hexdigest()[:HASH_LENGTH]
+    manifest_bytes = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    write_bytes(os.path.join(out_dir, MANIFEST_NAME), manifest_bytes)
+
+    # 더 이상 manifest에 없는 이전 빌드 파일 정리
+    removed = 0
+    for fname in os.listdir(out_dir):
+        if fname not in keep:
+            os.remove(os.path.join(out_dir, fname))
+            removed += 1
+
+    print(f"✅ {out_dir}/{MANIFEST_NAME} 생성 완료 (build {manifest['build']})")
+    for name, entry in manifest["files"].items():
+        sizes = f"{entry['bytes'] / 1024:.0f}KB, gzip {entry['gzip_bytes'] / 1024:.0f}KB"
+        if "br_bytes" in entry:
+            sizes += f", br {entry['br_bytes'] / 1024:.0f}KB"
+        print(f"  {name} -> {out_dir}/{entry['path']} ({sizes})")
+    if brotli is None:
+        print("  ℹ️ brotli 모듈이 없어 .br 파일은 만들지 않았습니다 (pip install brotli)")
+    print(f"  새로 쓴 파일 {written}개, 정리한 이전 파일 {removed}개")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 데이터 파일 해시 빌드")
+    parser.add_argument('--out', default=DIST_DIR, help="출력 디렉터리")
+    args = parser.parse_args()
+    build_artifacts(args.out)
+
+
+if __name__ == "__main__":
+    main()
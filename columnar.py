@@ -0,0 +1,212 @@
+"""
+timetable.json 컬럼형(columnar) 압축 포맷
+
+행마다 키와 긴 한글 문자열(교수, 건물, 과목명, 학과)이 반복되는 timetable.json 대신,
+필드별 컬럼 배열과 문자열 사전(dictionary)으로 저장해 앱 첫 로딩의 다운로드/파싱 양을 줄입니다.
+ - 문자열 필드: 필드별 사전 + 정수 인덱스 배열
+ - day: DAY_CODES 인덱스 (0 = ONLINE)
+ - start/end: 자정 기준 분 (값이 없으면 -1)
+ - 정수 필드(student_count): 그대로
+
+script.js의 decodeColumnarTimetable()이 같은 규칙으로 원래 레코드 배열을 복원합니다.
+ColumnarSpillEncoder는 같은 출력을 인코딩한 행을 임시 파일에 흘려 두었다가 컬럼별로 다시 읽어 쓰므로,
+메모리에는 문자열 사전만 남습니다 (converter.py --stream).
+"""
+import json
+import tempfile
+from itertools import islice
+
+from time_slots import minutes_to_time, time_to_minutes
+
+COLUMNAR_OUTPUT_FILE = 'timetable.columnar.json'
+FORMAT_VERSION = 1
+
+DAY_CODES = ['ONLINE', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN', '']
+TIME_FIELDS = ('start', 'end')
+INT_FIELDS = ('student_count',)
+WRITE_CHUNK = 4096
+
+
+class ColumnarEncoder:
+    """레코드를 하나씩 add()로 받아 컬럼형 dict로 인코딩 (스트리밍 변환에서도 사용)"""
+
+    def __init__(self):
+        self.fields = []
+        self.columns = {}
+        self.strings = {}
+        self._lookup = {}
+        self._known = set()
+        self.count = 0
+
+    def _register_field(self, field):
+        """필드 추가 -> 앞선 레코드에 없던 필드를 채울 누락 값"""
+        self.fields.append(field)
+        if field == 'day':
+            return DAY_CODES.index('')
+        if field in TIME_FIELDS:
+            return -1
+        if field in INT_FIELDS:
+            return 0
+        self.strings[field] = ['']
+        self._lookup[field] = {'': 0}
+        return 0
+
+    def _add_field(self, field):
+        self.columns[field] = [self._register_field(field)] * self.count
+
+    def _encode_string(self, field, value):
+        lookup = self._lookup[field]
+        index = lookup.get(value)
+        if index is None:
+            index = lookup[value] = len(self.strings[field])
+            self.strings[field].append(value)
+        return index
+
+    def _encode(self, record):
+        """레코드 -> self.fields 순서의 인코딩 값 목록 (처음 보는 필드는 먼저 등록)"""
+        for field in record:
+            if field not in self._known:
+                self._known.add(field)
+                self._add_field(field)
+
+        row = []
+        for field in self.fields:
+            value = record.get(field)
+            if field == 'day':
+                encoded = DAY_CODES.index(value or '')
+            elif field in TIME_FIELDS:
+                encoded = time_to_minutes(value) if value else -1
+            elif field in INT_FIELDS:
+                encoded = value or 0
+            else:
+                encoded = self._encode_string(field, value or '')
+            row.append(encoded)
+        return row
+
+    def add(self, record):
+        for field, encoded in zip(self.fields, self._encode(record)):
+            self.columns[field].append(encoded)
+        self.count += 1
+
+    def to_dict(self):
+        return {
+            "version": FORMAT_VERSION,
+            "count": self.count,
+            "fields": self.fields,
+            "days": DAY_CODES,
+            "strings": self.strings,
+            "columns": self.columns
+        }
+
+
+class ColumnarSpillEncoder(ColumnarEncoder):
+    """
+    ColumnarEncoder와 바이트 단위로 같은 출력을 쓰되, 인코딩한 행은 임시 파일에 한 줄씩 흘려 둠
+    메모리는 세션 수가 아니라 문자열 사전(서로 다른 값의 수)에 비례합니다.
+    extra: 컬럼 뒤에 붙는 정수 배열 키 (예: shards.py의 "rows") - add(record, *값)으로 함께 받음
+    """
+
+    def __init__(self, extra=()):
+        super().__init__()
+        self.extra = tuple(extra)
+        self.fills = []
+        # 한 줄 = extra 값들 + 그때까지 등록된 필드 값들 (나중에 생긴 필드는 앞 줄에 없음 -> 누락 값)
+        self._spill = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def _add_field(self, field):
+        self.fills.append(self._register_field(field))
+
+    def add(self, record, *extra):
+        row = list(extra) + self._encode(record)
+        self._spill.write(','.join(map(str, row)))
+        self._spill.write('\n')
+        self.count += 1
+
+    def _column(self, position, fill):
+        self._spill.seek(0)
+        for line in self._spill:
+            values = line.rstrip('\n').split(',')
+            yield values[position] if position < len(values) else fill
+
+    def _write_array(self, f, values):
+        f.write('[')
+        first = True
+        while True:
+            chunk = list(islice(values, WRITE_CHUNK))
+            if not chunk:
+                break
+            f.write(('' if first else ',') + ','.join(chunk))
+            first = False
+        f.write(']')
+
+    def write(self, f):
+        """json.dump(to_dict() [+ extra], f, ensure_ascii=False, separators=(',', ':'))와 같은 내용을 씀"""
+        def dumps(value):
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+        header = {"version": FORMAT_VERSION, "count": self.count, "fields": self.fields,
+                  "days": DAY_CODES, "strings": self.strings}
+        f.write(dumps(header)[:-1] + ',"columns":{')
+        offset = len(self.extra)
+        for i, (field, fill) in enumerate(zip(self.fields, self.fills)):
+            f.write(('' if i == 0 else ',') + dumps(field) + ':')
+            self._write_array(f, self._column(offset + i, str(fill)))
+        f.write('}')
+        for i, name in enumerate(self.extra):
+            f.write(',' + dumps(name) + ':')
+            self._write_array(f, self._column(i, '0'))
+        f.write('}')
+
+    def close(self):
+        self._spill.close()
+
+
+def encode_columnar(records):
+    encoder = ColumnarEncoder()
+    for record in records:
+        encoder.add(record)
+    return encoder.to_dict()
+
+
+def decode_columnar(payload):
+    """컬럼형 dict -> 원래 레코드 리스트 (검증/파이썬 측 사용)"""
+    fields = payload["fields"]
+    columns = payload["columns"]
+    strings = payload["strings"]
+    days = payload["days"]
+
+    records = []
+    for i in range(payload["count"]):
+        record = {}
+        for field in fields:
+            value = columns[field][i]
+            if field == 'day':
+                record[field] = days[value]
+            elif field in TIME_FIELDS:
+                record[field] = minutes_to_time(value)
+            elif field in INT_FIELDS:
+                record[field] = value
+            else:
+                record[field] = strings[field][value]
+        records.append(record)
+    return records
+
+
+def write_columnar(payload, path=COLUMNAR_OUTPUT_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+
+if __name__ == "__main__":
+    # timetable.json -> timetable.columnar.json 단독 변환 + 왕복 검증
+    with open('timetable.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    payload = encode_columnar(data)
+    write_columnar(payload)
+
+    original_size = len(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+    compact_size = len(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    print(f"✅ {COLUMNAR_OUTPUT_FILE} 생성 완료 ({payload['count']}개 레코드)")
+    print(f"  크기: {original_size / 1024:.0f}KB -> {compact_size / 1024:.0f}KB ({compact_size / original_size:.1%})")
+    print(f"  왕복 검증: {'통과' if decode_columnar(payload) == data else '실패'}")
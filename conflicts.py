@@ -0,0 +1,229 @@
+"""
+강의실 중복 배정 / 교수 시간 겹침 검사 (sweep line)
+
+같은 강의실을 같은 시간에 쓰는 두 분반, 같은 시간에 두 곳에서 수업하는 교수는
+앱의 "사용 중 / 빈 강의실" 집계를 틀리게 만듭니다.
+강의실별, 교수별로 요일마다 세션을 시작 시각 순으로 정렬한 뒤 (O(n log n)),
+종료 시각 최소 힙으로 진행 중인 세션만 유지하며 겹치는 쌍을 찾습니다 (O(n log n + 겹침 수)).
+같은 분반(과목코드 + 분반)끼리의 겹침은 세지 않고,
+강의실은 같은 과목의 다른 분반끼리 함께 쓰는 경우(합반)도 세지 않습니다.
+
+converter.py가 변환 직후 기본으로 실행하며, 겹침이 기준(THRESHOLDS)을 넘으면 빌드를 실패시킵니다.
+교수 기준이 0이 아닌 이유: 동명이인, 같은 시간에 여러 분반을 함께 지도하는 과목이 실제 데이터에 있음
+
+--stream(converter.py --stream의 기본 검사)은 timetable.json을 한 항목씩 읽어 (종류, 키, 요일) 줄로
+외부 정렬한 뒤 그룹 하나씩만 메모리에 올립니다 (결과는 같음).
+메모리는 정렬 조각(streaming.SORT_CHUNK_LINES 줄)과 가장 큰 (강의실/교수, 요일) 그룹 크기로 정해집니다.
+
+사용법:
+    python3 conflicts.py [--max-room 0] [--max-professor 50] [--report conflicts_report.json] [--stream]
+"""
+import argparse
+import heapq
+import json
+import sys
+from collections import defaultdict
+from itertools import groupby
+
+from occupancy import room_key
+from session import load_sessions
+from streaming import SORT_CHUNK_LINES, external_sort, iter_json_array
+from time_slots import minutes_to_time, time_to_minutes
+
+TIMETABLE_FILE = 'timetable.json'
+REPORT_FILE = 'conflicts_report.json'
+# 종류별 허용 겹침 쌍 수 (넘으면 실패)
+THRESHOLDS = {'room': 0, 'professor': 50}
+SECTION_FIELDS = ('code', 'class_number', 'subject', 'professor', 'building_name', 'classroom', 'start', 'end')
+
+
+def same_section(a, b):
+    return a.get('code') == b.get('code') and a.get('class_number') == b.get('class_number')
+
+
+def combined_class(a, b):
+    return a.get('code') == b.get('code')
+
+
+# 종류별로 겹침으로 세지 않는 쌍
+IGNORE = {'room': combined_class, 'professor': same_section}
+
+
+def iter_sessions(timetable):
+    """(번호, 항목, 요일, 시작 분, 종료 분) - 요일과 시간이 있는 오프라인 세션만"""
+    for i, item in enumerate(timetable):
+        day = item.get('day')
+        if not day or day == 'ONLINE' or not item.get('start') or not item.get('end'):
+            continue
+        try:
+            start, end = time_to_minutes(item['start']), time_to_minutes(item['end'])
+        except ValueError:
+            continue
+        if end > start:
+            yield i, item, day, start, end
+
+
+def sweep(intervals):
+    """
+    [(시작, 종료, 번호)]에서 겹치는 (번호, 번호, 겹침 시작, 겹침 끝) 쌍
+    종료 시각 최소 힙에는 현재 진행 중인 세션만 남음
+    """
+    active = []
+    for start, end, i in sorted(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for other_end, j in active:
+            yield j, i, start, min(end, other_end)
+        heapq.heappush(active, (end, i))
+
+
+def group_sessions(timetable):
+    """(강의실 그룹, 교수 그룹) - 각각 (키, 요일) -> [(시작, 종료, 번호)]"""
+    rooms = defaultdict(list)
+    professors = defaultdict(list)
+    for i, item, day, start, end in iter_sessions(timetable):
+        building = (item.get('building_name') or '').strip()
+        room = (item.get('classroom') or '').strip()
+        if building and room:
+            rooms[(room_key(building, room), day)].append((start, end, i))
+        for name in (item.get('professor') or '').split(','):
+            name = name.strip()
+            if name:
+                professors[(name, day)].append((start, end, i))
+    return rooms, professors
+
+
+def conflict_entry(key, day, start, end, a, b):
+    return {
+        "key": key,
+        "day": day,
+        "start": minutes_to_time(start),
+        "end": minutes_to_time(end),
+        "sections": [{field: item.get(field) for field in SECTION_FIELDS} for item in (a, b)],
+    }
+
+
+def sort_report(report):
+    for conflicts in report.values():
+        conflicts.sort(key=lambda c: (c["key"], c["day"], c["start"]))
+    return report
+
+
+def find_conflicts(timetable):
+    """{'room': [...], 'professor': [...]} - 겹침 하나 = 키, 요일, 겹치는 구간, 두 분반"""
+    report = {}
+    for kind, groups in zip(('room', 'professor'), group_sessions(timetable)):
+        conflicts = []
+        for (key, day), intervals in groups.items():
+            if len(intervals) < 2:
+                continue
+            for i, j, start, end in sweep(intervals):
+                a, b = timetable[i], timetable[j]
+                if IGNORE[kind](a, b):
+                    continue
+                conflicts.append(conflict_entry(key, day, start, end, a, b))
+        report[kind] = conflicts
+    return sort_report(report)
+
+
+def group_lines(timetable):
+    """
+    외부 정렬용 줄: 종류<TAB>키<TAB>요일<TAB>시작<TAB>종료<TAB>번호<TAB>분반 JSON
+    키와 분반은 JSON이라 탭/개행이 없고, 숫자는 자릿수를 맞춰 문자열 정렬 = (시작, 종료, 번호) 정렬
+    """
+    for i, item, day, start, end in iter_sessions(timetable):
+        tail = (f"{day}\t{start:04d}\t{end:04d}\t{i:09d}\t"
+                + json.dumps({field: item.get(field) for field in SECTION_FIELDS}, ensure_ascii=False))
+        building = (item.get('building_name') or '').strip()
+        room = (item.get('classroom') or '').strip()
+        if building and room:
+            yield f"room\t{json.dumps(room_key(building, room), ensure_ascii=False)}\t{tail}"
+        for name in (item.get('professor') or '').split(','):
+            name = name.strip()
+            if name:
+                yield f"professor\t{json.dumps(name, ensure_ascii=False)}\t{tail}"
+
+
+def find_conflicts_stream(timetable, chunk_lines=SORT_CHUNK_LINES):
+    """
+    find_conflicts와 같은 결과 - timetable은 한 번만 훑는 이터러블이어도 됨 (iter_json_array)
+    (종류, 키, 요일) 그룹 하나의 세션만 메모리에 올림
+    """
+    report = {'room': [], 'professor': []}
+    rows = (line.split('\t', 6) for line in external_sort(group_lines(timetable), chunk_lines))
+    for (kind, key, day), group in groupby(rows, key=lambda row: tuple(row[:3])):
+        intervals = []
+        sections = {}
+        for _, _, _, start, end, i, section in group:
+            intervals.append((int(start), int(end), int(i)))
+            sections[int(i)] = section
+        if len(intervals) < 2:
+            continue
+        key = json.loads(key)
+        for i, j, start, end in sweep(intervals):
+            a, b = json.loads(sections[i]), json.loads(sections[j])
+            if IGNORE[kind](a, b):
+                continue
+            report[kind].append(conflict_entry(key, day, start, end, a, b))
+    return sort_report(report)
+
+
+def check_thresholds(report, thresholds=THRESHOLDS):
+    """기준을 넘은 종류 목록 [(종류, 겹침 수, 기준)]"""
+    return [
+        (kind, len(report[kind]), limit)
+        for kind, limit in thresholds.items()
+        if limit is not None and len(report[kind]) > limit
+    ]
+
+
+def describe(conflict):
+    a, b = conflict["sections"]
+    return (f"{conflict['key']} {conflict['day']} {conflict['start']}-{conflict['end']}: "
+            f"{a['subject']}({a['code']}-{a['class_number']}) <-> {b['subject']}({b['code']}-{b['class_number']})")
+
+
+def print_report(report, limit=10):
+    labels = {'room': "강의실 중복 배정", 'professor': "교수 시간 겹침"}
+    for kind, conflicts in report.items():
+        if not conflicts:
+            print(f"✅ {labels[kind]} 없음")
+            continue
+        print(f"⚠️ {labels[kind]}: {len(conflicts)}건")
+        for conflict in conflicts[:limit]:
+            print(f"  - {describe(conflict)}")
+        if len(conflicts) > limit:
+            print(f"  ... 외 {len(conflicts) - limit}건")
+
+
+def run_check(timetable, thresholds=THRESHOLDS, report_path=None, limit=10, stream=False):
+    """검사 + 출력 (+ 리포트 저장) -> 통과 여부 (stream이면 find_conflicts_stream)"""
+    report = find_conflicts_stream(timetable) if stream else find_conflicts(timetable)
+    print_report(report, limit)
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    failed = check_thresholds(report, thresholds)
+    for kind, count, allowed in failed:
+        print(f"🔴 {kind} 겹침 {count}건이 허용 기준 {allowed}건을 넘었습니다.")
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의실 중복 배정 / 교수 시간 겹침 검사")
+    parser.add_argument('--timetable', default=TIMETABLE_FILE)
+    parser.add_argument('--max-room', type=int, default=THRESHOLDS['room'], help="허용 강의실 겹침 수")
+    parser.add_argument('--max-professor', type=int, default=THRESHOLDS['professor'], help="허용 교수 겹침 수")
+    parser.add_argument('--report', help=f"겹침 목록 JSON 저장 경로 (예: {REPORT_FILE})")
+    parser.add_argument('--limit', type=int, default=10, help="종류별 출력 건수")
+    parser.add_argument('--stream', action='store_true', help="한 항목씩 읽고 그룹별로 외부 정렬해 검사 (메모리 일정)")
+    args = parser.parse_args()
+
+    timetable = iter_json_array(args.timetable) if args.stream else load_sessions(args.timetable)
+    thresholds = {'room': args.max_room, 'professor': args.max_professor}
+    if not run_check(timetable, thresholds, args.report, args.limit, args.stream):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,177 +1,282 @@
+import argparse
 import json
 import re
 import os
+import sys
 
-def convert_timetable_data():
+import instrumentation
+from columnar import COLUMNAR_OUTPUT_FILE, ColumnarSpillEncoder, encode_columnar, write_columnar
+from conflicts import run_check
+from search_index import SEARCH_INDEX_FILE, SearchIndexBuilder, build_search_index, write_search_index
+from shards import SHARD_DIR, ShardBuilder, write_shards
+from streaming import JSONArrayWriter, NDJSONWriter, iter_json_array, json_default
+from session import Session, load_sessions
+from time_slots import cache_stats, parse_slot_string
+
+SOURCE_FILE = '개설강좌 리스트.json'
+OUTPUT_FILE = 'timetable.json'
+NDJSON_OUTPUT_FILE = 'timetable.ndjson'
+
+BUILDING_MAP = {
+    "A": "아펜젤러관", "H": "하워드관", "B": "백산관",
+    "C": "정보과학관", "J": "자연과학관", "G": "국제교류관",
+    "P": "21세기관", "JU": "자연과학관지하", "S": "소월관",
+    "PU": "21세기관지하", "PAU": "국제언어생활관지하", "Y": "예술관",
+    "MC": "미래창조관", "AM": "아펜젤러기념관", "F": "서재필관",
+    "W": "우남관", "DC": "대덕산학협력관", "DS": "대덕산학협력관", "K": "김옥균관(학군단)",
+    "SP": "SMART배재관", "HM": "하워드기념관"
+}
+
+
+def get_building_name(classroom_str):
+    if not classroom_str: return ""
+    # Match building codes like 'W404', 'MC207', '505-1'
+    match = re.match(r"([a-zA-Z]+|505)", classroom_str)
+    if match:
+        code = match.group(1).upper()
+        return BUILDING_MAP.get(code, code)
+    return ""
+
+
+def parse_time_slots(time_str):
+    # 파싱은 time_slots 모듈이 캐시와 함께 담당, 여기서는 건물명만 붙인다
+    instrumentation.count_slots(time_str)
+    return [
+        (day, start, end, classroom, get_building_name(classroom))
+        for day, start, end, classroom in parse_slot_string(time_str)
+    ]
+
+
+def is_header_row(record):
+    return '강의시수' in record and 'Column9' in record
+
+
+def convert_record(record):
+    """
+    Converts one raw record into a list of web-app sessions (session.Session)
+    (one per time slot, or a single ONLINE session).
+    """
+    # 수강 인원 값의 유효성 검사 및 변환
+    student_count_str = (record.get("수강\n인원") or "0").strip()
+    try:
+        student_count = int(student_count_str)
+    except ValueError:
+        student_count = 0
+
+    base_info = (
+        record.get("과목코드", "").strip(),
+        record.get("과목명", "").strip(),
+        record.get("담당교수", "").strip(),
+        record.get("학점", "0").strip(),
+        record.get("이수\n구분", "").strip(),
+        record.get("분반", "").strip(),
+        student_count,
+    )
+
+    time_slots_str = record.get("강의실/강의시간", "")
+    remarks = record.get("비고", "")
+
+    time_slots = parse_time_slots(time_slots_str)
+
+    # Mark as ONLINE if no valid classroom/time info is found, or if explicitly stated in remarks
+    if not time_slots or "온라인" in remarks:
+        instrumentation.count("online.remarks" if time_slots else "online.no_slots")
+        return [Session(*base_info, day="ONLINE", type="online")]
+
+    # 세션마다 dict를 복사하지 않고 Session 하나씩 (type ""는 오프라인)
+    return [Session(*base_info, *slot) for slot in time_slots]
+
+
+def iter_raw_records(source_file=SOURCE_FILE):
+    """Streams raw records one at a time, skipping the header row."""
+    for index, record in enumerate(iter_json_array(source_file)):
+        if index == 0 and is_header_row(record):
+            continue
+        yield record
+
+
+def iter_converted_records(raw_records):
+    for record in raw_records:
+        yield from convert_record(record)
+
+
+def print_cache_stats():
+    stats = cache_stats()
+    print(f"Slot parser cache: {stats['hits']} hits / {stats['misses']} misses (hit rate {stats['hit_rate']:.1%})")
+
+
+def write_derived_outputs(converted_data):
+    """Columnar copy, per-day shards and subject search index built from the converted records."""
+    with instrumentation.stage('columnar') as timer:
+        write_columnar(encode_columnar(converted_data))
+        timer.add(len(converted_data))
+    print(f"Compact columnar copy written to {COLUMNAR_OUTPUT_FILE}")
+    with instrumentation.stage('shards') as timer:
+        write_shards(converted_data)
+        timer.add(len(converted_data))
+    print(f"Per-day shards written to {SHARD_DIR}/")
+    with instrumentation.stage('search_index') as timer:
+        write_search_index(build_search_index(converted_data))
+        timer.add(len(converted_data))
+    print(f"Subject search index written to {SEARCH_INDEX_FILE}")
+
+
+def convert_timetable_data(source_file=SOURCE_FILE, derived=True):
     """
     Converts the raw '개설강좌 리스트.json' to a web-app friendly format,
     with robust parsing for various time/classroom formats.
+    With derived=False only timetable.json is written (benchmark.py times the derived outputs separately).
     """
-    
-    DAY_MAP = {'월': 'MON', '화': 'TUE', '수': 'WED', '목': 'THU', '금': 'FRI', '토': 'SAT'}
-    
-    BUILDING_MAP = {
-        "A": "아펜젤러관", "H": "하워드관", "B": "백산관",
-        "C": "정보과학관", "J": "자연과학관", "G": "국제교류관",
-        "P": "21세기관", "JU": "자연과학관지하", "S": "소월관",
-        "PU": "21세기관지하", "PAU": "국제언어생활관지하", "Y": "예술관",
-        "MC": "미래창조관", "AM": "아펜젤러기념관", "F": "서재필관",
-        "W": "우남관", "DC": "대덕산학협력관", "DS": "대덕산학협력관", "K": "김옥균관(학군단)",
-        "SP": "SMART배재관", "HM": "하워드기념관"
-    }
-
-    PERIOD_MAP = {
-        '0': {'start': '08:00', 'duration': 50}, '1': {'start': '09:00', 'duration': 50},
-        '2': {'start': '10:00', 'duration': 50}, '3': {'start': '11:00', 'duration': 50},
-        '4': {'start': '12:00', 'duration': 50}, '5': {'start': '13:00', 'duration': 50},
-        '6': {'start': '14:00', 'duration': 50}, '7': {'start': '15:00', 'duration': 50},
-        '8': {'start': '16:00', 'duration': 50}, '9': {'start': '17:00', 'duration': 50},
-        '10': {'start': '18:00', 'duration': 50}, '11': {'start': '19:00', 'duration': 50},
-        '12': {'start': '20:00', 'duration': 50}, '13': {'start': '21:00', 'duration': 50},
-        'Z': {'start': '08:10', 'duration': 75}, 'A': {'start': '09:30', 'duration': 75},
-        'B': {'start': '11:00', 'duration': 75}, 'C': {'start': '13:30', 'duration': 75},
-        'D': {'start': '15:00', 'duration': 75}, 'E': {'start': '16:30', 'duration': 75},
-        'F': {'start': '18:00', 'duration': 75}, 'G': {'start': '19:30', 'duration': 75},
-        'H': {'start': '21:00', 'duration': 75},
-    }
-
-    def calculate_end_time(start_time, duration):
-        if not start_time: return ''
-        h, m = map(int, start_time.split(':'))
-        total_minutes = h * 60 + m + duration
-        end_h, end_m = divmod(total_minutes, 60)
-        return f"{end_h:02d}:{end_m:02d}"
-
-    def get_building_name(classroom_str):
-        if not classroom_str: return ""
-        # Match building codes like 'W404', 'MC207', '505-1'
-        match = re.match(r"([a-zA-Z]+|505)", classroom_str)
-        if match:
-            code = match.group(1).upper()
-            return BUILDING_MAP.get(code, code)
-        return ""
-
-    def parse_time_slots(time_str):
-        slots = []
-        # If no time string or it's a placeholder, return empty list -> will be marked as ONLINE
-        if not time_str or time_str.strip() in ['(?)', '(), ()', '']:
-            return slots
-
-        # Split by comma to handle multiple class times, e.g., "J202(목A), J202(목B)"
-        parts = time_str.split(',')
-
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-
-            # Try to match format: "J202(목A)"
-            match1 = re.match(r'([\w.-]+)\s*\(([\uac00-\ud7a3])([A-Z\d])\)', part)
-            if match1:
-                classroom, day_kor, period = match1.groups()
-                day_eng = DAY_MAP.get(day_kor)
-                time_info = PERIOD_MAP.get(period.upper())
-                if day_eng and time_info:
-                    slots.append({
-                        "day": day_eng,
-                        "start": time_info["start"],
-                        "end": calculate_end_time(time_info["start"], time_info["duration"]),
-                        "classroom": classroom,
-                        "building_name": get_building_name(classroom)
-                    })
-                continue
-
-            # Try to match format: "화E(P203)"
-            match3 = re.match(r'([\uac00-\ud7a3])([A-Z\d])\(([\w.-]+)\)', part)
-            if match3:
-                day_kor, period, classroom = match3.groups()
-                day_eng = DAY_MAP.get(day_kor)
-                time_info = PERIOD_MAP.get(period.upper())
-                if day_eng and time_info:
-                    slots.append({
-                        "day": day_eng,
-                        "start": time_info["start"],
-                        "end": calculate_end_time(time_info["start"], time_info["duration"]),
-                        "classroom": classroom,
-                        "building_name": get_building_name(classroom)
-                    })
-                continue
-
-            # Try to match format: "목 A,B(J202)" (Note: comma inside is handled by splitting periods)
-            match2 = re.match(r'([\uac00-\ud7a3])\s+([A-Z\d,]+)\(([\w.-]+)\)', part)
-            if match2:
-                day_kor, periods_str, classroom = match2.groups()
-                day_eng = DAY_MAP.get(day_kor)
-                if day_eng:
-                    for period in periods_str.split(','):
-                        period = period.strip().upper()
-                        time_info = PERIOD_MAP.get(period)
-                        if time_info:
-                            slots.append({
-                                "day": day_eng,
-                                "start": time_info["start"],
-                                "end": calculate_end_time(time_info["start"], time_info["duration"]),
-                                "classroom": classroom,
-                                "building_name": get_building_name(classroom)
-                            })
-        return slots
-
-    source_file = '개설강좌 리스트.json'
     if not os.path.exists(source_file):
         print(f"Error: Source file {source_file} not found.")
         return
 
-    with open(source_file, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+    with instrumentation.stage('load') as timer:
+        with open(source_file, 'r', encoding='utf-8') as f:
+            raw_data = json.load(f)
 
-    # Skip header row if it exists
-    if raw_data and '강의시수' in raw_data[0] and 'Column9' in raw_data[0]:
-        raw_data = raw_data[1:]
+        # Skip header row if it exists
+        if raw_data and is_header_row(raw_data[0]):
+            raw_data = raw_data[1:]
+        timer.add(len(raw_data))
+
+    with instrumentation.stage('convert') as timer:
+        converted_data = list(iter_converted_records(raw_data))
+        timer.add(len(raw_data))
+
+    with instrumentation.stage('write_timetable') as timer:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(converted_data, f, ensure_ascii=False, indent=2, default=json_default)
+        timer.add(len(converted_data))
 
-    converted_data = []
-    for record in raw_data:
-        # 수강 인원 값의 유효성 검사 및 변환
-        student_count_str = (record.get("수강\n인원") or "0").strip()
-        try:
-            student_count = int(student_count_str)
-        except ValueError:
-            student_count = 0
-
-        base_info = {
-            "code": record.get("과목코드", "").strip(),
-            "subject": record.get("과목명", "").strip(),
-            "professor": record.get("담당교수", "").strip(),
-            "credits": record.get("학점", "0").strip(),
-            "department": record.get("이수\n구분", "").strip(),
-            "class_number": record.get("분반", "").strip(),
-            "student_count": student_count
-        }
-
-        time_slots_str = record.get("강의실/강의시간", "")
-        remarks = record.get("비고", "")
-        
-        time_slots = parse_time_slots(time_slots_str)
-
-        # Mark as ONLINE if no valid classroom/time info is found, or if explicitly stated in remarks
-        if not time_slots or "온라인" in remarks:
-            new_record = base_info.copy()
-            new_record.update({
-                "day": "ONLINE", "start": "", "end": "", "classroom": "",
-                "building_name": "", "type": "online"
-            })
-            converted_data.append(new_record)
-        else:
-            for slot in time_slots:
-                new_record = base_info.copy()
-                new_record.update(slot)
-                new_record["type"] = "" # Not an online class
-                converted_data.append(new_record)
-
-    with open('timetable.json', 'w', encoding='utf-8') as f:
-        json.dump(converted_data, f, ensure_ascii=False, indent=2)
-    
     print(f"Successfully converted {len(raw_data)} records from '{source_file}' into {len(converted_data)} web-app friendly records.")
-    print("New data written to timetable.json")
+    print(f"New data written to {OUTPUT_FILE}")
+
+    if derived:
+        write_derived_outputs(converted_data)
+    print_cache_stats()
+
+
+def convert_timetable_stream(source_file=SOURCE_FILE, ndjson_file=NDJSON_OUTPUT_FILE, array_file=OUTPUT_FILE):
+    """
+    Streaming variant: reads raw records one at a time and writes each
+    converted session to NDJSON as it goes. If array_file is set, the same
+    sessions are also written as the usual timetable.json array (byte-identical
+    to the batch mode) together with its columnar copy, per-day shards and
+    search index. The columnar copy and the shards spill their encoded rows to
+    temporary files, so only their string dictionaries stay in memory; the
+    search index keeps one small entry per distinct section.
+    Returns the number of sessions written.
+    """
+    if not os.path.exists(source_file):
+        print(f"Error: Source file {source_file} not found.")
+        return
+
+    raw_count = 0
+
+    def counted(records):
+        nonlocal raw_count
+        for record in records:
+            raw_count += 1
+            yield record
+
+    sessions = iter_converted_records(counted(iter_raw_records(source_file)))
+
+    with instrumentation.stage('stream') as timer, NDJSONWriter(ndjson_file) as ndjson:
+        if array_file:
+            columnar = ColumnarSpillEncoder()
+            shards = ShardBuilder(spill=True)
+            search = SearchIndexBuilder()
+            with JSONArrayWriter(array_file) as array:
+                for session in sessions:
+                    ndjson.write(session)
+                    array.write(session)
+                    columnar.add(session)
+                    shards.add(session)
+                    search.add(session)
+            with open(COLUMNAR_OUTPUT_FILE, 'w', encoding='utf-8') as f:
+                columnar.write(f)
+            columnar.close()
+            shards.write()
+            write_search_index(search.to_dict())
+        else:
+            for session in sessions:
+                ndjson.write(session)
+        timer.add(raw_count)
+
+    print(f"Streamed {raw_count} records from '{source_file}' into {ndjson.count} web-app friendly records.")
+    print(f"NDJSON written to {ndjson_file}" + (f" (array copy: {array_file})" if array_file else ""))
+    print_cache_stats()
+    return ndjson.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="개설강좌 리스트.json -> timetable.json 변환")
+    parser.add_argument('--stream', action='store_true', help="레코드 단위 스트리밍 변환 (NDJSON 출력, --no-array면 메모리 일정)")
+    parser.add_argument('--source', default=SOURCE_FILE, help="원본 파일")
+    parser.add_argument('--ndjson', default=NDJSON_OUTPUT_FILE, help="NDJSON 출력 경로 (--stream 전용)")
+    parser.add_argument('--no-array', action='store_true', help="--stream 시 timetable.json 배열 출력 생략")
+    parser.add_argument('--incremental', action='store_true', help="바뀐 레코드만 다시 변환 (incremental.py)")
+    parser.add_argument('--db', action='store_true', help="변환 후 SQLite 저장소(timetable.db)도 생성")
+    parser.add_argument('--archive', metavar='TERM', help="변환 결과를 archive/에 학기 파티션으로 보관 (예: 2025-2)")
+    parser.add_argument('--skip-conflicts', action='store_true', help="강의실/교수 겹침 검사 생략 (conflicts.py)")
+    parser.add_argument('--profile', metavar='REPORT', help="단계 시간/메모리/정규식 분기 계측 리포트 저장 (instrumentation.py)")
+    args = parser.parse_args()
+
+    instrumentation.start('converter.py', args.profile)
+    try:
+        run_conversion(args)
+    finally:
+        instrumentation.finish()
+
+
+def run_conversion(args):
+    """변환 + 후속 단계 (겹침 검사, DB, 보관)"""
+    written = None
+    if args.incremental:
+        from incremental import convert_incremental
+        convert_incremental(args.source)
+    elif args.stream:
+        written = convert_timetable_stream(args.source, args.ndjson, None if args.no_array else OUTPUT_FILE)
+    else:
+        convert_timetable_data(args.source)
+
+    # 변환 결과를 쓰는 후속 단계 (겹침 검사는 기본, 기준을 넘으면 DB/보관 전에 실패)
+    if (args.stream and args.no_array) or not os.path.exists(OUTPUT_FILE):
+        return
+    # 스트리밍 모드는 timetable.json을 다시 통째로 올리지 않음: 겹침 검사와 DB는 한 항목씩 읽음
+    timetable = None
+    if not args.stream and (not args.skip_conflicts or args.db or args.archive):
+        timetable = load_sessions(OUTPUT_FILE)
+
+    if not args.skip_conflicts:
+        print("Checking room double-booking and professor overlaps...")
+        with instrumentation.stage('conflicts') as timer:
+            if timetable is None:
+                passed = run_check(iter_json_array(OUTPUT_FILE), limit=5, stream=True)
+                timer.add(written or 0)
+            else:
+                passed = run_check(timetable, limit=5)
+                timer.add(len(timetable))
+        if not passed:
+            sys.exit(1)
+
+    if args.db:
+        from timetable_db import DB_FILE, build_database
+        counts = build_database(timetable if timetable is not None else iter_json_array(OUTPUT_FILE),
+                                DB_FILE, OUTPUT_FILE)
+        print(f"SQLite store written to {DB_FILE} ({counts['meetings']} meetings, FTS5: {counts['fts_tokenizer'] or 'none'})")
+
+    if args.archive:
+        from archive import ARCHIVE_DIR, Archive, ArchiveError
+        if timetable is None:
+            # 보관 파티션은 전체 세션을 한 번에 씀 (--stream이어도 세션 수에 비례하는 메모리)
+            timetable = load_sessions(OUTPUT_FILE)
+        try:
+            entry = Archive().add(args.archive, timetable, OUTPUT_FILE)
+            print(f"Term {args.archive} archived to {ARCHIVE_DIR}/{entry['path']}")
+        except ArchiveError as e:
+            print(f"Error: {e}")
 
 if __name__ == "__main__":
-    convert_timetable_data()
+    main()
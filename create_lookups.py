@@ -1,42 +1,128 @@
+"""
+교수 / 강의실 목록 (professors.json, classrooms.json)
+
+timetable.json을 한 번만 돌면서 교수별, 강의실별 세션 수(Counter)와
+포스팅 목록(timetable.json 행 번호, 오름차순)을 함께 만듭니다.
+ - professors.json  [{"name", "count", "sessions"}]             이름 순
+ - classrooms.json  [{"building", "room", "count", "sessions"}]  건물명 -> 호실 번호 순
+
+프론트엔드는 sessions로 해당 행만 바로 꺼내므로 교수/강의실 시간표를 볼 때 전체 시간표를 훑지 않습니다.
+(요일 샤드에도 행 번호가 들어 있어 샤드만 받은 상태에서도 같은 번호를 씁니다 - shards.py)
+
+fix_professors.py / fix_classrooms.py도 이 모듈을 그대로 사용합니다.
+"""
 import json
+from collections import Counter, defaultdict
+
+from occupancy import build_occupancy_file
+from session import load_sessions
+
+PROFESSORS_FILE = 'professors.json'
+CLASSROOMS_FILE = 'classrooms.json'
+
+
+def professor_names(item):
+    """공동 담당(쉼표 구분)을 나눈 교수 이름 - 분반 번호('01' 등)가 잘못 들어간 값은 제외"""
+    names = []
+    for name in (item.get('professor') or '').split(','):
+        name = name.strip()
+        if name and not name.isdigit() and name not in names:
+            names.append(name)
+    return names
+
+
+def classroom_of(item):
+    """(건물, 강의실) 또는 None"""
+    building = (item.get('building_name') or '').strip()
+    room = (item.get('classroom') or '').strip()
+    return (building, room) if building and room else None
+
+
+def classroom_sort_key(pair):
+    building, room = pair
+    return building, int(''.join(filter(str.isdigit, room)) or 0), room
+
+
+class LookupBuilder:
+    """세션을 하나씩 add()로 받아 교수 / 강의실 세션 수와 포스팅 목록을 모음"""
+
+    def __init__(self):
+        self.professor_counts = Counter()
+        self.classroom_counts = Counter()
+        self.professor_sessions = defaultdict(list)
+        self.classroom_sessions = defaultdict(list)
+        self.count = 0
+
+    def add(self, item):
+        index = self.count
+        for name in professor_names(item):
+            self.professor_counts[name] += 1
+            self.professor_sessions[name].append(index)
+        pair = classroom_of(item)
+        if pair:
+            self.classroom_counts[pair] += 1
+            self.classroom_sessions[pair].append(index)
+        self.count += 1
+
+    def professors(self):
+        return [
+            {"name": name, "count": self.professor_counts[name], "sessions": self.professor_sessions[name]}
+            for name in sorted(self.professor_counts)
+        ]
+
+    def classrooms(self):
+        return [
+            {"building": building, "room": room, "count": self.classroom_counts[(building, room)],
+             "sessions": self.classroom_sessions[(building, room)]}
+            for building, room in sorted(self.classroom_counts, key=classroom_sort_key)
+        ]
+
+
+def build_lookups(timetable_data):
+    builder = LookupBuilder()
+    for item in timetable_data:
+        builder.add(item)
+    return builder
+
+
+def build_professor_list(timetable_data):
+    """교수 목록 [{"name", "count", "sessions"}]"""
+    return build_lookups(timetable_data).professors()
+
+
+def build_classroom_list(timetable_data):
+    """강의실 목록 [{"building", "room", "count", "sessions"}]"""
+    return build_lookups(timetable_data).classrooms()
+
+
+def dump_lookup(data, path):
+    # 항목 하나를 한 줄로 (포스팅 목록이 들어가도 diff와 파일 크기가 관리 가능한 수준)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n' + ',\n'.join(json.dumps(entry, ensure_ascii=False) for entry in data) + '\n]\n')
+
+
+def write_professor_file(professors, path=PROFESSORS_FILE):
+    dump_lookup(professors, path)
+    print(f"✅ {path} 생성 완료 ({len(professors)}명)")
+
+
+def write_classroom_file(classrooms, path=CLASSROOMS_FILE):
+    dump_lookup(classrooms, path)
+    print(f"✅ {path} 생성 완료 ({len(classrooms)}개)")
+
+
+def write_lookup_files(timetable_data):
+    lookups = build_lookups(timetable_data)
+    write_professor_file(lookups.professors())
+    write_classroom_file(lookups.classrooms())
+
+    build_occupancy_file(timetable_data)
 
 def create_lookup_files():
     try:
-        with open('timetable.json', 'r', encoding='utf-8') as f:
-            timetable_data = json.load(f)
-
-        # 교수 목록 생성
-        professors_set = set()
-        for item in timetable_data:
-            single = (item.get('professor') or '').strip()
-            if single and not single.isdigit():
-                for name in single.split(','):
-                    professors_set.add(name.strip())
-        
-        professors_list = sorted(list(professors_set))
-        with open('professors.json', 'w', encoding='utf-8') as f:
-            json.dump(professors_list, f, ensure_ascii=False, indent=2)
-        print(f"✅ professors.json 생성 완료 ({len(professors_list)}명)")
-
-        # 강의실 목록 생성
-        classrooms_set = set()
-        for item in timetable_data:
-            building = (item.get('building_name') or '').strip()
-            room = (item.get('classroom') or '').strip()
-            if building and room:
-                classrooms_set.add(f"{building}-{room}")
-
-        classrooms_list = sorted(list(classrooms_set))
-        
-        # 정렬을 위해 분리 후 재조합
-        temp_list = [item.split('-') for item in classrooms_list]
-        temp_list.sort(key=lambda x: (x[0], int(''.join(filter(str.isdigit, x[1])) or 0)))
-        
-        final_classrooms = [{'building': item[0], 'room': item[1]} for item in temp_list]
-
-        with open('classrooms.json', 'w', encoding='utf-8') as f:
-            json.dump(final_classrooms, f, ensure_ascii=False, indent=2)
-        print(f"✅ classrooms.json 생성 완료 ({len(final_classrooms)}개)")
+        timetable_data = load_sessions('timetable.json')
+
+        write_lookup_files(timetable_data)
 
     except FileNotFoundError:
         print("🔴 timetable.json 파일을 찾을 수 없습니다. converter.py를 먼저 실행해주세요.")
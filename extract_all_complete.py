@@ -1,12 +1,20 @@
 import pdfplumber
+import argparse
 import re
 import json
 import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import instrumentation
+from pdf_cache import PageCache
 
 # 완전한 PDF 추출을 위한 향상된 스크립트
 PDF_FILE_PATH = "붙임5 2025-2학기 강의시간 편람_250808_1600.pdf"
 START_PAGE = 112
 OUTPUT_JSON_FILE = "timetable_final.json"
+SUMMARY_JSON_FILE = "extract_run_summary.json"
 
 # 시간표 매핑
 TIME_MAP = {
@@ -46,6 +54,7 @@ def parse_time_string(time_str):
             continue
             
         day_time_match = re.match(r'([월화수목금토])([A-Z0-9]+)', part)
+        instrumentation.count("slot_regex.day_time" if day_time_match else "slot_regex.no_match")
         if day_time_match:
             day_kr = day_time_match.group(1)
             time_codes = day_time_match.group(2)
@@ -113,6 +122,7 @@ def extract_from_text_lines(text, current_college, current_department):
 
         # 온라인 제외 (강의실 문구 또는 라인에 온라인 포함)
         if "온라인" in line or "온라인" in classroom:
+            instrumentation.count("online.text_lines")
             continue
 
         # 과목명과 교수명 추정: 코드 이후~시간 이전 텍스트를 분해
@@ -159,197 +169,475 @@ def extract_from_text_lines(text, current_college, current_department):
     
     return sessions
 
-def process_pdf_comprehensive(pdf_path):
-    """PDF 완전 처리 - 테이블과 텍스트 모두 활용"""
+# 정규표현식
+COLLEGE_REGEX = re.compile(r'■\s*([^■]+?)대학', re.MULTILINE)
+DEPT_REGEX = re.compile(r'●\s*([^●]+?)(?:학과|학부|전공)', re.MULTILINE)
+
+# 테이블 추출 시도 순서
+TABLE_SETTINGS = [
+    {"vertical_strategy": "lines", "horizontal_strategy": "text"},
+    {"vertical_strategy": "text", "horizontal_strategy": "lines"},
+    {"vertical_strategy": "text", "horizontal_strategy": "text"},
+    {"vertical_strategy": "explicit", "horizontal_strategy": "explicit"},
+]
+
+INITIAL_CONTEXT = ("교양", "교양")
+
+# 최근 몇 페이지의 성공 전략을 기준으로 시도 순서를 정할지
+ADAPTIVE_WINDOW = 8
+
+def strategy_name(index):
+    setting = TABLE_SETTINGS[index]
+    return f"{setting['vertical_strategy']}/{setting['horizontal_strategy']}"
+
+class StrategySelector:
+    """
+    테이블 추출 전략 선택기 + 시도 계측
+     - adaptive=False: 항상 TABLE_SETTINGS 순서대로 시도 (기존 동작)
+     - adaptive=True: 최근 페이지에서 세션을 만든 전략을 먼저 시도하고, 실패할 때만 나머지로 넘어감
+    전략별 시도/성공 횟수와 소요 시간을 stats에 누적합니다.
+    """
+
+    def __init__(self, adaptive=False, window=ADAPTIVE_WINDOW):
+        self.adaptive = adaptive
+        self.recent = deque(maxlen=window)
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats():
+        return {
+            strategy_name(i): {"attempts": 0, "successes": 0, "seconds": 0.0}
+            for i in range(len(TABLE_SETTINGS))
+        }
+
+    def order(self):
+        default = range(len(TABLE_SETTINGS))
+        if not self.adaptive or not self.recent:
+            return list(default)
+        wins = Counter(self.recent)
+        # 최근 성공 횟수 내림차순, 동률이면 기본 순서
+        return sorted(default, key=lambda i: -wins[i])
+
+    def record(self, index, success, seconds):
+        entry = self.stats[strategy_name(index)]
+        entry["attempts"] += 1
+        entry["seconds"] += seconds
+        if success:
+            entry["successes"] += 1
+            self.recent.append(index)
+
+    def take_stats(self):
+        """지금까지의 통계를 돌려주고 0부터 다시 셈 (최근 성공 전략은 유지)"""
+        stats, self.stats = self.stats, self._empty_stats()
+        return stats
+
+    def merge(self, stats):
+        for name, entry in stats.items():
+            for field, value in entry.items():
+                self.stats[name][field] += value
+
+    def summary(self):
+        attempts = sum(e["attempts"] for e in self.stats.values())
+        successes = sum(e["successes"] for e in self.stats.values())
+        return {
+            "adaptive": self.adaptive,
+            "strategies": self.stats,
+            "extract_tables_calls": attempts,
+            "wasted_calls": attempts - successes,
+            "extract_tables_seconds": round(sum(e["seconds"] for e in self.stats.values()), 3)
+        }
+
+def print_strategy_summary(selector):
+    summary = selector.summary()
+    print(f"\n📋 테이블 전략 통계 ({'적응형' if summary['adaptive'] else '고정 순서'})")
+    for name, entry in summary["strategies"].items():
+        print(f"  - {name:17s} 시도 {entry['attempts']:4d} / 성공 {entry['successes']:4d} / {entry['seconds']:.2f}s")
+    print(f"  extract_tables 호출 {summary['extract_tables_calls']}회 중 낭비 {summary['wasted_calls']}회 "
+          f"({summary['extract_tables_seconds']:.2f}s)")
+
+def find_headers(text):
+    """페이지 텍스트에서 단과대학/학과 헤더 추출 (없으면 None)"""
+    college = department = None
     
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+    college_match = COLLEGE_REGEX.search(text)
+    if college_match:
+        college = college_match.group(1).strip()
     
-    all_sessions = []
+    dept_match = DEPT_REGEX.search(text)
+    if dept_match:
+        department = dept_match.group(1).strip()
+        if "교양" in department:
+            department = "교양"
     
-    # 정규표현식
-    COLLEGE_REGEX = re.compile(r'■\s*([^■]+?)대학', re.MULTILINE)
-    DEPT_REGEX = re.compile(r'●\s*([^●]+?)(?:학과|학부|전공)', re.MULTILINE)
+    return college, department
+
+def extract_page(page, current_college, current_department, verbose=True, selector=None):
+    """
+    한 페이지 처리 - 테이블과 텍스트 모두 활용
+    selector(StrategySelector)가 주어지면 그 순서로 전략을 시도하고 결과를 기록
+    반환: (page_sessions, 처리 후 college, 처리 후 department)
+    """
+    text = page.extract_text(x_tolerance=1, y_tolerance=1)
+    if not text:
+        return [], current_college, current_department
     
-    current_college = "교양"
-    current_department = "교양"
+    # 1. 단과대학/학과 정보 업데이트
+    college, department = find_headers(text)
+    if college:
+        current_college = college
+        if verbose:
+            print(f"  [College: {current_college}]")
+    if department:
+        current_department = department
+        if verbose:
+            print(f"  [Department: {current_department}]")
     
-    print(f"'{pdf_path}' 완전 처리 시작...")
+    # 2. 다양한 테이블 추출 시도
+    page_sessions = []
     
-    with pdfplumber.open(pdf_path) as pdf:
-        pages = pdf.pages[START_PAGE:]
-        
-        for i, page in enumerate(pages):
-            page_num = START_PAGE + i + 1
-            print(f"Processing Page {page_num}/{len(pdf.pages)}...")
-            
-            text = page.extract_text(x_tolerance=1, y_tolerance=1)
-            if not text:
+    # 테이블 방식으로 추출 시도
+    strategies = selector.order() if selector else range(len(TABLE_SETTINGS))
+    for strategy in strategies:
+        setting = TABLE_SETTINGS[strategy]
+        started = time.perf_counter()
+        try:
+            tables = page.extract_tables(table_settings=setting)
+            if not tables:
                 continue
             
-            # 1. 단과대학/학과 정보 업데이트
-            college_match = COLLEGE_REGEX.search(text)
-            if college_match:
-                current_college = college_match.group(1).strip()
-                print(f"  [College: {current_college}]")
-            
-            dept_match = DEPT_REGEX.search(text)
-            if dept_match:
-                current_department = dept_match.group(1).strip()
-                if "교양" in current_department:
-                    current_department = "교양"
-                print(f"  [Department: {current_department}]")
-            
-            # 2. 다양한 테이블 추출 시도
-            table_settings = [
-                {"vertical_strategy": "lines", "horizontal_strategy": "text"},
-                {"vertical_strategy": "text", "horizontal_strategy": "lines"},
-                {"vertical_strategy": "text", "horizontal_strategy": "text"},
-                {"vertical_strategy": "explicit", "horizontal_strategy": "explicit"},
-            ]
-            
-            page_sessions = []
-            
-            # 테이블 방식으로 추출 시도
-            for setting in table_settings:
+            for table in tables:
+                if not table or len(table) < 2:
+                    continue
+                
+                # 테이블별 학과 헤더에서 학과명 보강
                 try:
-                    tables = page.extract_tables(table_settings=setting)
-                    if not tables:
+                    header_row = table[0]
+                    if header_row:
+                        joined_header = " ".join([str(c) for c in header_row if c])
+                        if '<' in joined_header and '>' in joined_header and '학과' in joined_header:
+                            # 예: '<간호학과-간호학>' 형태 처리
+                            header_text = joined_header[joined_header.find('<')+1: joined_header.find('>')]
+                            dept_name = header_text.split('-')[0].strip()
+                            if dept_name:
+                                current_department = dept_name
+                except Exception:
+                    pass
+                
+                # 헤더 인덱스 매핑 시도
+                header_index = 0
+                code_idx = subject_idx = professor_idx = time_idx = room_idx = None
+                for hi, hrow in enumerate(table[:3]):  # 처음 3행 중에서 헤더 탐색
+                    if not hrow:
+                        continue
+                    labels = [str(x) if x else '' for x in hrow]
+                    if any('교과목코드' in x for x in labels):
+                        header_index = hi
+                        # 각 컬럼 인덱스 찾기
+                        for idx, label in enumerate(labels):
+                            if '교과목코드' in label:
+                                code_idx = idx
+                            elif '교과목명' in label:
+                                subject_idx = idx
+                            elif '담당교수' in label:
+                                professor_idx = idx
+                            elif '강의시간' in label:
+                                time_idx = idx
+                            elif '강의실' in label:
+                                room_idx = idx
+                        break
+                
+                # 다양한 컬럼 구조 대응
+                for row in table[header_index+1:]:  # 헤더 다음부터
+                    if not row or len(row) < 8:
+                        continue
+                    
+                    # 과목 코드 및 다른 컬럼 찾기
+                    _code_idx = code_idx
+                    if _code_idx is None:
+                        for idx, cell in enumerate(row):
+                            if cell and re.search(r'[A-Z]{3,}[0-9]{4,}', str(cell)):
+                                _code_idx = idx
+                                break
+                    if _code_idx is None:
                         continue
                     
-                    for table in tables:
-                        if not table or len(table) < 2:
+                    try:
+                        # 컬럼 구조 추정: 헤더 매핑 우선, 실패 시 상대 오프셋
+                        code = str(row[_code_idx]).strip()
+                        subject = str(row[subject_idx] if subject_idx is not None and subject_idx < len(row) else (row[_code_idx + 1] if _code_idx + 1 < len(row) else "")).strip()
+                        professor = str(row[professor_idx] if professor_idx is not None and professor_idx < len(row) else (row[_code_idx + 4] if _code_idx + 4 < len(row) else "")).strip()
+                        time_str = str(row[time_idx] if time_idx is not None and time_idx < len(row) else (row[_code_idx + 5] if _code_idx + 5 < len(row) else "")).strip()
+                        room_str = str(row[room_idx] if room_idx is not None and room_idx < len(row) else (row[_code_idx + 6] if _code_idx + 6 < len(row) else "")).strip()
+                        
+                        # 기본 검증
+                        if not re.search(r'[A-Z]{3,}[0-9]{4,}', code):
                             continue
                         
-                        # 테이블별 학과 헤더에서 학과명 보강
-                        try:
-                            header_row = table[0]
-                            if header_row:
-                                joined_header = " ".join([str(c) for c in header_row if c])
-                                if '<' in joined_header and '>' in joined_header and '학과' in joined_header:
-                                    # 예: '<간호학과-간호학>' 형태 처리
-                                    header_text = joined_header[joined_header.find('<')+1: joined_header.find('>')]
-                                    dept_name = header_text.split('-')[0].strip()
-                                    if dept_name:
-                                        current_department = dept_name
-                        except Exception:
-                            pass
+                        # 온라인만 제외, 강의실 누락은 허용
+                        if "온라인" in room_str:
+                            instrumentation.count("online.table_rows")
+                            continue
                         
-                        # 헤더 인덱스 매핑 시도
-                        header_index = 0
-                        code_idx = subject_idx = professor_idx = time_idx = room_idx = None
-                        for hi, hrow in enumerate(table[:3]):  # 처음 3행 중에서 헤더 탐색
-                            if not hrow:
-                                continue
-                            labels = [str(x) if x else '' for x in hrow]
-                            if any('교과목코드' in x for x in labels):
-                                header_index = hi
-                                # 각 컬럼 인덱스 찾기
-                                for idx, label in enumerate(labels):
-                                    if '교과목코드' in label:
-                                        code_idx = idx
-                                    elif '교과목명' in label:
-                                        subject_idx = idx
-                                    elif '담당교수' in label:
-                                        professor_idx = idx
-                                    elif '강의시간' in label:
-                                        time_idx = idx
-                                    elif '강의실' in label:
-                                        room_idx = idx
-                                break
+                        if not professor:
+                            professor = ""
                         
-                        # 다양한 컬럼 구조 대응
-                        for row in table[header_index+1:]:  # 헤더 다음부터
-                            if not row or len(row) < 8:
-                                continue
-                            
-                            # 과목 코드 및 다른 컬럼 찾기
-                            _code_idx = code_idx
-                            if _code_idx is None:
-                                for idx, cell in enumerate(row):
-                                    if cell and re.search(r'[A-Z]{3,}[0-9]{4,}', str(cell)):
-                                        _code_idx = idx
-                                        break
-                            if _code_idx is None:
-                                continue
-                            
-                            try:
-                                # 컬럼 구조 추정: 헤더 매핑 우선, 실패 시 상대 오프셋
-                                code = str(row[_code_idx]).strip()
-                                subject = str(row[subject_idx] if subject_idx is not None and subject_idx < len(row) else (row[_code_idx + 1] if _code_idx + 1 < len(row) else "")).strip()
-                                professor = str(row[professor_idx] if professor_idx is not None and professor_idx < len(row) else (row[_code_idx + 4] if _code_idx + 4 < len(row) else "")).strip()
-                                time_str = str(row[time_idx] if time_idx is not None and time_idx < len(row) else (row[_code_idx + 5] if _code_idx + 5 < len(row) else "")).strip()
-                                room_str = str(row[room_idx] if room_idx is not None and room_idx < len(row) else (row[_code_idx + 6] if _code_idx + 6 < len(row) else "")).strip()
-                                
-                                # 기본 검증
-                                if not re.search(r'[A-Z]{3,}[0-9]{4,}', code):
-                                    continue
-                                
-                                # 온라인만 제외, 강의실 누락은 허용
-                                if "온라인" in room_str:
-                                    continue
-                                
-                                if not professor:
-                                    professor = ""
-                                
-                                # 시간 파싱
-                                schedules = parse_time_string(time_str)
-                                if not schedules:
-                                    continue
-                                
-                                # 건물 정보 (없어도 진행)
-                                building_code, building_name = get_building_info(room_str) if room_str else ("", "")
-                                
-                                # 세션 생성
-                                for sched in schedules:
-                                    session = {
-                                        "code": code,
-                                        "subject": subject,
-                                        "professor": professor,
-                                        "classroom": room_str.split(',')[0].strip() if room_str else "",
-                                        "building_code": building_code,
-                                        "building_name": building_name,
-                                        "day": sched["day"],
-                                        "start": sched["start"],
-                                        "end": sched["end"],
-                                        "department": current_department,
-                                        "college": current_college
-                                    }
-                                    page_sessions.append(session)
-                            
-                            except (IndexError, ValueError):
-                                continue
-                    
-                    if page_sessions:  # 테이블에서 성공하면 다른 설정 시도 안함
-                        break
+                        # 시간 파싱
+                        schedules = parse_time_string(time_str)
+                        if not schedules:
+                            instrumentation.count("extract.table_rows_without_schedule")
+                            continue
                         
-                except Exception as e:
-                    continue
-            
-            # 3. 텍스트 방식으로 추가 추출 (테이블 방식 보완)
-            text_sessions = extract_from_text_lines(text, current_college, current_department)
+                        # 건물 정보 (없어도 진행)
+                        building_code, building_name = get_building_info(room_str) if room_str else ("", "")
+                        
+                        # 세션 생성
+                        for sched in schedules:
+                            session = {
+                                "code": code,
+                                "subject": subject,
+                                "professor": professor,
+                                "classroom": room_str.split(',')[0].strip() if room_str else "",
+                                "building_code": building_code,
+                                "building_name": building_name,
+                                "day": sched["day"],
+                                "start": sched["start"],
+                                "end": sched["end"],
+                                "department": current_department,
+                                "college": current_college
+                            }
+                            page_sessions.append(session)
+                    
+                    except (IndexError, ValueError):
+                        continue
             
-            # 4. 중복 제거하고 병합
-            existing_codes = set((s['code'], s['day'], s['start']) for s in page_sessions)
-            for session in text_sessions:
-                key = (session['code'], session['day'], session['start'])
-                if key not in existing_codes:
-                    page_sessions.append(session)
+            if page_sessions:  # 테이블에서 성공하면 다른 설정 시도 안함
+                break
+                
+        except Exception as e:
+            continue
+        finally:
+            if selector:
+                selector.record(strategy, bool(page_sessions), time.perf_counter() - started)
+    
+    # 3. 텍스트 방식으로 추가 추출 (테이블 방식 보완)
+    instrumentation.count("extract.table_sessions", len(page_sessions))
+    text_sessions = extract_from_text_lines(text, current_college, current_department)
+    
+    # 4. 중복 제거하고 병합
+    existing_codes = set((s['code'], s['day'], s['start']) for s in page_sessions)
+    for session in text_sessions:
+        key = (session['code'], session['day'], session['start'])
+        if key not in existing_codes:
+            page_sessions.append(session)
+            instrumentation.count("extract.text_fallback_sessions")
+    
+    return page_sessions, current_college, current_department
+
+def get_page(pdf, pdf_path, index, cache=None):
+    """cache(PageCache)가 있으면 캐시로 감싼 페이지, 없으면 pdfplumber 페이지"""
+    return cache.page(pdf, pdf_path, index) if cache else pdf.pages[index]
+
+def process_pdf_comprehensive(pdf_path, workers=1, selector=None, cache=None):
+    """
+    PDF 완전 처리 - 테이블과 텍스트 모두 활용
+    selector를 넘기면 테이블 전략 순서/통계를 그 객체에 기록 (없으면 고정 순서)
+    cache(PageCache)를 넘기면 페이지별 원시 추출 결과를 디스크 캐시에서 재사용
+    """
+    
+    if not os.path.exists(pdf_path):
+        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+    
+    if selector is None:
+        selector = StrategySelector()
+    
+    if workers > 1:
+        return process_pdf_parallel(pdf_path, workers, selector, cache)
+    
+    all_sessions = []
+    current_college, current_department = INITIAL_CONTEXT
+    
+    print(f"'{pdf_path}' 완전 처리 시작...")
+    
+    with pdfplumber.open(pdf_path) as pdf, instrumentation.stage('extract_pages') as timer:
+        for index in range(START_PAGE, len(pdf.pages)):
+            print(f"Processing Page {index + 1}/{len(pdf.pages)}...")
             
+            page_sessions, current_college, current_department = extract_page(
+                get_page(pdf, pdf_path, index, cache), current_college, current_department, selector=selector
+            )
             all_sessions.extend(page_sessions)
+            instrumentation.count("extract.pages")
+            timer.add(len(page_sessions))
             
             if page_sessions:
                 print(f"  -> {len(page_sessions)}개 강의 추출")
     
     print(f"\n--- 처리 완료 ---")
     print(f"✅ 총 {len(all_sessions)}개 강의 추출")
+    if cache:
+        print(f"💾 페이지 캐시: 적중 {cache.hits}회 / 미적중 {cache.misses}회")
+    print_strategy_summary(selector)
+    
+    return all_sessions
+
+# ===== 병렬 처리 (페이지 구간 분할) =====
+
+def _worker_cache(pdf_path, cache_spec):
+    """cache_spec = (캐시 디렉터리, 부모가 계산한 PDF 키) -> 워커용 PageCache (PDF를 다시 해시하지 않음)"""
+    if not cache_spec:
+        return None
+    cache_dir, pdf_key = cache_spec
+    cache = PageCache(cache_dir)
+    cache.pin_key(pdf_path, pdf_key)
+    return cache
+
+def _scan_headers(args):
+    """1차 패스 (워커): 구간 내 각 페이지의 단과대학/학과 헤더만 텍스트로 수집"""
+    pdf_path, start, end, cache_spec = args
+    cache = _worker_cache(pdf_path, cache_spec)
+    headers = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(start, end):
+            text = get_page(pdf, pdf_path, index, cache).extract_text(x_tolerance=1, y_tolerance=1)
+            headers.append(find_headers(text) if text else (None, None))
+    return headers
+
+def _extract_range(args):
+    """2차 패스 (워커): 주어진 시작 문맥으로 구간을 직렬 처리
+    페이지마다 (번호, 세션, 끝 문맥, 전략 통계, 계측 카운터) - 병합 때 재처리된 페이지의 통계는 버림"""
+    pdf_path, start, end, context, adaptive, cache_spec, profile = args
+    if profile:
+        instrumentation.enable_counters()
+    selector = StrategySelector(adaptive=adaptive)
+    cache = _worker_cache(pdf_path, cache_spec)
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(start, end):
+            sessions, college, department = extract_page(
+                get_page(pdf, pdf_path, index, cache), *context, verbose=False, selector=selector
+            )
+            context = (college, department)
+            instrumentation.count("extract.pages")
+            results.append((index, sessions, context, selector.take_stats(), instrumentation.take_counters()))
+    return results
+
+def split_ranges(start, end, parts):
+    """[start, end)를 연속된 구간 최대 parts개로 분할"""
+    size, extra = divmod(end - start, parts)
+    ranges = []
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def process_pdf_parallel(pdf_path, workers, selector, cache=None):
+    """
+    페이지 구간을 프로세스 풀에 나눠 처리 - 결과는 직렬 실행과 동일
+    1) 1차 패스: 헤더(COLLEGE_REGEX/DEPT_REGEX) 위치만 모아 각 구간의 시작 문맥 계산
+    2) 2차 패스: 각 워커가 자기 구간을 시작 문맥부터 처리
+    3) 병합: 테이블 헤더(<...학과-...>)로 학과가 바뀌어 앞 구간의 끝 문맥이 예상과 다르면,
+       문맥이 다시 일치할 때까지 해당 구간 앞부분만 직렬로 재처리
+       (재처리한 페이지는 워커가 센 전략 통계/계측 카운터를 버리고 재처리 결과만 반영)
+    적응형 전략 선택은 구간(워커)마다 따로 학습하므로, 직렬 실행과의 완전 일치는
+    고정 순서(기본값)에서만 보장됩니다.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+    
+    # 부하 분산을 위해 워커 수보다 잘게 나눔
+    ranges = split_ranges(START_PAGE, total_pages, workers * 4)
+    print(f"'{pdf_path}' 병렬 처리 시작... ({workers}개 프로세스, {len(ranges)}개 구간)")
+    
+    # PDF 해시는 부모에서 한 번만 계산해 워커에 넘김
+    cache_spec = (cache.cache_dir, cache.pdf_key(pdf_path)) if cache else None
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        headers = []
+        for chunk in pool.map(_scan_headers, [(pdf_path, s, e, cache_spec) for s, e in ranges]):
+            headers.extend(chunk)
+        
+        # 각 구간 시작 시점의 문맥 계산
+        starts = []
+        context = INITIAL_CONTEXT
+        offset = 0
+        for s, e in ranges:
+            starts.append(context)
+            for college, department in headers[offset:offset + (e - s)]:
+                context = (college or context[0], department or context[1])
+            offset += e - s
+        
+        chunks = []
+        with instrumentation.stage('extract_pages') as timer:
+            for results in pool.map(
+                _extract_range,
+                [(pdf_path, s, e, ctx, selector.adaptive, cache_spec, instrumentation.active)
+                 for (s, e), ctx in zip(ranges, starts)]
+            ):
+                chunks.append(results)
+                timer.add(sum(len(page[1]) for page in results))
+    
+    all_sessions = []
+    context = INITIAL_CONTEXT
+    reprocessed = 0
+    pdf = None
+    try:
+        for start_context, results in zip(starts, chunks):
+            if start_context != context:
+                # 예상 문맥이 틀린 구간: 문맥이 수렴할 때까지 직렬 재처리
+                if pdf is None:
+                    pdf = pdfplumber.open(pdf_path)
+                for j, (index, _, worker_context, _, _) in enumerate(results):
+                    sessions, college, department = extract_page(
+                        get_page(pdf, pdf_path, index, cache), *context, verbose=False, selector=selector
+                    )
+                    context = (college, department)
+                    # 재처리 결과는 selector / 카운터에 바로 기록됨 -> 워커 통계는 버림
+                    results[j] = (index, sessions, context, None, None)
+                    reprocessed += 1
+                    instrumentation.count("extract.pages")
+                    instrumentation.count("extract.reprocessed_pages")
+                    if context == worker_context:
+                        break
+            
+            for _, sessions, _, stats, counters in results:
+                all_sessions.extend(sessions)
+                if stats is not None:
+                    selector.merge(stats)
+                    instrumentation.merge_counters(counters)
+            if results:
+                context = results[-1][2]
+    finally:
+        if pdf is not None:
+            pdf.close()
+    
+    print(f"\n--- 처리 완료 ---")
+    if reprocessed:
+        print(f"  (문맥 보정을 위해 {reprocessed}개 페이지 재처리)")
+    print(f"✅ 총 {len(all_sessions)}개 강의 추출")
+    print_strategy_summary(selector)
     
     return all_sessions
 
 def main():
+    parser = argparse.ArgumentParser(description="강의시간 편람 PDF 추출")
+    parser.add_argument('--workers', type=int, default=1, help="병렬 처리 프로세스 수 (기본: 1 = 직렬)")
+    parser.add_argument('--adaptive', action='store_true', help="최근 페이지에서 성공한 테이블 전략을 먼저 시도")
+    parser.add_argument('--no-cache', action='store_true', help="페이지 추출 캐시(pdf_cache.py)를 사용하지 않음")
+    parser.add_argument('--profile', metavar='REPORT', help="단계 시간/메모리/정규식 분기 계측 리포트 저장 (instrumentation.py)")
+    args = parser.parse_args()
+
+    instrumentation.start('extract_all_complete.py', args.profile)
+    selector = StrategySelector(adaptive=args.adaptive)
     try:
         # PDF 완전 처리
-        sessions = process_pdf_comprehensive(PDF_FILE_PATH)
+        cache = None if args.no_cache else PageCache()
+        sessions = process_pdf_comprehensive(PDF_FILE_PATH, workers=args.workers, selector=selector, cache=cache)
+        if cache:
+            evicted = cache.evict()
+            if evicted:
+                print(f"💾 캐시 용량 초과로 {evicted}개 페이지 항목 삭제")
         
         # JSON 저장
         with open(OUTPUT_JSON_FILE, 'w', encoding='utf-8') as f:
@@ -357,6 +645,11 @@ def main():
         
         print(f"✅ '{OUTPUT_JSON_FILE}' 저장 완료")
         
+        # 전략별 시도/성공/시간 기록
+        with open(SUMMARY_JSON_FILE, 'w', encoding='utf-8') as f:
+            json.dump(selector.summary(), f, ensure_ascii=False, indent=2)
+        print(f"✅ '{SUMMARY_JSON_FILE}' 저장 완료")
+        
         # 통계
         professors = set(s['professor'] for s in sessions if s['professor'])
         departments = set(s['department'] for s in sessions)
@@ -379,6 +672,8 @@ def main():
         print(f"❌ 오류: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        instrumentation.finish(strategies=selector.summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
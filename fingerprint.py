@@ -0,0 +1,33 @@
+"""
+코드 지문용 로컬 모듈 목록
+
+pipeline.py(단계 지문)와 incremental.py(변환 규칙 지문)가 같이 씁니다.
+스크립트가 import하는 같은 디렉터리의 .py 파일을 AST로 따라가 모읍니다 (실행/import 하지 않음).
+"""
+import ast
+import os
+
+
+def local_modules(script):
+    """스크립트와 그 스크립트가 (간접적으로) import하는 같은 디렉터리의 .py 파일 - 함수 안의 import 포함"""
+    seen = set()
+    pending = [script]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = os.path.join(os.path.dirname(path), name.split('.')[0] + '.py')
+                if os.path.exists(candidate):
+                    pending.append(candidate)
+    return sorted(seen)
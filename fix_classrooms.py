@@ -1,19 +1,9 @@
 import json
-from collections import defaultdict
 
+from create_lookups import build_classroom_list, write_classroom_file
+
+# classrooms.json 규칙은 create_lookups.py 한 곳에서 관리 (건물명 -> 호실 번호 순, 세션 수, 포스팅 목록)
 with open('timetable.json', encoding='utf-8') as f:
     data = json.load(f)
 
-rooms = set()
-for item in data:
-    building = (item.get('building_name') or '').strip()
-    room = (item.get('classroom') or '').strip()
-    if building and room:
-        rooms.add((building, room))
-
-room_list = [
-    {"building": b, "room": r} for b, r in sorted(rooms)
-]
-
-with open('classrooms.json', 'w', encoding='utf-8') as f:
-    json.dump(room_list, f, ensure_ascii=False, indent=2)
+write_classroom_file(build_classroom_list(data))
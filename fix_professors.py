@@ -1,16 +1,9 @@
 import json
 
+from create_lookups import build_professor_list, write_professor_file
+
+# professors.json 규칙은 create_lookups.py 한 곳에서 관리 (공동 담당 분리, 세션 수, 포스팅 목록)
 with open('timetable.json', encoding='utf-8') as f:
     data = json.load(f)
 
-professors = set()
-for item in data:
-    # 교수명은 'professor' 필드에 있음
-    name = (item.get('professor') or '').strip()
-    if name:
-        professors.add(name)
-
-professor_list = sorted(professors)
-
-with open('professors.json', 'w', encoding='utf-8') as f:
-    json.dump(professor_list, f, ensure_ascii=False, indent=2)
+write_professor_file(build_professor_list(data))
@@ -0,0 +1,209 @@
+"""
+개설강좌 리스트.json 증분 재변환
+
+레코드마다 (과목코드, 분반) 단위 콘텐츠 해시를 사이드카 매니페스트에 저장해 두고,
+다시 실행하면 새로 생겼거나 바뀐 레코드만 다시 파싱합니다.
+ - 바뀌지 않은 레코드는 기존 timetable.json의 세션을 그대로 재사용
+ - 변경이 없으면 어떤 파일도 다시 쓰지 않음
+ - professors.json / classrooms.json은 내용이 달라졌을 때만 갱신
+ - 추가/삭제/변경된 세션을 timetable.delta.json으로 기록
+ - timetable.columnar.json, room_occupancy.json, shards/, search_index.json도 timetable.json과 함께 갱신
+
+변환 규칙(이 스크립트와 이 스크립트가 import하는 로컬 모듈 - converter.py, columnar.py, shards.py 등)이
+바뀌었거나, timetable.json이 마지막 변환 결과(매니페스트에 저장한 SHA-256)와 다르면
+매니페스트를 무시하고 전체 재변환합니다.
+
+사용법: python3 incremental.py
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+from columnar import encode_columnar, write_columnar
+from converter import OUTPUT_FILE, SOURCE_FILE, convert_record, iter_raw_records
+from create_lookups import CLASSROOMS_FILE, PROFESSORS_FILE, build_lookups, dump_lookup
+from fingerprint import local_modules
+from occupancy import build_occupancy_file
+from search_index import build_search_index, write_search_index
+from shards import write_shards
+from session import load_sessions
+from streaming import JSONArrayWriter, json_default
+
+MANIFEST_FILE = 'timetable.manifest.json'
+DELTA_FILE = 'timetable.delta.json'
+
+
+def record_hash(record):
+    """원본 레코드의 콘텐츠 해시 (키 순서와 무관)"""
+    payload = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_sha256(path):
+    """파일 내용 SHA-256 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def rules_fingerprint():
+    """변환 결과에 영향을 주는 소스 파일(이 스크립트 + import하는 로컬 모듈)의 내용 해시"""
+    digest = hashlib.sha256()
+    for path in local_modules(os.path.abspath(__file__)):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def record_keys(records):
+    """(과목코드, 분반) 키를 붙여 yield; 같은 키가 반복되면 '#2', '#3'을 붙여 구분"""
+    seen = defaultdict(int)
+    for record in records:
+        base = f"{(record.get('과목코드') or '').strip()}|{(record.get('분반') or '').strip()}"
+        seen[base] += 1
+        key = base if seen[base] == 1 else f"{base}#{seen[base]}"
+        yield key, record
+
+
+def session_key(session):
+    return f"{session.get('code', '')}|{session.get('class_number', '')}"
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_previous_sessions(manifest):
+    """매니페스트에 기록된 키 순서대로 기존 timetable.json 세션을 묶어 반환"""
+    grouped = defaultdict(list)
+    previous = load_sessions(OUTPUT_FILE) if os.path.exists(OUTPUT_FILE) else []
+    for session in previous:
+        grouped[session_key(session)].append(session)
+
+    by_key = {}
+    occurrences = defaultdict(int)
+    for key, count in manifest.get('sessions', {}).items():
+        base = key.split('#')[0]
+        offset = occurrences[base]
+        by_key[key] = grouped[base][offset:offset + count]
+        occurrences[base] += count
+    return by_key
+
+
+def write_if_changed(path, data):
+    if load_json(path, None) == data:
+        return False
+    dump_lookup(data, path)
+    return True
+
+
+def convert_incremental(source_file=SOURCE_FILE):
+    if not os.path.exists(source_file):
+        print(f"Error: Source file {source_file} not found.")
+        return None
+
+    fingerprint = rules_fingerprint()
+    manifest = load_json(MANIFEST_FILE, {})
+    # 전체 재변환 이유 (None이면 증분)
+    if not manifest:
+        full_build = "매니페스트 없음 (첫 실행)"
+    elif manifest.get('rules') != fingerprint:
+        full_build = "변환 규칙 변경"
+    elif not os.path.exists(OUTPUT_FILE):
+        full_build = f"{OUTPUT_FILE} 없음"
+    elif manifest.get('output') != file_sha256(OUTPUT_FILE):
+        full_build = f"{OUTPUT_FILE}이(가) 마지막 변환 결과와 다름"
+    else:
+        full_build = None
+    if full_build:
+        manifest = {}
+    old_hashes = manifest.get('records', {})
+    old_sessions = load_previous_sessions(manifest) if manifest else {}
+
+    new_hashes = {}
+    new_counts = {}
+    timetable = []
+    delta = {"added": [], "removed": [], "changed": []}
+    reparsed = 0
+
+    for key, record in record_keys(iter_raw_records(source_file)):
+        digest = record_hash(record)
+        new_hashes[key] = digest
+
+        if old_hashes.get(key) == digest and key in old_sessions:
+            sessions = old_sessions[key]
+        else:
+            sessions = convert_record(record)
+            reparsed += 1
+            if key not in old_hashes:
+                delta["added"].extend(sessions)
+            elif sessions != old_sessions.get(key):
+                delta["changed"].append({
+                    "key": key,
+                    "before": old_sessions.get(key, []),
+                    "after": sessions
+                })
+
+        new_counts[key] = len(sessions)
+        timetable.extend(sessions)
+
+    for key in old_hashes:
+        if key not in new_hashes:
+            delta["removed"].extend(old_sessions.get(key, []))
+
+    changed = any(delta.values())
+    if changed or full_build:
+        with JSONArrayWriter(OUTPUT_FILE) as out:
+            for session in timetable:
+                out.write(session)
+        write_columnar(encode_columnar(timetable))
+        write_shards(timetable)
+        write_search_index(build_search_index(timetable))
+        lookups = build_lookups(timetable)
+        write_if_changed(PROFESSORS_FILE, lookups.professors())
+        write_if_changed(CLASSROOMS_FILE, lookups.classrooms())
+        build_occupancy_file(timetable)
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            "source": os.path.basename(source_file),
+            "rules": fingerprint,
+            "output": file_sha256(OUTPUT_FILE),
+            "records": new_hashes,
+            "sessions": new_counts
+        }, f, ensure_ascii=False)
+
+    summary = {
+        "records": len(new_hashes),
+        "reparsed": reparsed,
+        "added": len(delta["added"]),
+        "removed": len(delta["removed"]),
+        "changed": len(delta["changed"]),
+        "full_build": full_build
+    }
+    with open(DELTA_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"summary": summary, **delta}, f, ensure_ascii=False, indent=2, default=json_default)
+
+    print(f"--- 증분 변환 ({source_file}) ---")
+    if full_build:
+        print(f"⚠️ 전체 변환: {full_build} - 이전 결과와 비교하지 않으므로 모든 세션이 '추가'로 기록됩니다.")
+    print(f"원본 레코드: {summary['records']}개, 다시 파싱: {reparsed}개")
+    print(f"세션 추가 {summary['added']}개 / 삭제 {summary['removed']}개 / 변경된 과목 {summary['changed']}개")
+    if changed or full_build:
+        print(f"✅ {OUTPUT_FILE}, {PROFESSORS_FILE}, {CLASSROOMS_FILE} 갱신")
+    else:
+        print("변경 사항 없음 - 출력 파일을 그대로 둡니다.")
+    print(f"변경 내역: {DELTA_FILE}")
+    return summary
+
+
+if __name__ == "__main__":
+    convert_incremental()
@@ -0,0 +1,238 @@
+"""
+변환 파이프라인 계측 (opt-in)
+
+converter.py, convert_school_to_webapp.py, normalize_timetable.py, extract_all_complete.py에
+--profile 리포트.json을 주면 켜지고, 주지 않으면 모든 훅이 플래그 검사 한 번으로 끝납니다.
+기록 항목:
+ - 단계별 실제 경과 시간과 초당 레코드 수 (stage 컨텍스트)
+ - 최대 RSS(resource.getrusage)와 tracemalloc 최대 메모리 / 상위 할당 위치
+   (상위 할당은 추적 메모리가 가장 컸던 단계가 끝난 시점의 스냅숏)
+ - 슬롯 정규식 분기별 매치 수 (time_slots.py의 ROOM_FIRST / DAY_FIRST / MULTI_PERIOD / 불일치, 레코드 기준)
+ - ONLINE으로 떨어진 레코드 수 (이유별) 등 스크립트별 카운터
+tracemalloc이 켜진 상태로 재므로 시간은 평소보다 느리게 나옵니다 (같은 조건의 실행끼리 비교).
+리포트는 키 정렬 JSON이라 실행끼리 diff 하기 쉽고, compare 명령으로 두 리포트의 차이를 출력합니다.
+
+사용법:
+    python3 converter.py --profile run_a.json
+    python3 instrumentation.py compare run_a.json run_b.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from time_slots import cache_stats, slot_patterns
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FORMAT_VERSION = 1
+TOP_ALLOCATIONS = 10
+
+active = False
+_counters = Counter()
+_stages = {}
+_run = {}
+_snapshot = {"traced": -1, "stage": None, "snapshot": None}
+
+
+def start(script, report_path):
+    """계측 시작 - report_path가 없으면 아무것도 하지 않음"""
+    global active
+    if not report_path:
+        return
+    active = True
+    _counters.clear()
+    _stages.clear()
+    _snapshot.update(traced=-1, stage=None, snapshot=None)
+    _run.update(
+        script=script,
+        report_path=report_path,
+        argv=sys.argv[1:],
+        started_at=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        started=time.perf_counter(),
+    )
+    tracemalloc.start()
+
+
+def enable_counters():
+    """카운터만 켬 (extract_all_complete.py의 워커 프로세스용 - 리포트는 부모 프로세스가 씀)"""
+    global active
+    active = True
+    _counters.clear()           # fork로 물려받은 부모 카운터는 부모가 이미 셈
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def count(name, n=1):
+    if active:
+        _counters[name] += n
+
+
+def count_slots(time_str):
+    """슬롯 문자열 조각마다 어느 정규식 분기로 읽혔는지 집계 (분류 결과는 캐시됨)"""
+    if active:
+        for name in slot_patterns(time_str):
+            _counters[f"slot_regex.{name}"] += 1
+
+
+def take_counters():
+    counters = dict(_counters)
+    _counters.clear()
+    return counters
+
+
+def merge_counters(counters):
+    if active:
+        _counters.update(counters)
+
+
+class StageTimer:
+    def __init__(self):
+        self.records = 0
+
+    def add(self, n=1):
+        self.records += n
+
+
+@contextmanager
+def stage(name):
+    """with stage('convert') as timer: ... timer.add(n) - 같은 이름은 시간/레코드를 누적"""
+    timer = StageTimer()
+    started = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        if active:
+            entry = _stages.setdefault(name, {"calls": 0, "records": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["records"] += timer.records
+            entry["seconds"] += time.perf_counter() - started
+            traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else -1
+            if traced > _snapshot["traced"]:
+                _snapshot.update(traced=traced, stage=name, snapshot=tracemalloc.take_snapshot())
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _where(frame):
+    path = os.path.relpath(frame.filename)
+    return f"{frame.filename if path.startswith('..') else path}:{frame.lineno}"
+
+
+def top_allocations(snapshot, limit=TOP_ALLOCATIONS):
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    return [
+        {"where": _where(stat.traceback[0]), "kb": round(stat.size / 1024, 1), "blocks": stat.count}
+        for stat in snapshot.statistics('lineno')[:limit]
+    ]
+
+
+def finish(**sections):
+    """리포트를 쓰고 dict 반환 (꺼져 있으면 None) - sections는 스크립트별 추가 항목"""
+    global active
+    if not active or not _run:
+        return None
+    wall = time.perf_counter() - _run["started"]
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    snapshot = _snapshot["snapshot"] or tracemalloc.take_snapshot()
+    report = {
+        "version": FORMAT_VERSION,
+        "script": _run["script"],
+        "argv": _run["argv"],
+        "started_at": _run["started_at"],
+        "wall_seconds": round(wall, 3),
+        "stages": {
+            name: {
+                "calls": entry["calls"],
+                "records": entry["records"],
+                "seconds": round(entry["seconds"], 3),
+                "records_per_sec": round(entry["records"] / entry["seconds"]) if entry["seconds"] else None,
+            }
+            for name, entry in _stages.items()
+        },
+        "counters": dict(sorted(_counters.items())),
+        "memory": {
+            "peak_rss_kb": peak_rss_kb(),
+            "tracemalloc_peak_kb": round(traced_peak / 1024, 1),
+            "top_allocations_stage": _snapshot["stage"],
+            "top_allocations": top_allocations(snapshot),
+        },
+        "slot_cache": cache_stats(),
+    }
+    report.update(sections)
+    tracemalloc.stop()
+    active = False
+
+    with open(_run["report_path"], 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f"📈 계측 리포트 저장: {_run['report_path']} (경과 {wall:.2f}초, 최대 RSS {report['memory']['peak_rss_kb']}KB)")
+    return report
+
+
+def compare_reports(old, new):
+    """두 실행 리포트의 단계 시간 / 처리량 / 카운터 / 메모리 차이 출력"""
+    print(f"--- {old['script']} {old['started_at']} 대비 {new['started_at']} ---")
+    for name, stats in new["stages"].items():
+        before = old["stages"].get(name)
+        if not before:
+            print(f"  ➕ {name:<28} {stats['seconds']:>8.3f}s ({stats['records']}건)")
+            continue
+        change = (stats["seconds"] - before["seconds"]) / before["seconds"] if before["seconds"] else 0.0
+        mark = '🔴' if change > 0.1 else ('✅' if change < -0.1 else '  ')
+        print(f"  {mark} {name:<28} {before['seconds']:>8.3f}s -> {stats['seconds']:>8.3f}s ({change:+.1%}), "
+              f"{before['records']} -> {stats['records']}건")
+    for name in old["stages"]:
+        if name not in new["stages"]:
+            print(f"  ➖ {name:<28} {old['stages'][name]['seconds']:>8.3f}s (이번 실행에 없음)")
+
+    names = sorted(set(old["counters"]) | set(new["counters"]))
+    changed = [(name, old["counters"].get(name, 0), new["counters"].get(name, 0)) for name in names]
+    changed = [(name, a, b) for name, a, b in changed if a != b]
+    if changed:
+        print("  카운터 변화:")
+        for name, a, b in changed:
+            print(f"    ⚠️ {name}: {a} -> {b} ({b - a:+d})")
+    else:
+        print("  ✅ 카운터 변화 없음")
+
+    for key in ("peak_rss_kb", "tracemalloc_peak_kb"):
+        a, b = old["memory"].get(key), new["memory"].get(key)
+        if a is not None and b is not None:
+            print(f"  {key}: {a} -> {b}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변환 계측 리포트 비교")
+    sub = parser.add_subparsers(dest='command', required=True)
+    compare = sub.add_parser('compare', help="두 리포트 비교")
+    compare.add_argument('old')
+    compare.add_argument('new')
+    args = parser.parse_args()
+
+    with open(args.old, 'r', encoding='utf-8') as f:
+        old = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+    compare_reports(old, new)
+
+
+if __name__ == "__main__":
+    main()
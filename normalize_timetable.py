@@ -1,7 +1,10 @@
+import argparse
 import json
 import re
 from collections import Counter
 
+import instrumentation
+
 INPUT = "개설강좌 리스트.json"
 OUTPUT = "timetable_flat.json"
 
@@ -24,6 +27,7 @@ def normalize_record(rec: dict) -> dict:
     # 1) If code contains both code and title (e.g., "GEN22102 채플2"), split.
     m = code_title_pattern.match(code)
     if m:
+        instrumentation.count("regex.code_title")
         code_only = m.group("code").strip()
         title_from_code = m.group("title").strip()
         # If subject is missing or looks like a credit-only value, use title from code
@@ -34,6 +38,7 @@ def normalize_record(rec: dict) -> dict:
     # 2) If subject includes credit/grade/class tail, strip it to keep only the title
     m2 = subject_tail_pattern.match(subject)
     if m2:
+        instrumentation.count("regex.subject_tail")
         subject = m2.group("title").strip()
 
     # Whitespace normalize professor
@@ -62,8 +67,22 @@ def normalize_record(rec: dict) -> dict:
 
 
 def main():
-    with open(INPUT, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    parser = argparse.ArgumentParser(description=f"{INPUT} -> {OUTPUT} 정규화")
+    parser.add_argument('--profile', metavar='REPORT', help="단계 시간/메모리/정규식 매치 계측 리포트 저장 (instrumentation.py)")
+    args = parser.parse_args()
+
+    instrumentation.start('normalize_timetable.py', args.profile)
+    try:
+        normalize_file()
+    finally:
+        instrumentation.finish()
+
+
+def normalize_file():
+    with instrumentation.stage('load') as timer:
+        with open(INPUT, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        timer.add(len(data))
 
     total = len(data)
     fixed_code_title = 0
@@ -71,21 +90,23 @@ def main():
     numeric_subject_fixed = 0
 
     normalized = []
-    for rec in data:
-        before_code = rec.get("code")
-        before_subject = rec.get("subject")
+    with instrumentation.stage('normalize') as timer:
+        for rec in data:
+            before_code = rec.get("code")
+            before_subject = rec.get("subject")
 
-        new_rec = normalize_record(rec)
+            new_rec = normalize_record(rec)
 
-        # Counters (approximate):
-        if before_code and isinstance(before_code, str) and code_title_pattern.match(before_code):
-            fixed_code_title += 1
-        if before_subject and isinstance(before_subject, str) and subject_tail_pattern.match(before_subject):
-            fixed_subject_tail += 1
-        if before_subject and isinstance(before_subject, str) and re.fullmatch(r"\d+(?:\.\d+)?", before_subject):
-            numeric_subject_fixed += 1
+            # Counters (approximate):
+            if before_code and isinstance(before_code, str) and code_title_pattern.match(before_code):
+                fixed_code_title += 1
+            if before_subject and isinstance(before_subject, str) and subject_tail_pattern.match(before_subject):
+                fixed_subject_tail += 1
+            if before_subject and isinstance(before_subject, str) and re.fullmatch(r"\d+(?:\.\d+)?", before_subject):
+                numeric_subject_fixed += 1
 
-        normalized.append(new_rec)
+            normalized.append(new_rec)
+        timer.add(len(data))
 
     # Stats
     profs = sorted(set([clean_text(r.get("professor", "")) for r in normalized if clean_text(r.get("professor", ""))]))
@@ -99,8 +120,10 @@ def main():
     print(f"숫자만 있는 과목명 보정 건수: ~{numeric_subject_fixed}건")
     print(f"교수 수: {len(profs)}명")
 
-    with open(OUTPUT, "w", encoding="utf-8") as f:
-        json.dump(normalized, f, ensure_ascii=False, indent=2)
+    with instrumentation.stage('write') as timer:
+        with open(OUTPUT, "w", encoding="utf-8") as f:
+            json.dump(normalized, f, ensure_ascii=False, indent=2)
+        timer.add(len(normalized))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""
+강의실별 주간 점유 비트맵 인덱스
+
+물리적 강의실마다 월~토 주간 점유 상태를 5분 단위 비트셋으로 미리 계산해 둡니다.
+"D요일 t1~t2에 비어 있는 강의실"은 세션 전체를 훑는 대신 강의실당 비트마스크 AND 한 번으로 판정합니다.
+
+비트 배치: 강의실 하나 = DAYS x SLOTS_PER_DAY 비트 (little-endian)
+    bit = day_index * SLOTS_PER_DAY + (분 - DAY_START_MINUTE) // SLOT_MINUTES
+파일(room_occupancy.json)에는 강의실 순서 목록과 전체 비트맵(base64)이 들어갑니다.
+
+사용법:
+    python3 occupancy.py                      # timetable.json -> room_occupancy.json
+    python3 occupancy.py free MON 10:00 11:00 # 해당 시간대 빈 강의실
+"""
+import argparse
+import base64
+import json
+
+from time_slots import time_to_minutes
+
+OCCUPANCY_FILE = 'room_occupancy.json'
+FORMAT_VERSION = 1
+
+DAYS = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT']
+SLOT_MINUTES = 5
+DAY_START_MINUTE = 7 * 60   # 07:00
+DAY_END_MINUTE = 23 * 60    # 23:00
+SLOTS_PER_DAY = (DAY_END_MINUTE - DAY_START_MINUTE) // SLOT_MINUTES
+ROOM_BITS = len(DAYS) * SLOTS_PER_DAY
+ROOM_BYTES = (ROOM_BITS + 7) // 8
+
+
+def room_key(building, room):
+    return f"{building}-{room}"
+
+
+def physical_rooms(timetable):
+    """
+    시간표에 나오는 (건물, 강의실) 목록 - 건물명, 호실 번호 순
+    (classrooms.json과 같은 정렬이지만 ONLINE 세션에만 나오는 강의실은 제외)
+    """
+    rooms = {
+        ((item.get('building_name') or '').strip(), (item.get('classroom') or '').strip())
+        for item in timetable
+        if item.get('day') != 'ONLINE'
+    }
+    rooms = [(b, r) for b, r in rooms if b and r]
+    return sorted(rooms, key=lambda x: (x[0], int(''.join(filter(str.isdigit, x[1])) or 0), x[1]))
+
+
+def interval_mask(day, start_minute, end_minute):
+    """day의 [start, end) 구간과 겹치는 슬롯 비트를 모두 켠 마스크 (범위를 벗어난 부분은 잘라냄)
+    end <= start인 빈/뒤집힌 구간은 ValueError (모든 강의실이 비어 있다고 답하지 않도록)"""
+    if end_minute <= start_minute:
+        raise ValueError("끝 시각은 시작 시각보다 늦어야 합니다.")
+    if day not in DAYS:
+        return 0
+    start = max(start_minute, DAY_START_MINUTE) - DAY_START_MINUTE
+    end = min(end_minute, DAY_END_MINUTE) - DAY_START_MINUTE
+    if end <= start:
+        return 0
+    first = start // SLOT_MINUTES
+    last = -(-end // SLOT_MINUTES)  # 올림: 걸치기만 해도 점유
+    offset = DAYS.index(day) * SLOTS_PER_DAY
+    return ((1 << (last - first)) - 1) << (offset + first)
+
+
+class OccupancyIndex:
+    def __init__(self, rooms, bitsets):
+        self.rooms = rooms              # [(building, room), ...]
+        self.bitsets = bitsets          # 강의실별 int 비트셋
+        self._positions = {room_key(b, r): i for i, (b, r) in enumerate(rooms)}
+
+    @classmethod
+    def build(cls, timetable, rooms=None):
+        rooms = rooms or physical_rooms(timetable)
+        index = cls(rooms, [0] * len(rooms))
+        skipped = 0
+        for item in timetable:
+            if item.get('day') not in DAYS or not item.get('start') or not item.get('end'):
+                continue
+            position = index._positions.get(room_key(
+                (item.get('building_name') or '').strip(), (item.get('classroom') or '').strip()
+            ))
+            start, end = time_to_minutes(item['start']), time_to_minutes(item['end'])
+            if position is None or end <= start:
+                skipped += 1
+                continue
+            index.bitsets[position] |= interval_mask(item['day'], start, end)
+        index.skipped = skipped
+        return index
+
+    def to_dict(self):
+        blob = b''.join(bits.to_bytes(ROOM_BYTES, 'little') for bits in self.bitsets)
+        return {
+            "version": FORMAT_VERSION,
+            "days": DAYS,
+            "slot_minutes": SLOT_MINUTES,
+            "day_start_minute": DAY_START_MINUTE,
+            "slots_per_day": SLOTS_PER_DAY,
+            "room_bytes": ROOM_BYTES,
+            "rooms": [room_key(b, r) for b, r in self.rooms],
+            "bitmap": base64.b64encode(blob).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        if (payload["slot_minutes"], payload["day_start_minute"], payload["slots_per_day"]) != \
+                (SLOT_MINUTES, DAY_START_MINUTE, SLOTS_PER_DAY):
+            raise ValueError("room_occupancy.json의 슬롯 설정이 현재 코드와 다릅니다. 다시 생성하세요.")
+        blob = base64.b64decode(payload["bitmap"])
+        size = payload["room_bytes"]
+        rooms = [tuple(key.split('-', 1)) for key in payload["rooms"]]
+        bitsets = [
+            int.from_bytes(blob[i * size:(i + 1) * size], 'little')
+            for i in range(len(rooms))
+        ]
+        return cls(rooms, bitsets)
+
+    def save(self, path=OCCUPANCY_FILE):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path=OCCUPANCY_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def is_free(self, building, room, day, start, end):
+        """start/end는 'HH:MM' 문자열"""
+        position = self._positions.get(room_key(building, room))
+        if position is None:
+            raise KeyError(room_key(building, room))
+        mask = interval_mask(day, time_to_minutes(start), time_to_minutes(end))
+        return not (self.bitsets[position] & mask)
+
+    def free_rooms(self, day, start, end, building=None):
+        """day의 start~end 동안 비어 있는 (building, room) 목록"""
+        mask = interval_mask(day, time_to_minutes(start), time_to_minutes(end))
+        return [
+            room for room, bits in zip(self.rooms, self.bitsets)
+            if not (bits & mask) and (building is None or room[0] == building)
+        ]
+
+    def occupied_rooms(self, day, time):
+        """day의 time 시점에 사용 중인 (building, room) 목록"""
+        minute = time_to_minutes(time)
+        mask = interval_mask(day, minute, minute + 1)
+        return [room for room, bits in zip(self.rooms, self.bitsets) if bits & mask]
+
+
+def build_occupancy_file(timetable, path=OCCUPANCY_FILE):
+    index = OccupancyIndex.build(timetable)
+    index.save(path)
+    print(f"✅ {path} 생성 완료 ({len(index.rooms)}개 강의실, 강의실당 {ROOM_BYTES}바이트)")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의실 주간 점유 비트맵")
+    sub = parser.add_subparsers(dest='command')
+    free = sub.add_parser('free', help="빈 강의실 조회")
+    free.add_argument('day', choices=DAYS)
+    free.add_argument('start', help="HH:MM")
+    free.add_argument('end', help="HH:MM")
+    free.add_argument('--building', help="건물명으로 제한")
+    args = parser.parse_args()
+
+    if args.command == 'free':
+        index = OccupancyIndex.load()
+        try:
+            rooms = index.free_rooms(args.day, args.start, args.end, args.building)
+        except ValueError as e:
+            print(f"🔴 {e}")
+            return
+        print(f"{args.day} {args.start}-{args.end} 빈 강의실: {len(rooms)}개")
+        for building, room in rooms:
+            print(f"  {building} {room}")
+        return
+
+    with open('timetable.json', 'r', encoding='utf-8') as f:
+        timetable = json.load(f)
+    build_occupancy_file(timetable)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+PDF 페이지 단위 추출 캐시
+
+pdfplumber의 extract_text / extract_tables 결과(원시 텍스트와 표 셀)를 디스크에 저장해,
+extract_all_complete.py의 행 매핑 로직만 고쳐서 다시 돌릴 때 레이아웃 분석을 건너뜁니다.
+ - 키: PDF 파일 해시(SHA-256) + 페이지 번호 + 호출 인자(표 설정/허용 오차)
+ - 저장: <cache_dir>/<pdf 해시 앞 16자>/<페이지>.json
+ - 용량 제한: 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 페이지 파일부터 삭제
+
+사용법:
+    python3 pdf_cache.py stats
+    python3 pdf_cache.py invalidate [PDF 경로]   # 경로를 주면 해당 PDF만, 없으면 전체 삭제
+    python3 pdf_cache.py invalidate 3f9a0c1d      # 캐시 키(또는 키 앞부분)로 삭제 - PDF가 이미 없을 때
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+DEFAULT_CACHE_DIR = '.pdf_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+KEY_LENGTH = 16
+HEX_DIGITS = set('0123456789abcdef')
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def call_key(kind, kwargs):
+    return kind + ':' + json.dumps(kwargs, sort_keys=True)
+
+
+class CachedPage:
+    """pdfplumber 페이지 대신 쓰는 객체 - 같은 인자의 호출은 캐시에서 응답"""
+
+    def __init__(self, cache, path, loader):
+        self._cache = cache
+        self._path = path
+        self._loader = loader
+        self._page = None
+        self._entries = cache.read(path)
+
+    def _call(self, kind, kwargs, compute, cached_errors=()):
+        """cached_errors: 같은 페이지/인자면 항상 같은 결과인 예외만 - 캐시해 두고 같은 형으로 다시 던짐
+        (그 밖의 예외는 캐시하지 않고 그대로 전파되어 다음 실행에서 다시 시도됨)"""
+        key = call_key(kind, kwargs)
+        entry = self._entries.get(key)
+        # 예전 형식의 {"error": ...}(모든 예외를 캐시하던 항목)는 무시하고 다시 계산
+        if entry is not None and ("value" in entry or "table_error" in entry):
+            self._cache.hits += 1
+        else:
+            self._cache.misses += 1
+            if self._page is None:
+                self._page = self._loader()
+            try:
+                entry = {"value": compute(self._page)}
+            except cached_errors as e:
+                entry = {"table_error": str(e)}
+            self._entries[key] = entry
+            self._cache.write(self._path, self._entries)
+
+        if "table_error" in entry:
+            raise ValueError(entry["table_error"])
+        return entry["value"]
+
+    def extract_text(self, **kwargs):
+        return self._call('text', kwargs, lambda page: page.extract_text(**kwargs))
+
+    def extract_tables(self, table_settings=None):
+        # pdfplumber는 페이지에 맞지 않는 표 설정(예: 선 목록 없는 explicit 전략)을 ValueError로 거부함
+        # -> extract_all_complete.py가 '이 설정 실패'로 처리하는 결정적 실패라 캐시
+        return self._call(
+            'tables', table_settings or {},
+            lambda page: page.extract_tables(table_settings=table_settings),
+            cached_errors=(ValueError,)
+        )
+
+
+class PageCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._pdf_keys = {}
+
+    def pdf_key(self, pdf_path):
+        stat = os.stat(pdf_path)
+        marker = (os.path.abspath(pdf_path), stat.st_size, stat.st_mtime_ns)
+        if marker not in self._pdf_keys:
+            self._pdf_keys[marker] = file_hash(pdf_path)[:KEY_LENGTH]
+        return self._pdf_keys[marker]
+
+    def pin_key(self, pdf_path, key):
+        """부모 프로세스가 계산한 pdf_path의 키를 등록 (워커가 PDF 전체를 다시 해시하지 않도록)"""
+        stat = os.stat(pdf_path)
+        self._pdf_keys[(os.path.abspath(pdf_path), stat.st_size, stat.st_mtime_ns)] = key
+
+    def page(self, pdf, pdf_path, index):
+        """pdf.pages[index]를 캐시로 감싼 CachedPage 반환 (캐시 적중 시 페이지를 열지 않음)"""
+        path = os.path.join(self.cache_dir, self.pdf_key(pdf_path), f"{index}.json")
+        return CachedPage(self, path, lambda: pdf.pages[index])
+
+    def read(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        os.utime(path)  # LRU 기준 시각 갱신
+        return entries
+
+    def write(self, path, entries):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _files(self):
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.json'):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 페이지 파일 삭제, 삭제 개수 반환"""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def invalidate(self, target=None):
+        """target(PDF 경로 또는 캐시 키/키 앞부분)의 캐시만 (없으면 전체) 삭제, 지운 디렉터리 수 반환
+        PDF 파일도 아니고 16진수 키도 아니면 FileNotFoundError"""
+        if not target:
+            dirs = [self.cache_dir]
+        elif os.path.isfile(target):
+            dirs = [os.path.join(self.cache_dir, self.pdf_key(target))]
+        elif set(target) <= HEX_DIGITS and len(target) <= KEY_LENGTH:
+            names = os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+            dirs = [os.path.join(self.cache_dir, name) for name in names if name.startswith(target)]
+        else:
+            raise FileNotFoundError(target)
+        dirs = [path for path in dirs if os.path.isdir(path)]
+        for path in dirs:
+            shutil.rmtree(path)
+        return len(dirs)
+
+    def stats(self):
+        files = self._files()
+        return {
+            "pdfs": len({os.path.dirname(path) for _, _, path in files}),
+            "pages": len(files),
+            "bytes": sum(size for _, size, _ in files),
+            "max_bytes": self.max_bytes
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 페이지 추출 캐시 관리")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stats', help="캐시 크기 확인")
+    invalidate = sub.add_parser('invalidate', help="캐시 삭제")
+    invalidate.add_argument('pdf', nargs='?', help="이 PDF(경로 또는 캐시 키/키 앞부분)의 캐시만 삭제")
+    args = parser.parse_args()
+
+    cache = PageCache(args.cache_dir)
+    if args.command == 'stats':
+        stats = cache.stats()
+        print(f"캐시 위치: {args.cache_dir}")
+        print(f"PDF {stats['pdfs']}개, 페이지 {stats['pages']}개, "
+              f"{stats['bytes'] / 1024 / 1024:.1f}MB / {stats['max_bytes'] / 1024 / 1024:.0f}MB")
+    elif args.command == 'invalidate':
+        try:
+            removed = cache.invalidate(args.pdf)
+        except FileNotFoundError:
+            print(f"🔴 '{args.pdf}'은(는) PDF 파일도 캐시 키도 아닙니다.")
+            return
+        if removed:
+            print(f"✅ 캐시 삭제 완료: {args.pdf or args.cache_dir}")
+        else:
+            print("삭제할 캐시가 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
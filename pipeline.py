@@ -0,0 +1,244 @@
+"""
+데이터 빌드 파이프라인 (단계 의존성 DAG)
+
+converter.py -> normalize_timetable.py -> create_lookups.py -> verify_times.py / test_webapp_data.py ...
+순서대로 손으로 돌리던 스크립트를 단계(입력 파일 -> 출력 파일)로 선언하고 한 번에 실행합니다.
+ - 단계 사이 의존성은 선언된 입력/출력에서 자동으로 만듦 (어떤 단계의 출력을 입력으로 쓰면 그 단계 뒤에 실행)
+ - 입력 지문 = 입력 파일 + 스크립트와 그 스크립트가 import하는 로컬 모듈의 내용 해시(SHA-256)
+   지문이 지난 실행과 같고 출력 파일도 그때 내용 그대로면 건너뜀 (.pipeline_state.json)
+   앞 단계가 다시 돌아도 출력 내용이 같으면 뒤 단계는 건너뜀 (수정 시각이 아니라 내용 기준)
+ - 선행 단계가 끝난 단계들은 별도 프로세스로 동시에 실행 (검증 / 조회 파일 생성 / 겹침 검사 등)
+ - 마지막에 단계별 소요 시간 표
+
+사용법:
+    python3 pipeline.py                    # 바뀐 단계만 실행
+    python3 pipeline.py --force            # 모든 단계 다시 실행
+    python3 pipeline.py --only lookups     # 지정한 단계와 그 선행 단계만
+    python3 pipeline.py --dry-run          # 실행할 단계만 출력
+    python3 pipeline.py --jobs 1 [-v]      # 직렬 실행, 단계 출력 표시
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from build_artifacts import ARTIFACTS
+from converter import OUTPUT_FILE, SOURCE_FILE
+from columnar import COLUMNAR_OUTPUT_FILE
+from create_lookups import CLASSROOMS_FILE, PROFESSORS_FILE
+from fingerprint import local_modules
+from occupancy import OCCUPANCY_FILE
+from search_index import SEARCH_INDEX_FILE
+
+STATE_FILE = '.pipeline_state.json'
+FORMAT_VERSION = 1
+
+
+class Stage:
+    def __init__(self, name, script, args=(), inputs=(), outputs=()):
+        self.name = name
+        self.script = script
+        self.args = list(args)
+        self.inputs = list(inputs)      # 데이터 입력 (스크립트 / 로컬 모듈은 자동으로 추가)
+        self.outputs = list(outputs)
+
+    @property
+    def command(self):
+        return [sys.executable, self.script] + self.args
+
+
+STAGES = [
+    Stage('slot-check', 'time_slots.py'),
+    Stage('db-check', 'timetable_db.py', ['check']),
+    Stage('convert', 'converter.py', ['--skip-conflicts'], [SOURCE_FILE],
+          [OUTPUT_FILE, COLUMNAR_OUTPUT_FILE, 'shards/index.json', SEARCH_INDEX_FILE]),
+    Stage('normalize', 'normalize_timetable.py', [], [SOURCE_FILE], ['timetable_flat.json']),
+    Stage('lookups', 'create_lookups.py', [], [OUTPUT_FILE], [PROFESSORS_FILE, CLASSROOMS_FILE, OCCUPANCY_FILE]),
+    Stage('conflicts', 'conflicts.py', ['--report', 'conflicts_report.json'], [OUTPUT_FILE], ['conflicts_report.json']),
+    Stage('verify', 'verify_times.py', [], [SOURCE_FILE, OUTPUT_FILE]),
+    Stage('webapp-check', 'test_webapp_data.py', [], [OUTPUT_FILE]),
+    Stage('artifacts', 'build_artifacts.py', [], ARTIFACTS, ['dist/manifest.json']),
+]
+
+
+def file_hash(path):
+    """파일 내용 SHA-256 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_graph(stages):
+    """단계 이름 -> 선행 단계 이름 집합 (입력 파일을 출력하는 단계)"""
+    producers = {}
+    for stage in stages:
+        for path in stage.outputs:
+            if path in producers:
+                raise ValueError(f"{path}를 두 단계가 출력합니다: {producers[path]}, {stage.name}")
+            producers[path] = stage.name
+    return {
+        stage.name: {producers[path] for path in stage.inputs if path in producers and producers[path] != stage.name}
+        for stage in stages
+    }
+
+
+def select(graph, names):
+    """지정한 단계 + 모든 선행 단계"""
+    selected = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(graph[name])
+    return selected
+
+
+class Pipeline:
+    def __init__(self, stages=STAGES, state_path=STATE_FILE, jobs=None, force=False, verbose=False):
+        self.stages = {stage.name: stage for stage in stages}
+        self.graph = build_graph(stages)
+        self.state_path = state_path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.force = force
+        self.verbose = verbose
+        self.state = {}
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get("version") == FORMAT_VERSION:
+                self.state = saved["stages"]
+
+    def _save_state(self):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": FORMAT_VERSION, "stages": self.state}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def fingerprint(self, stage):
+        """명령 + 입력 파일 + 코드(로컬 모듈) 내용 해시 -> 하나의 SHA-256"""
+        digest = hashlib.sha256(json.dumps(stage.command[1:]).encode('utf-8'))
+        for path in sorted(set(stage.inputs)) + local_modules(stage.script):
+            digest.update(f"{path}\0{file_hash(path)}\0".encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_current(self, stage, fingerprint):
+        if self.force:
+            return False
+        previous = self.state.get(stage.name)
+        if not previous or previous["fingerprint"] != fingerprint:
+            return False
+        # 출력이 지워졌거나 손으로 고쳐졌으면 다시 실행
+        return all(file_hash(path) == previous["outputs"].get(path) for path in stage.outputs)
+
+    def _execute(self, stage):
+        """(종료 코드, 출력, 소요 시간) - 작업 스레드에서 실행"""
+        start = time.perf_counter()
+        result = subprocess.run(stage.command, capture_output=True, text=True)
+        return result.returncode, result.stdout + result.stderr, time.perf_counter() - start
+
+    def run(self, names=None, dry_run=False):
+        """{단계 이름: (상태, 소요 시간)} - 상태: ran / skipped / failed / blocked"""
+        selected = select(self.graph, names or list(self.stages))
+        order = [name for name in self.stages if name in selected]
+        results = {}
+        running = {}                    # future -> (단계 이름, 입력 지문)
+        started = set()
+        run_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while len(results) < len(order):
+                for name in order:
+                    if name in results or name in started:
+                        continue
+                    deps = self.graph[name] & selected
+                    if any(results.get(dep, ('',))[0] in ('failed', 'blocked') for dep in deps):
+                        results[name] = ('blocked', 0.0)
+                        print(f"⏸️ {name}: 선행 단계 실패로 건너뜀")
+                        continue
+                    if not all(dep in results for dep in deps):
+                        continue
+                    stage = self.stages[name]
+                    if dry_run and any(results[dep][0] == 'ran' for dep in deps):
+                        # 선행 단계 출력이 아직 없으므로 지금 지문으로는 판단할 수 없음
+                        results[name] = ('ran', 0.0)
+                        print(f"▶️ {name}: 선행 단계 실행 후 다시 확인")
+                        continue
+                    # 선행 단계가 끝난 뒤에 지문 계산 (그 단계의 새 출력이 반영됨)
+                    fingerprint = self.fingerprint(stage)
+                    if self.is_current(stage, fingerprint):
+                        results[name] = ('skipped', 0.0)
+                        print(f"⏭️ {name}: 최신 상태")
+                    elif dry_run:
+                        results[name] = ('ran', 0.0)
+                        print(f"▶️ {name}: {' '.join(stage.command[1:])}")
+                    else:
+                        print(f"▶️ {name} 시작")
+                        running[pool.submit(self._execute, stage)] = (name, fingerprint)
+                        started.add(name)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, fingerprint = running.pop(future)
+                    stage = self.stages[name]
+                    returncode, output, elapsed = future.result()
+                    if self.verbose or returncode:
+                        for line in output.rstrip().splitlines():
+                            print(f"  [{name}] {line}")
+                    if returncode:
+                        results[name] = ('failed', elapsed)
+                        self.state.pop(name, None)
+                        print(f"🔴 {name} 실패 (종료 코드 {returncode}, {elapsed:.2f}초)")
+                    else:
+                        results[name] = ('ran', elapsed)
+                        self.state[name] = {
+                            "fingerprint": fingerprint,
+                            "outputs": {path: file_hash(path) for path in stage.outputs},
+                            "seconds": round(elapsed, 3),
+                        }
+                        print(f"✅ {name} 완료 ({elapsed:.2f}초)")
+                    self._save_state()
+
+        self.wall_time = time.perf_counter() - run_start
+        return {name: results[name] for name in order}
+
+
+def print_timings(results, wall_time):
+    labels = {'ran': "실행", 'skipped': "최신", 'failed': "실패", 'blocked': "중단"}
+    total = sum(elapsed for _, elapsed in results.values())
+    print("\n--- 단계별 소요 시간 ---")
+    for name, (status, elapsed) in results.items():
+        share = elapsed / total * 100 if total else 0
+        print(f"  {name:<14} {labels[status]:<4} {elapsed:7.2f}초 {share:5.1f}% {'█' * int(share // 4)}")
+    print(f"  단계 합계 {total:.2f}초 / 실제 경과 {wall_time:.2f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 빌드 파이프라인")
+    parser.add_argument('--only', nargs='+', choices=[stage.name for stage in STAGES], help="실행할 단계 (선행 단계 포함)")
+    parser.add_argument('--force', action='store_true', help="최신 상태여도 다시 실행")
+    parser.add_argument('--jobs', type=int, help="동시에 실행할 단계 수 (기본: CPU 수)")
+    parser.add_argument('--dry-run', action='store_true', help="실행하지 않고 계획만 출력")
+    parser.add_argument('-v', '--verbose', action='store_true', help="단계 출력 표시")
+    args = parser.parse_args()
+
+    pipeline = Pipeline(jobs=args.jobs, force=args.force, verbose=args.verbose)
+    results = pipeline.run(args.only, args.dry_run)
+    if not args.dry_run:
+        print_timings(results, pipeline.wall_time)
+    if any(status in ('failed', 'blocked') for status, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,20 @@ let timetableData = [];
 let professorsList = [];
 let classroomsList = [];
 
+// timetable.json 행 번호 -> 세션 (샤드를 받는 대로 채워지므로 그 전까지는 비어 있는 칸이 있음)
+let sessionRows = [];
+// professors.json / classrooms.json의 포스팅 목록: 교수 이름, '건물-강의실' -> 행 번호 목록
+let professorSessions = new Map();
+let classroomSessions = new Map();
+
 // 성능 최적화: 인덱싱된 데이터 캐시
 let timetableByDay = {};
 let allPhysicalRooms = [];
+
+// 요일 샤드(shards.py): 홈 화면은 오늘 샤드만 먼저 받고, 나머지는 검색/시간표 탭에서 필요할 때 받음
+let shardIndex = null;
+let loadedShards = {};
+let fullTimetablePromise = null;
 let cachedRealTimeData = { time: null, data: null };
 
 // 성능 최적화: DOM 요소 캐시
@@ -28,6 +39,234 @@ const RESIZE_DEBOUNCE_MS = 150;
 const LARGE_CLASS_THRESHOLD = 100;  // 대형 강의 기준 (명)
 
 // ===== 데이터 로드 =====
+
+// 컬럼형 시간표(timetable.columnar.json) 디코더 - columnar.py와 같은 규칙
+// 문자열 필드는 사전 인덱스, day는 days 인덱스, start/end는 자정 기준 분(-1 = 없음)
+const COLUMNAR_TIME_FIELDS = new Set(['start', 'end']);
+const COLUMNAR_INT_FIELDS = new Set(['student_count']);
+
+function minutesToTimeString(minutes) {
+    if (minutes < 0) return '';
+    return `${String(Math.floor(minutes / 60)).padStart(2, '0')}:${String(minutes % 60).padStart(2, '0')}`;
+}
+
+function decodeColumnarTimetable(payload) {
+    const { count, fields, days, strings, columns } = payload;
+    const records = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const record = {};
+        for (const field of fields) {
+            const value = columns[field][i];
+            if (field === 'day') {
+                record[field] = days[value];
+            } else if (COLUMNAR_TIME_FIELDS.has(field)) {
+                record[field] = minutesToTimeString(value);
+            } else if (COLUMNAR_INT_FIELDS.has(field)) {
+                record[field] = value;
+            } else {
+                record[field] = strings[field][value];
+            }
+        }
+        records[i] = record;
+    }
+    return records;
+}
+
+// build_artifacts.py가 만든 manifest: 논리 이름 -> 콘텐츠 해시 파일 경로
+const ARTIFACT_MANIFEST_URL = 'dist/manifest.json';
+let artifactManifest = null;
+
+async function loadArtifactManifest() {
+    try {
+        // manifest만 매번 재검증하고, 해시 파일은 브라우저 캐시를 그대로 사용
+        const res = await fetch(ARTIFACT_MANIFEST_URL, { cache: 'no-cache' });
+        if (res.ok) return await res.json();
+    } catch (error) {
+        console.warn('manifest.json 로드 실패, 원본 파일 사용:', error);
+    }
+    return null;
+}
+
+function fetchArtifact(manifest, name) {
+    const entry = manifest && manifest.files && manifest.files[name];
+    if (entry) {
+        return fetch(new URL(entry.path, new URL(ARTIFACT_MANIFEST_URL, location.href)));
+    }
+    // 빌드가 없으면 원본 파일을 재검증(ETag/Last-Modified)해서 사용
+    return fetch(name, { cache: 'no-cache' });
+}
+
+async function loadShardIndex(manifest) {
+    try {
+        const res = await fetchArtifact(manifest, 'shards/index.json');
+        if (res.ok) return await res.json();
+    } catch (error) {
+        console.warn('샤드 인덱스 로드 실패, 전체 시간표 사용:', error);
+    }
+    return null;
+}
+
+// 샤드 파일명에 내용 해시가 들어 있으므로 브라우저 기본 캐시를 그대로 사용
+async function fetchShard(entry) {
+    const res = await fetch(entry.path);
+    if (!res.ok) throw new Error(`HTTP error! Status: ${res.status}`);
+    const payload = await res.json();
+    const records = decodeColumnarTimetable(payload);
+    // 샤드의 rows(차분 인코딩)로 각 세션을 timetable.json 행 번호 자리에 등록
+    if (payload.rows) {
+        deltaDecode(payload.rows).forEach((row, i) => { sessionRows[row] = records[i]; });
+    }
+    return records;
+}
+
+// 전체 시간표가 필요할 때 호출 - 아직 받지 않은 요일 샤드를 받아 timetableData를 채움
+function ensureFullTimetable() {
+    if (!shardIndex) return Promise.resolve(timetableData);
+    if (!fullTimetablePromise) {
+        fullTimetablePromise = Promise.all(Object.entries(shardIndex.days).map(([day, entry]) =>
+            loadedShards[day] ? Promise.resolve(loadedShards[day]) : fetchShard(entry)
+        )).then(parts => {
+            // 모든 샤드가 등록되면 sessionRows가 곧 timetable.json 순서 (rows가 없는 옛 샤드는 요일 순으로 이어 붙임)
+            const flat = parts.flat();
+            const complete = sessionRows.length === flat.length && flat.every((_, i) => sessionRows[i]);
+            timetableData = complete ? sessionRows.slice() : flat;
+            timetableByDay = indexTimetableByDay(timetableData);
+            return timetableData;
+        }).catch(error => {
+            fullTimetablePromise = null;
+            throw error;
+        });
+    }
+    return fullTimetablePromise;
+}
+
+// 과목 검색 인덱스(search_index.json) 리더 - search_index.py와 같은 규칙
+// 과목명 1/2-gram, 초성 1/2-gram, 과목코드 접두어 -> 포스팅 목록(차분 인코딩)
+const CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ';
+let subjectSearchPromise = null;
+let sessionsBySection = null;
+let sessionsBySectionSource = null;
+
+function normalizeSearchText(text) {
+    return (text || '').replace(/\s+/g, '').toLowerCase();
+}
+
+function toChoseong(text) {
+    return Array.from(text, ch => {
+        const code = ch.charCodeAt(0);
+        return code >= 0xAC00 && code <= 0xD7A3 ? CHOSEONG[Math.floor((code - 0xAC00) / 588)] : ch;
+    }).join('');
+}
+
+function deltaDecode(deltas) {
+    let total = 0;
+    return deltas.map(delta => (total += delta));
+}
+
+function buildSubjectSearch(payload) {
+    const { subjects, codes, sections, grams, choseong, prefixes } = payload;
+    const prefixLength = payload.prefix_length;
+    const bySubject = subjects.map(() => []);
+    const byCode = codes.map(() => []);
+    sections.forEach(([codeId, , subjectId], i) => {
+        bySubject[subjectId].push(i);
+        byCode[codeId].push(i);
+    });
+    const normalized = subjects.map(normalizeSearchText);
+    const normalizedChoseong = normalized.map(toChoseong);
+
+    function matchSubjects(query, postings, texts) {
+        const chars = Array.from(query);
+        const queryGrams = chars.length === 1 ? chars : chars.slice(1).map((ch, i) => chars[i] + ch);
+        let candidates = null;
+        for (const gram of queryGrams) {
+            const deltas = postings[gram];
+            if (!deltas) return [];
+            const ids = deltaDecode(deltas);
+            candidates = candidates === null ? ids : ids.filter(id => candidates.includes(id));
+        }
+        // 2-gram 교집합은 후보일 뿐이므로 실제 포함 여부 확인
+        return candidates.filter(id => texts[id].includes(query));
+    }
+
+    return {
+        // 질의와 맞는 분반 키('과목코드|분반') 목록 (시간표에 처음 나온 순)
+        search(rawQuery) {
+            const query = normalizeSearchText(rawQuery);
+            if (!query) return [];
+            const isChoseong = Array.from(query).every(ch => CHOSEONG.includes(ch));
+            const subjectIds = isChoseong
+                ? matchSubjects(query, choseong, normalizedChoseong)
+                : matchSubjects(query, grams, normalized);
+
+            const matched = new Set();
+            subjectIds.forEach(id => bySubject[id].forEach(i => matched.add(i)));
+            deltaDecode(prefixes[query.slice(0, prefixLength)] || []).forEach(codeId => {
+                if (codes[codeId].toLowerCase().startsWith(query)) {
+                    byCode[codeId].forEach(i => matched.add(i));
+                }
+            });
+            return [...matched].sort((a, b) => a - b).map(i => `${codes[sections[i][0]]}|${sections[i][1]}`);
+        }
+    };
+}
+
+// 검색 인덱스는 과목명 검색을 처음 할 때 받음 (없으면 null -> 전체 검색으로 대체)
+function loadSubjectSearch() {
+    if (!subjectSearchPromise) {
+        subjectSearchPromise = fetchArtifact(artifactManifest, 'search_index.json')
+            .then(res => (res.ok ? res.json() : null))
+            .then(payload => (payload ? buildSubjectSearch(payload) : null))
+            .catch(error => {
+                console.warn('검색 인덱스 로드 실패, 전체 검색 사용:', error);
+                return null;
+            });
+    }
+    return subjectSearchPromise;
+}
+
+// '과목코드|분반' -> 세션 목록 (전체 시간표가 바뀌면 다시 생성)
+function getSessionsBySection() {
+    if (sessionsBySectionSource !== timetableData) {
+        sessionsBySection = new Map();
+        for (const item of timetableData) {
+            const key = `${item.code}|${item.class_number}`;
+            if (!sessionsBySection.has(key)) sessionsBySection.set(key, []);
+            sessionsBySection.get(key).push(item);
+        }
+        sessionsBySectionSource = timetableData;
+    }
+    return sessionsBySection;
+}
+
+// 포스팅 목록(행 번호) -> 세션 목록 (아직 받지 않은 샤드의 행은 건너뜀)
+function sessionsAt(rows) {
+    const sessions = [];
+    for (const row of rows || []) {
+        if (sessionRows[row]) sessions.push(sessionRows[row]);
+    }
+    return sessions;
+}
+
+// '건물-강의실' -> [건물, 강의실] (강의실 이름의 '-'는 유지: 'W105-3')
+function splitRoomKey(key) {
+    const cut = key.indexOf('-');
+    return [key.slice(0, cut), key.slice(cut + 1)];
+}
+
+// 컬럼형 파일을 우선 사용하고, 없으면 기존 timetable.json으로 대체
+async function fetchTimetable(manifest) {
+    try {
+        const res = await fetchArtifact(manifest, 'timetable.columnar.json');
+        if (res.ok) return decodeColumnarTimetable(await res.json());
+    } catch (error) {
+        console.warn('컬럼형 시간표 로드 실패, timetable.json 사용:', error);
+    }
+    const res = await fetchArtifact(manifest, 'timetable.json');
+    if (!res.ok) throw new Error(`HTTP error! Status: ${res.status}`);
+    return res.json();
+}
+
 async function loadTimetableData() {
     const loadingIndicator = document.getElementById('loading-indicator');
     if (loadingIndicator) {
@@ -35,21 +274,33 @@ async function loadTimetableData() {
     }
     try {
         
-        // 모든 데이터를 병렬로 비동기 로드
-        const v = new Date().getTime();
-        const [timetableRes, professorsRes, classroomsRes] = await Promise.all([
-            fetch(`timetable.json?v=${v}`),
-            fetch(`professors.json?v=${v}`),
-            fetch(`classrooms.json?v=${v}`)
+        // 모든 데이터를 병렬로 비동기 로드 (샤드가 있으면 시간표는 오늘 요일만)
+        const manifest = await loadArtifactManifest();
+        artifactManifest = manifest;
+        shardIndex = await loadShardIndex(manifest);
+        const today = DAY_NAMES_ENG[new Date().getDay()];
+        const todayShard = shardIndex && shardIndex.days[today];
+        const [timetable, professorsRes, classroomsRes] = await Promise.all([
+            shardIndex ? (todayShard ? fetchShard(todayShard) : Promise.resolve([])) : fetchTimetable(manifest),
+            fetchArtifact(manifest, 'professors.json'),
+            fetchArtifact(manifest, 'classrooms.json')
         ]);
 
-        if (!timetableRes.ok || !professorsRes.ok || !classroomsRes.ok) {
-            throw new Error(`HTTP error! Status: ${timetableRes.status}, ${professorsRes.status}, ${classroomsRes.status}`);
+        if (!professorsRes.ok || !classroomsRes.ok) {
+            throw new Error(`HTTP error! Status: ${professorsRes.status}, ${classroomsRes.status}`);
         }
 
-        timetableData = await timetableRes.json();
+        if (shardIndex) {
+            loadedShards = { [today]: timetable };
+            timetableByDay = { [today]: timetable };
+        } else {
+            timetableData = timetable;
+            sessionRows = timetable;
+        }
         professorsList = await professorsRes.json();
         classroomsList = await classroomsRes.json();
+        professorSessions = new Map(professorsList.map(({ name, sessions }) => [name, sessions || []]));
+        classroomSessions = new Map(classroomsList.map(({ building, room, sessions }) => [`${building}-${room}`, sessions || []]));
         
         processLoadedData();
 
@@ -62,30 +313,42 @@ async function loadTimetableData() {
         }
     }
 }
-function processLoadedData() {
-    if (!timetableData || timetableData.length === 0) {
-        console.log('처리할 데이터가 없습니다.');
-        return;
+// 성능 최적화: 요일별 데이터 인덱싱 (한 번의 순회)
+function indexTimetableByDay(data) {
+    const byDay = {};
+    DAY_NAMES_ENG.forEach(day => { byDay[day] = []; });
+    for (const item of data) {
+        if (byDay[item.day]) byDay[item.day].push(item);
     }
+    return byDay;
+}
 
-    // 성능 최적화: 요일별 데이터 인덱싱
-    timetableByDay = {};
-    DAY_NAMES_ENG.forEach(day => {
-        timetableByDay[day] = timetableData.filter(item => item.day === day);
-    });
+function processLoadedData() {
+    if (shardIndex) {
+        // 샤드 인덱스에 물리적 강의실 목록이 미리 들어 있음
+        allPhysicalRooms = shardIndex.rooms || [];
+    } else {
+        if (!timetableData || timetableData.length === 0) {
+            console.log('처리할 데이터가 없습니다.');
+            return;
+        }
 
-    // 성능 최적화: 물리적 강의실 목록 미리 생성
-    allPhysicalRooms = [...new Set(timetableData
-        .filter(item => item.day !== 'ONLINE' && item.building_name && item.classroom)
-        .map(item => `${item.building_name.trim()}-${item.classroom.trim()}`)
-    )];
+        timetableByDay = indexTimetableByDay(timetableData);
+
+        // 성능 최적화: 물리적 강의실 목록 미리 생성
+        allPhysicalRooms = [...new Set(timetableData
+            .filter(item => item.day !== 'ONLINE' && item.building_name && item.classroom)
+            .map(item => `${item.building_name.trim()}-${item.classroom.trim()}`)
+        )];
+    }
 
     // 드롭다운 채우기
     populateDropdown('professor-select', professorsList, { placeholder: '교수님을 선택하세요' });
     populateDropdown('classroom-select', classroomsList, { placeholder: '전체 강의실', isClassroom: true });
     populateDropdown('schedule-classroom-select', classroomsList, { placeholder: '강의실을 선택하세요', isClassroom: true });
 
-    console.log(`데이터 처리 완료: ${timetableData.length}개 강의, ${professorsList.length}명 교수, ${classroomsList.length}개 강의실`);
+    const sessionCount = shardIndex ? shardIndex.total : timetableData.length;
+    console.log(`데이터 처리 완료: ${sessionCount}개 강의, ${professorsList.length}명 교수, ${classroomsList.length}개 강의실`);
     
     const activeNavLink = document.querySelector('.nav-link.active');
     if (activeNavLink) {
@@ -103,6 +366,8 @@ function processLoadedData() {
 
 function handleDataLoadError() {
     timetableData = [];
+    sessionRows = [];
+    shardIndex = null;
     const statsContainer = document.getElementById('current-stats');
     if (statsContainer) {
         statsContainer.innerHTML = `
@@ -202,7 +467,8 @@ function initializeScheduleSection() {
     const professorSelectGroup = document.getElementById('professor-select-group');
     const classroomSelectGroup = document.getElementById('schedule-classroom-select-group');
 
-    function performScheduleSearch() {
+    async function performScheduleSearch() {
+        await ensureFullTimetable();
         const type = scheduleType.value;
         const day = dayFilter.value;
         let query = '';
@@ -228,7 +494,7 @@ function initializeScheduleSection() {
                     <p><strong>📚 과목명 검색</strong></p>
                     <p style="margin-left: 20px; margin-bottom: 12px;">
                         과목 이름을 입력하면 <span style="color: #667eea;">강의 시간, 교수님, 강의실, 학점</span> 등 모든 정보를 확인할 수 있습니다.<br>
-                        예: "프로그래밍", "영어", "수학"
+                        예: "프로그래밍", "영어", "수학", 초성 "ㅍㄹㄱㄹㅁ", 과목코드 "COM2"
                     </p>
                     
                     <p><strong>👨‍🏫 교수명 검색</strong></p>
@@ -252,6 +518,25 @@ function initializeScheduleSection() {
             return;
         }
 
+        const subjectSearch = type === 'subject' ? await loadSubjectSearch() : null;
+        if (subjectSearch) {
+            // 검색 인덱스 사용: 전체 시간표가 아니라 결과 수에 비례하는 비용
+            const sections = getSessionsBySection();
+            const results = subjectSearch.search(query)
+                .flatMap(key => sections.get(key) || [])
+                .filter(item => !day || item.day === day);
+            renderScheduleResults(results, type);
+            return;
+        }
+
+        // 교수 / 강의실: 목록 파일의 포스팅 목록으로 해당 행만 바로 꺼냄
+        const postings = type === 'professor' ? professorSessions.get(query)
+            : type === 'classroom' ? classroomSessions.get(query) : null;
+        if (postings) {
+            renderScheduleResults(sessionsAt(postings).filter(item => !day || item.day === day), type);
+            return;
+        }
+
         let filteredResults = timetableData.filter(item => {
             if (day && item.day !== day) {
                 return false;
@@ -265,7 +550,7 @@ function initializeScheduleSection() {
                     const professors = (item.professor || '').split(',').map(p => p.trim());
                     return professors.includes(query);
                 case 'classroom':
-                    const [building, room] = query.split('-');
+                    const [building, room] = splitRoomKey(query);
                     return item.building_name === building && item.classroom === room;
                 default:
                     return false;
@@ -541,8 +826,8 @@ function initializeRealTimeSection() {
                 const currentTime = now.getHours().toString().padStart(2, '0') + ':' + now.getMinutes().toString().padStart(2, '0');
                 const currentTimeInMinutes = timeStringToMinutes(currentTime);
 
-                const occupiedRooms = timetableData.filter(item => {
-                    if (item.building_name !== building || item.day !== currentDay || !item.start || !item.end) {
+                const occupiedRooms = (timetableByDay[currentDay] || []).filter(item => {
+                    if (item.building_name !== building || !item.start || !item.end) {
                         return false;
                     }
                     const startMinutes = timeStringToMinutes(item.start);
@@ -607,11 +892,11 @@ function showEmptyRoomScheduleModal(building, room) {
     const currentDay = DAY_NAMES_ENG[now.getDay()];
     const currentTimeInMinutes = timeStringToMinutes(now.getHours().toString().padStart(2, '0') + ':' + now.getMinutes().toString().padStart(2, '0'));
 
-    const upcomingClasses = timetableData
+    // 강의실 포스팅 목록에서 오늘 세션만 (오늘 샤드는 이미 받아 둔 상태)
+    const upcomingClasses = sessionsAt(classroomSessions.get(`${building}-${room}`))
         .filter(item =>
-            item.building_name === building &&
-            item.classroom === room &&
             item.day === currentDay &&
+            item.start &&
             timeStringToMinutes(item.start) >= currentTimeInMinutes
         )
         .sort((a, b) => timeStringToMinutes(a.start) - timeStringToMinutes(b.start));
@@ -697,12 +982,8 @@ function showEmptyRoomScheduleModal(building, room) {
 }
 
 function showEmptyRoomScheduleModalForSearch(building, room, selectedDay) {
-    const allClasses = timetableData
-        .filter(item =>
-            item.building_name === building &&
-            item.classroom === room &&
-            item.day === selectedDay
-        )
+    const allClasses = sessionsAt(classroomSessions.get(`${building}-${room}`))
+        .filter(item => item.day === selectedDay)
         .sort((a, b) => timeStringToMinutes(a.start) - timeStringToMinutes(b.start));
 
     let modal = document.getElementById('room-detail-modal');
@@ -823,7 +1104,7 @@ function timeStringToMinutes(timeStr) {
 }
 
 function updateRealTimeStatus() {
-    if (!timetableData || timetableData.length === 0) return;
+    if (!allPhysicalRooms || allPhysicalRooms.length === 0) return;
 
     const now = new Date();
     const currentDay = DAY_NAMES_ENG[now.getDay()];
@@ -831,6 +1112,16 @@ function updateRealTimeStatus() {
     const currentTime = now.getHours().toString().padStart(2, '0') + ':' + now.getMinutes().toString().padStart(2, '0');
     const currentTimeInMinutes = timeStringToMinutes(currentTime);
 
+    // 자정이 지나 요일이 바뀌었으면 새 요일 샤드를 받은 뒤 다시 그림
+    if (shardIndex && !timetableByDay[currentDay] && shardIndex.days[currentDay]) {
+        fetchShard(shardIndex.days[currentDay]).then(data => {
+            loadedShards[currentDay] = data;
+            timetableByDay[currentDay] = data;
+            updateRealTimeStatus();
+        }).catch(error => console.error('요일 샤드 로드 실패:', error));
+        return;
+    }
+
     // 성능 최적화: 같은 시간이면 캐시 사용
     const cacheKey = `${currentDay}-${currentTime}`;
     if (cachedRealTimeData.time === cacheKey) {
@@ -880,7 +1171,7 @@ function updateRealTimeStatus() {
     // 4. 모든 강의실을 건물별로 그룹화 (사용 중/빈 강의실)
     const roomsByBuilding = {};
     allRoomKeys.forEach(key => {
-        const [building, room] = key.split('-');
+        const [building, room] = splitRoomKey(key);
         if (!roomsByBuilding[building]) {
             roomsByBuilding[building] = { occupied: [], empty: [] };
         }
@@ -929,7 +1220,7 @@ function populateDropdown(selectId, data, options) {
     if (options.isClassroom) {
         optionsHtml += data.map(({ building, room }) => `<option value="${building}-${room}">${building} ${room}</option>`).join('');
     } else {
-        optionsHtml += data.map(item => `<option value="${item}">${item}</option>`).join('');
+        optionsHtml += data.map(({ name }) => `<option value="${name}">${name}</option>`).join('');
     }
     
     select.innerHTML = optionsHtml;
@@ -994,7 +1285,8 @@ function initializeSearchSection() {
     });
     
     // 검색 로직
-    function performSearch() {
+    async function performSearch() {
+        await ensureFullTimetable();
         const day = daySelect.value;
         const time = timeSelect.value;
         const classroomFilter = classroomSelect.value;
@@ -1033,7 +1325,7 @@ function initializeSearchSection() {
 
         // 3. 추가 필터링 (특정 강의실 선택 시)
         if (classroomFilter) {
-            const [building, room] = classroomFilter.split('-');
+            const [building, room] = splitRoomKey(classroomFilter);
             emptyRooms = emptyRooms.filter(r => r.building === building && r.room === room);
         }
         
@@ -0,0 +1,218 @@
+"""
+과목명/과목코드 검색 인덱스 (역색인)
+
+앱의 과목명 검색이 입력할 때마다 전체 시간표를 훑지 않도록, 변환 단계에서 역색인을 미리 만듭니다.
+ - 과목명: 공백 제거 + 소문자 기준 글자 1-gram, 2-gram -> 과목명 id
+ - 초성:   과목명의 초성열("프로그래밍" -> "ㅍㄹㄱㄹㅁ") 1-gram, 2-gram -> 과목명 id
+ - 과목코드: 소문자 접두어(최대 PREFIX_LENGTH 글자) -> 과목코드 id
+n-gram 교집합으로 후보를 좁힌 뒤 실제 부분 문자열인지 확인하므로 결과는 includes() 검색과 같습니다.
+포스팅 목록은 오름차순 id의 차분(delta)으로 저장합니다 ([3, 5, 9] -> [3, 2, 4]).
+검색 결과는 분반 단위((과목코드, 분반) = section)로 돌려줍니다.
+
+script.js의 buildSubjectSearch()가 같은 규칙으로 search_index.json을 읽습니다.
+
+사용법:
+    python3 search_index.py                 # timetable.json -> search_index.json
+    python3 search_index.py ㅍㄹㄱㄹㅁ        # 검색
+"""
+import argparse
+import json
+from collections import defaultdict
+
+SEARCH_INDEX_FILE = 'search_index.json'
+FORMAT_VERSION = 1
+PREFIX_LENGTH = 3   # 더 긴 코드 질의는 3글자 접두어 후보를 startswith로 확인
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+
+
+def normalize(text):
+    return ''.join((text or '').split()).lower()
+
+
+def to_choseong(text):
+    """한글 음절은 초성으로, 나머지 글자는 그대로"""
+    return ''.join(
+        CHOSEONG[(ord(ch) - HANGUL_START) // 588] if HANGUL_START <= ord(ch) <= HANGUL_END else ch
+        for ch in text
+    )
+
+
+def is_choseong_query(query):
+    return bool(query) and all(ch in CHOSEONG for ch in query)
+
+
+def ngrams(text):
+    """1-gram + 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def delta_encode(ids):
+    previous = 0
+    encoded = []
+    for value in sorted(ids):
+        encoded.append(value - previous)
+        previous = value
+    return encoded
+
+
+def delta_decode(deltas):
+    ids = []
+    total = 0
+    for delta in deltas:
+        total += delta
+        ids.append(total)
+    return ids
+
+
+def query_grams(query):
+    """질의를 덮는 최소 n-gram 목록 (길이 1이면 1-gram, 아니면 2-gram)"""
+    if len(query) == 1:
+        return [query]
+    return [query[i:i + 2] for i in range(len(query) - 1)]
+
+
+class SearchIndexBuilder:
+    """세션을 하나씩 add()로 받아 검색 인덱스를 만듦 (스트리밍 변환에서도 사용)"""
+
+    def __init__(self):
+        self.subjects = {}
+        self.codes = {}
+        self.sections = {}
+
+    def add(self, record):
+        code = (record.get('code') or '').strip()
+        class_number = (record.get('class_number') or '').strip()
+        if not code or (code, class_number) in self.sections:
+            return
+        subject_id = self.subjects.setdefault(record.get('subject') or '', len(self.subjects))
+        code_id = self.codes.setdefault(code, len(self.codes))
+        self.sections[(code, class_number)] = (code_id, class_number, subject_id)
+
+    def to_dict(self):
+        grams = defaultdict(list)
+        choseong = defaultdict(list)
+        prefixes = defaultdict(list)
+        for subject, subject_id in self.subjects.items():
+            text = normalize(subject)
+            for gram in ngrams(text):
+                grams[gram].append(subject_id)
+            for gram in ngrams(to_choseong(text)):
+                choseong[gram].append(subject_id)
+        for code, code_id in self.codes.items():
+            code = code.lower()
+            for i in range(1, min(len(code), PREFIX_LENGTH) + 1):
+                prefixes[code[:i]].append(code_id)
+
+        def encode(postings):
+            # 키 정렬: 같은 입력이면 해시 시드와 관계없이 같은 바이트 (콘텐츠 해시 파일명 유지)
+            return {term: delta_encode(postings[term]) for term in sorted(postings)}
+
+        return {
+            "version": FORMAT_VERSION,
+            "subjects": list(self.subjects),
+            "codes": list(self.codes),
+            "sections": list(self.sections.values()),
+            "prefix_length": PREFIX_LENGTH,
+            "grams": encode(grams),
+            "choseong": encode(choseong),
+            "prefixes": encode(prefixes)
+        }
+
+
+def build_search_index(records):
+    builder = SearchIndexBuilder()
+    for record in records:
+        builder.add(record)
+    return builder.to_dict()
+
+
+def write_search_index(payload, path=SEARCH_INDEX_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+
+
+class SearchIndex:
+    def __init__(self, payload):
+        self.subjects = payload["subjects"]
+        self.codes = payload["codes"]
+        self.sections = payload["sections"]
+        self.prefix_length = payload["prefix_length"]
+        # 포스팅 목록은 질의할 때 필요한 것만 복원
+        self.grams = payload["grams"]
+        self.choseong = payload["choseong"]
+        self.prefixes = payload["prefixes"]
+        # 과목명 id / 과목코드 id -> section 번호
+        self.by_subject = defaultdict(list)
+        self.by_code = defaultdict(list)
+        for i, (code_id, _, subject_id) in enumerate(self.sections):
+            self.by_subject[subject_id].append(i)
+            self.by_code[code_id].append(i)
+        self._normalized = [normalize(s) for s in self.subjects]
+        self._choseong = [to_choseong(s) for s in self._normalized]
+
+    @classmethod
+    def load(cls, path=SEARCH_INDEX_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _match_subjects(self, query, postings, texts):
+        candidates = None
+        for gram in query_grams(query):
+            deltas = postings.get(gram)
+            if not deltas:
+                return []
+            ids = set(delta_decode(deltas))
+            candidates = ids if candidates is None else candidates & ids
+        # 2-gram 교집합은 후보일 뿐이므로 실제 포함 여부 확인
+        return [i for i in candidates if query in texts[i]]
+
+    def search(self, query):
+        """질의와 맞는 section 목록 [(과목코드, 분반, 과목명)] (시간표에 처음 나온 순)"""
+        query = normalize(query)
+        if not query:
+            return []
+        if is_choseong_query(query):
+            subject_ids = self._match_subjects(query, self.choseong, self._choseong)
+        else:
+            subject_ids = self._match_subjects(query, self.grams, self._normalized)
+
+        matched = set()
+        for subject_id in subject_ids:
+            matched.update(self.by_subject[subject_id])
+        for code_id in delta_decode(self.prefixes.get(query[:self.prefix_length], [])):
+            if self.codes[code_id].lower().startswith(query):
+                matched.update(self.by_code[code_id])
+
+        return [
+            (self.codes[code_id], class_number, self.subjects[subject_id])
+            for code_id, class_number, subject_id in (self.sections[i] for i in sorted(matched))
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과목 검색 인덱스")
+    parser.add_argument('query', nargs='?', help="검색어 (없으면 인덱스 생성)")
+    parser.add_argument('--timetable', default='timetable.json')
+    args = parser.parse_args()
+
+    if args.query:
+        results = SearchIndex.load().search(args.query)
+        print(f"'{args.query}' 검색 결과: {len(results)}개 분반")
+        for code, class_number, subject in results:
+            print(f"  {subject} ({code}, {class_number}분반)")
+        return
+
+    with open(args.timetable, 'r', encoding='utf-8') as f:
+        payload = build_search_index(json.load(f))
+    write_search_index(payload)
+    size = len(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    print(f"✅ {SEARCH_INDEX_FILE} 생성 완료 (과목명 {len(payload['subjects'])}개, "
+          f"분반 {len(payload['sections'])}개, {size / 1024:.0f}KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+로컬 조회 API 서버 (asyncio, 표준 라이브러리만 사용)
+
+timetable.json을 한 번 읽어 요일/강의실/교수별 인덱스를 만들어 두고,
+질의에 맞는 행만 JSON으로 돌려줍니다. 휴대폰이 매번 전체 시간표를 받지 않아도 됩니다.
+ - ETag(본문 SHA-256) + If-None-Match -> 304
+ - Accept-Encoding: gzip이면 gzip 압축
+ - /api/ 이외의 경로는 정적 파일로 응답 (python3 -m http.server 대체)
+   dist/의 해시 파일은 사전 압축본(.br/.gz)을 그대로 보내고 immutable 캐시 헤더를 붙임
+   점 파일/디렉터리(.git/ 등)는 404, 잘못된 경로(널 바이트 등)는 400
+ - 요청 본문은 Content-Length만큼 읽어 버림 (keep-alive 연결에서 다음 요청과 섞이지 않게)
+
+엔드포인트:
+    GET /api/free-rooms?day=MON&start=10:00[&end=11:00][&building=우남관]
+    GET /api/professor?name=홍길동
+    GET /api/room?building=우남관&room=W106
+    GET /api/search?q=인공지능[&limit=50]
+    GET /api/meta
+
+사용법: python3 server.py [--host 0.0.0.0] [--port 8000]
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from collections import defaultdict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from availability import AvailabilityIndex
+from occupancy import DAYS, room_key
+from time_slots import minutes_to_time, time_to_minutes
+
+TIMETABLE_FILE = 'timetable.json'
+GZIP_MIN_BYTES = 512
+SEARCH_LIMIT = 50
+# build_artifacts.py의 콘텐츠 해시 파일명 (예: dist/timetable.3f9a0c1d2e4b.json)
+HASHED_FILE_RE = re.compile(r'\.[0-9a-f]{12}\.[a-z]+$')
+# free-rooms의 start/end (00:00 ~ 23:59)
+CLOCK_RE = re.compile(r'([01]?[0-9]|2[0-3]):([0-5][0-9])')
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+BODY_CHUNK = 1 << 16
+
+
+class QueryError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_clock(value):
+    """'HH:MM' -> 자정 기준 분 (시 0~23, 분 0~59가 아니면 QueryError 400)"""
+    match = CLOCK_RE.fullmatch(value)
+    if not match:
+        raise QueryError(400, "시간 형식은 HH:MM(00:00~23:59) 입니다.")
+    return time_to_minutes(match.group(0))
+
+
+class TimetableIndex:
+    """요청마다 전체 시간표를 훑지 않도록 미리 만들어 둔 인덱스"""
+
+    def __init__(self, timetable):
+        self.timetable = timetable
+        self.by_day = defaultdict(list)
+        self.by_room = defaultdict(list)
+        self.by_professor = defaultdict(list)
+        for item in timetable:
+            self.by_day[item.get('day')].append(item)
+            building = (item.get('building_name') or '').strip()
+            room = (item.get('classroom') or '').strip()
+            if building and room:
+                self.by_room[room_key(building, room)].append(item)
+            for name in (item.get('professor') or '').split(','):
+                if name.strip():
+                    self.by_professor[name.strip()].append(item)
+        # 과목명 검색용 (소문자, 공백 제거)
+        self.search_keys = [
+            (item.get('subject') or '').replace(' ', '').lower() + '|' + (item.get('code') or '').lower()
+            for item in timetable
+        ]
+        self.availability = AvailabilityIndex.build(timetable)
+
+    @classmethod
+    def load(cls, path=TIMETABLE_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def free_rooms(self, day, start, end=None, building=None):
+        if day not in DAYS:
+            raise QueryError(400, f"day는 {', '.join(DAYS)} 중 하나여야 합니다.")
+        start_minute = parse_clock(start)
+        end_minute = parse_clock(end) if end else start_minute + 1
+        if end_minute <= start_minute:
+            raise QueryError(400, "end는 start보다 늦어야 합니다.")
+        keys = self.availability.free_rooms(
+            day, minutes_to_time(start_minute), minutes_to_time(end_minute), building
+        )
+        return [dict(zip(('building', 'room'), key.split('-', 1))) for key in keys]
+
+    def professor(self, name):
+        return self.by_professor.get(name, [])
+
+    def room(self, building, room):
+        return self.by_room.get(room_key(building, room), [])
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        query = query.replace(' ', '').lower()
+        if not query:
+            return []
+        results = []
+        for item, key in zip(self.timetable, self.search_keys):
+            if query in key:
+                results.append(item)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def meta(self):
+        return {
+            "sessions": len(self.timetable),
+            "rooms": len(self.by_room),
+            "professors": len(self.by_professor),
+            "days": {day: len(self.by_day.get(day, [])) for day in ['ONLINE'] + DAYS}
+        }
+
+
+def single(params, name, required=True):
+    values = params.get(name)
+    if not values:
+        if required:
+            raise QueryError(400, f"'{name}' 파라미터가 필요합니다.")
+        return None
+    return values[0]
+
+
+def handle_api(index, path, params):
+    if path == '/api/free-rooms':
+        return index.free_rooms(
+            single(params, 'day'), single(params, 'start'),
+            single(params, 'end', False), single(params, 'building', False)
+        )
+    if path == '/api/professor':
+        return index.professor(single(params, 'name'))
+    if path == '/api/room':
+        return index.room(single(params, 'building'), single(params, 'room'))
+    if path == '/api/search':
+        limit = single(params, 'limit', False)
+        try:
+            limit = min(int(limit), 500) if limit else SEARCH_LIMIT
+        except ValueError:
+            raise QueryError(400, "limit은 정수여야 합니다.")
+        if limit < 1:
+            raise QueryError(400, "limit은 1 이상이어야 합니다.")
+        return index.search(single(params, 'q'), limit)
+    if path == '/api/meta':
+        return index.meta()
+    raise QueryError(404, f"알 수 없는 API: {path}")
+
+
+def read_static(root, path, accept_encoding=''):
+    """
+    root 밖으로 나가지 않는 정적 파일 읽기 -> (본문, content-type, content-encoding)
+    build_artifacts.py가 만든 .br / .gz 사전 압축본이 있으면 그것을 그대로 보냄
+    """
+    relative = unquote(path).lstrip('/') or 'index.html'
+    # .git/, .pipeline_state.json 같은 점 파일/디렉터리('..' 포함)는 내보내지 않음
+    if any(part.startswith('.') for part in relative.replace('\\', '/').split('/')):
+        raise QueryError(404, "파일을 찾을 수 없습니다.")
+    try:
+        full = os.path.realpath(os.path.join(root, relative))
+        if not full.startswith(os.path.realpath(root) + os.sep) or not os.path.isfile(full):
+            raise QueryError(404, "파일을 찾을 수 없습니다.")
+
+        encoding = None
+        source = full
+        for name, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if name in accept_encoding and os.path.isfile(full + suffix):
+                encoding, source = name, full + suffix
+                break
+        with open(source, 'rb') as f:
+            body = f.read()
+    except ValueError:
+        # 경로에 널 바이트 등 (GET /%00)
+        raise QueryError(400, "잘못된 경로입니다.")
+    except OSError:
+        raise QueryError(404, "파일을 찾을 수 없습니다.")
+
+    content_type = mimetypes.guess_type(full)[0] or 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/json', 'application/javascript'):
+        content_type += '; charset=utf-8'
+    return body, content_type, encoding
+
+
+def build_response(status, body, content_type, headers, encoding=None, immutable=False):
+    """ETag/gzip 처리를 거친 HTTP 응답 바이트 (encoding이 있으면 이미 압축된 본문)"""
+    use_gzip = (
+        encoding is None and len(body) >= GZIP_MIN_BYTES
+        and 'gzip' in headers.get('accept-encoding', '')
+    )
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    # 압축본은 다른 표현(representation)이므로 ETag도 구분
+    suffix = {'gzip': '-gz', 'br': '-br'}.get('gzip' if use_gzip else encoding, '')
+    etag = f'"{digest}{suffix}"'
+    response_headers = {
+        'Content-Type': content_type,
+        'ETag': etag,
+        'Vary': 'Accept-Encoding',
+        # 해시 파일명은 내용이 바뀌면 이름도 바뀌므로 영구 캐시 가능
+        'Cache-Control': 'public, max-age=31536000, immutable' if immutable else 'no-cache',
+    }
+    if status == 200 and etag in headers.get('if-none-match', ''):
+        status, body = 304, b''
+    elif use_gzip:
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+        encoding = 'gzip'
+    if encoding and status != 304:
+        response_headers['Content-Encoding'] = encoding
+    response_headers['Content-Length'] = str(len(body))
+
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    lines += [f"{name}: {value}" for name, value in response_headers.items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8') + body
+
+
+async def discard_body(reader, headers):
+    """
+    요청 본문을 읽어 버림 (POST 등에 본문이 있어도 다음 요청과 섞이지 않게)
+    본문 길이를 알 수 없으면 (chunked, 잘못된 Content-Length) False -> 응답 후 연결을 닫음
+    """
+    if 'transfer-encoding' in headers:
+        return False
+    try:
+        remaining = int(headers.get('content-length') or 0)
+    except ValueError:
+        return False
+    if remaining < 0:
+        return False
+    while remaining:
+        chunk = await reader.read(min(remaining, BODY_CHUNK))
+        if not chunk:
+            raise asyncio.IncompleteReadError(b'', remaining)
+        remaining -= len(chunk)
+    return True
+
+
+def json_body(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class TimetableServer:
+    def __init__(self, index, static_root='.'):
+        self.index = index
+        self.static_root = static_root
+
+    def respond(self, method, target, headers):
+        """(status, body, content_type, content-encoding, immutable)"""
+        url = urlsplit(target)
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise QueryError(405, "GET만 지원합니다.")
+            if url.path.startswith('/api/'):
+                data = handle_api(self.index, url.path, parse_qs(url.query))
+                return 200, json_body(data), 'application/json; charset=utf-8', None, False
+            body, content_type, encoding = read_static(
+                self.static_root, url.path, headers.get('accept-encoding', '')
+            )
+            return 200, body, content_type, encoding, bool(HASHED_FILE_RE.search(url.path))
+        except QueryError as e:
+            return e.status, json_body({"error": str(e)}), 'application/json; charset=utf-8', None, False
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                framed = await discard_body(reader, headers)
+                if framed:
+                    status, body, content_type, encoding, immutable = self.respond(method, target, headers)
+                else:
+                    status, body, content_type, encoding, immutable = (
+                        400, json_body({"error": "본문 길이를 알 수 없습니다."}),
+                        'application/json; charset=utf-8', None, False
+                    )
+                response = build_response(status, body, content_type, headers, encoding, immutable)
+                if method == 'HEAD':
+                    response = response.split(b'\r\n\r\n', 1)[0] + b'\r\n\r\n'
+                writer.write(response)
+                await writer.drain()
+
+                if not framed or version == 'HTTP/1.0' or headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, timetable_file, static_root):
+    index = TimetableIndex.load(timetable_file)
+    app = TimetableServer(index, static_root)
+    server = await asyncio.start_server(app.handle, host, port)
+    print(f"✅ {timetable_file} 로드 완료 ({len(index.timetable)}개 세션)")
+    print(f"🚀 http://{host}:{port}/ 에서 서비스 중 (API: /api/...)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간표 조회 API 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--timetable', default=TIMETABLE_FILE)
+    parser.add_argument('--static-root', default='.', help="정적 파일 루트 디렉터리")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.timetable, args.static_root))
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+timetable.json 세션 한 건을 담는 작은 객체 (__slots__)
+
+json.load가 만드는 dict는 세션마다 키 13개짜리 해시 테이블과 값 문자열(요일, 시각, 건물명 ...)을
+새로 만듭니다. Session은
+ - 필드를 __slots__에 두고 (dict 없음)
+ - day는 DAY_CODES 인덱스, start/end는 자정 기준 분(없으면 -1)으로 작은 정수만 저장
+   (분 값도 MINUTES 표의 같은 int 객체를 공유)
+ - 나머지 문자열은 sys.intern으로 공유 (같은 과목명/교수/건물은 한 객체)
+해서 같은 데이터를 훨씬 적은 메모리로 들고 있습니다.
+
+읽기 쪽은 dict와 같은 Mapping이라 (get / [] / in / 키 순회 / items / dict와 ==)
+item.get('day')로 읽던 코드(columnar, shards, search_index, lookups, conflicts, timetable_db ...)는 그대로 동작하고,
+day/start/end는 미리 만들어 둔 문자열을 돌려주므로 읽을 때 새 객체를 만들지 않습니다.
+JSON으로 쓸 때는 streaming.json_default가 to_dict()로 바꿔 주며, 키 순서가 converter.py 출력과 같아
+timetable.json은 dict로 쓸 때와 바이트 단위로 같습니다.
+
+사용법:
+    python3 session.py [timetable.json]    # dict / Session 메모리 비교 + 왕복 검증
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from collections.abc import Mapping
+
+from columnar import DAY_CODES
+from streaming import iter_json_array
+from time_slots import minutes_to_time
+
+TIMETABLE_FILE = 'timetable.json'
+
+# converter.convert_record가 만드는 키 순서 (to_dict / 순회 순서)
+FIELDS = ('code', 'subject', 'professor', 'credits', 'department', 'class_number', 'student_count',
+          'day', 'start', 'end', 'classroom', 'building_name', 'type')
+STRING_FIELDS = ('code', 'subject', 'professor', 'credits', 'department', 'class_number',
+                 'classroom', 'building_name', 'type')
+_FIELD_SET = frozenset(FIELDS)
+
+DAY_INDEX = {day: i for i, day in enumerate(DAY_CODES)}
+MINUTES = tuple(range(24 * 60 + 1))
+# 분 -> "HH:MM", 마지막 칸은 -1(시각 없음) -> ''
+TIME_TEXT = tuple(minutes_to_time(m) for m in MINUTES) + ('',)
+# "HH:MM" / '' -> MINUTES의 int (없는 형식이면 KeyError, 요일과 같음)
+TIME_INDEX = {text: (MINUTES[i] if i < len(MINUTES) else -1) for i, text in enumerate(TIME_TEXT)}
+_intern = sys.intern
+
+
+class Session(Mapping):
+    __slots__ = ('code', 'subject', 'professor', 'credits', 'department', 'class_number', 'student_count',
+                 '_day', '_start', '_end', 'classroom', 'building_name', 'type')
+
+    def __init__(self, code='', subject='', professor='', credits='', department='', class_number='',
+                 student_count=0, day='', start='', end='', classroom='', building_name='', type=''):
+        self.code = _intern(code)
+        self.subject = _intern(subject)
+        self.professor = _intern(professor)
+        self.credits = _intern(credits)
+        self.department = _intern(department)
+        self.class_number = _intern(class_number)
+        self.student_count = student_count
+        self._day = DAY_INDEX[day]
+        self._start = TIME_INDEX[start]
+        self._end = TIME_INDEX[end]
+        self.classroom = _intern(classroom)
+        self.building_name = _intern(building_name)
+        self.type = _intern(type)
+
+    @property
+    def day(self):
+        return DAY_CODES[self._day]
+
+    @property
+    def start(self):
+        return TIME_TEXT[self._start]
+
+    @property
+    def end(self):
+        return TIME_TEXT[self._end]
+
+    @property
+    def start_minutes(self):
+        """자정 기준 분 (시각이 없으면 -1)"""
+        return self._start
+
+    @property
+    def end_minutes(self):
+        return self._end
+
+    @classmethod
+    def from_dict(cls, item):
+        """timetable.json 항목 -> Session (없는 키는 빈 값, 모르는 키는 무시)"""
+        return cls(**{field: item[field] for field in FIELDS if item.get(field) is not None})
+
+    def to_dict(self):
+        return {
+            "code": self.code, "subject": self.subject, "professor": self.professor, "credits": self.credits,
+            "department": self.department, "class_number": self.class_number, "student_count": self.student_count,
+            "day": DAY_CODES[self._day], "start": TIME_TEXT[self._start], "end": TIME_TEXT[self._end],
+            "classroom": self.classroom, "building_name": self.building_name, "type": self.type,
+        }
+
+    # --- dict처럼 읽기 ---
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in _FIELD_SET else default
+
+    def __contains__(self, key):
+        return key in _FIELD_SET
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return f"Session({self.to_dict()!r})"
+
+
+def load_sessions(path=TIMETABLE_FILE):
+    """timetable.json을 한 항목씩 읽어 Session 리스트로 (dict 리스트를 한꺼번에 만들지 않음)"""
+    return [Session.from_dict(item) for item in iter_json_array(path)]
+
+
+def measure(load):
+    """load()가 만든 결과와 그것이 차지하는 메모리(바이트, tracemalloc 기준)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = load()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="timetable.json dict / Session 메모리 비교")
+    parser.add_argument('timetable', nargs='?', default=TIMETABLE_FILE)
+    args = parser.parse_args()
+
+    def load_dicts():
+        with open(args.timetable, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    dicts, dict_bytes = measure(load_dicts)
+    sessions, session_bytes = measure(lambda: load_sessions(args.timetable))
+
+    mismatched = sum(1 for item, session in zip(dicts, sessions) if session.to_dict() != item)
+    count = len(dicts)
+    print(f"--- {args.timetable} ({count}개 세션) ---")
+    print(f"dict    : {dict_bytes / 1024:10.1f}KB ({dict_bytes / count:6.0f}B/세션)")
+    print(f"Session : {session_bytes / 1024:10.1f}KB ({session_bytes / count:6.0f}B/세션)")
+    print(f"📈 {1 - session_bytes / dict_bytes:.1%} 감소")
+    if mismatched or len(sessions) != count:
+        print(f"🔴 왕복 결과가 원본과 다른 세션 {mismatched}개")
+        sys.exit(1)
+    print("✅ 모든 세션이 to_dict()로 원본과 같게 복원됩니다.")
+
+
+if __name__ == "__main__":
+    main()
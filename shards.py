@@ -0,0 +1,174 @@
+"""
+요일별 / 건물별 시간표 샤드
+
+홈 화면(실시간 현황)은 오늘 요일의 세션만 있으면 되므로, 전체 시간표를 받기 전에
+오늘 샤드만 먼저 받아 그릴 수 있도록 요일별 파일과 인덱스를 만듭니다.
+ - shards/index.json              샤드 목록(경로, 세션 수) + 물리적 강의실 목록
+ - shards/day-MON.<해시>.json      요일별 세션 (columnar.py 포맷)
+ - shards/building-01.<해시>.json  건물별 세션 (--buildings 옵션)
+
+샤드 파일명에 내용 해시가 들어가므로 내용이 같으면 파일 이름도 같고 브라우저 캐시가 그대로 재사용됩니다.
+샤드마다 각 세션의 timetable.json 행 번호(rows, 차분 인코딩)가 들어 있어, 샤드를 모으면
+timetable.json과 같은 순서를 복원할 수 있고 professors.json / classrooms.json의 포스팅 목록을 그대로 씁니다.
+ShardBuilder(spill=True)는 샤드마다 columnar.ColumnarSpillEncoder로 행을 임시 파일에 흘려 두고
+쓰면서 해시를 계산하므로, 메모리에는 샤드별 문자열 사전만 남습니다 (converter.py --stream).
+
+사용법: python3 shards.py [--buildings]
+"""
+import argparse
+import hashlib
+import json
+import os
+
+from columnar import DAY_CODES, ColumnarEncoder, ColumnarSpillEncoder
+from search_index import delta_encode
+
+SHARD_DIR = 'shards'
+INDEX_NAME = 'index.json'
+HASH_LENGTH = 12
+FORMAT_VERSION = 1
+
+
+def day_label(day):
+    return day or 'NONE'
+
+
+class HashingWriter:
+    """텍스트를 UTF-8로 파일에 쓰면서 SHA-256과 바이트 수를 함께 셈"""
+
+    def __init__(self, f):
+        self._file = f
+        self.digest = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.digest.update(data)
+        self.bytes += len(data)
+        self._file.write(data)
+
+
+class ShardBuilder:
+    """세션을 하나씩 add()로 받아 요일별(선택: 건물별) 컬럼형 샤드를 만듦 (스트리밍 변환에서도 사용)"""
+
+    def __init__(self, buildings=False, spill=False):
+        self.spill = spill
+        self.days = {}
+        self.day_rows = {}
+        self.buildings = {} if buildings else None
+        self.building_rows = {}
+        self.rooms = {}
+        self.count = 0
+
+    def _add_to(self, encoders, rows, key, record):
+        """spill이면 행 번호는 직전 행과의 차이로 인코더에 함께 넘김 (rows에는 마지막 행 번호만)"""
+        if not self.spill:
+            encoders.setdefault(key, ColumnarEncoder()).add(record)
+            rows.setdefault(key, []).append(self.count)
+            return
+        if key not in encoders:
+            encoders[key] = ColumnarSpillEncoder(extra=('rows',))
+        encoders[key].add(record, self.count - rows.get(key, 0))
+        rows[key] = self.count
+
+    def add(self, record):
+        day = record.get('day') or ''
+        self._add_to(self.days, self.day_rows, day, record)
+
+        building = (record.get('building_name') or '').strip()
+        room = (record.get('classroom') or '').strip()
+        if day != 'ONLINE' and building and room:
+            # 실시간 현황의 "전체 강의실" 목록 (처음 나온 순서 유지)
+            self.rooms.setdefault(f"{building}-{room}", None)
+        if self.buildings is not None and building:
+            self._add_to(self.buildings, self.building_rows, building, record)
+        self.count += 1
+
+    def _write_spilled_shard(self, out_dir, prefix, encoder, keep):
+        tmp_path = os.path.join(out_dir, f"{prefix}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            writer = HashingWriter(f)
+            encoder.write(writer)
+        encoder.close()
+        name = f"{prefix}.{writer.digest.hexdigest()[:HASH_LENGTH]}.json"
+        path = os.path.join(out_dir, name)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+        keep.add(name)
+        return {"path": f"{out_dir}/{name}", "count": encoder.count, "bytes": writer.bytes}
+
+    def _write_shard(self, out_dir, prefix, encoder, rows, keep):
+        if self.spill:
+            return self._write_spilled_shard(out_dir, prefix, encoder, keep)
+        payload = encoder.to_dict()
+        payload["rows"] = delta_encode(rows)
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{prefix}.{digest[:HASH_LENGTH]}.json"
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+        keep.add(name)
+        return {"path": f"{out_dir}/{name}", "count": encoder.count, "bytes": len(data)}
+
+    def write(self, out_dir=SHARD_DIR):
+        """샤드 파일과 index.json을 쓰고 index dict 반환 (path는 사이트 루트 기준)"""
+        os.makedirs(out_dir, exist_ok=True)
+        keep = {INDEX_NAME}
+        index = {"version": FORMAT_VERSION, "total": self.count, "days": {}}
+
+        for day in sorted(self.days, key=lambda d: DAY_CODES.index(d) if d in DAY_CODES else len(DAY_CODES)):
+            index["days"][day_label(day)] = self._write_shard(
+                out_dir, f"day-{day_label(day)}", self.days[day], self.day_rows[day], keep
+            )
+        if self.buildings is not None:
+            index["buildings"] = {}
+            for i, building in enumerate(sorted(self.buildings), 1):
+                entry = self._write_shard(
+                    out_dir, f"building-{i:02d}", self.buildings[building], self.building_rows[building], keep
+                )
+                index["buildings"][building] = entry
+        index["rooms"] = list(self.rooms)
+
+        with open(os.path.join(out_dir, INDEX_NAME), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+
+        # 이전 빌드의 샤드 정리
+        for name in os.listdir(out_dir):
+            if name not in keep:
+                os.remove(os.path.join(out_dir, name))
+        return index
+
+
+def write_shards(records, out_dir=SHARD_DIR, buildings=False):
+    builder = ShardBuilder(buildings)
+    for record in records:
+        builder.add(record)
+    return builder.write(out_dir)
+
+
+def print_index_summary(index, out_dir=SHARD_DIR):
+    print(f"✅ {out_dir}/{INDEX_NAME} 생성 완료 (세션 {index['total']}개)")
+    for day, entry in index["days"].items():
+        print(f"  {day}: {entry['count']}개, {entry['bytes'] / 1024:.0f}KB")
+    if "buildings" in index:
+        print(f"  건물 샤드 {len(index['buildings'])}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요일별/건물별 시간표 샤드 생성")
+    parser.add_argument('--timetable', default='timetable.json')
+    parser.add_argument('--out', default=SHARD_DIR)
+    parser.add_argument('--buildings', action='store_true', help="건물별 샤드도 생성")
+    args = parser.parse_args()
+
+    with open(args.timetable, 'r', encoding='utf-8') as f:
+        timetable = json.load(f)
+    print_index_summary(write_shards(timetable, args.out, args.buildings), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+대용량 JSON 입출력을 위한 스트리밍 도구 (표준 라이브러리만 사용)
+
+ - iter_json_array: 최상위 JSON 배열을 한 항목씩 읽어 yield (파일 전체를 메모리에 올리지 않음)
+ - NDJSONWriter: 한 줄에 레코드 하나씩 기록하는 newline-delimited JSON 출력
+ - JSONArrayWriter: json.dump(..., indent=2)와 동일한 배열 출력을 레코드 단위로 기록
+ - json_default: to_dict()가 있는 레코드 객체(session.Session)를 쓰기 위한 json default 훅
+ - external_sort: 줄 단위 외부 정렬 (정렬된 임시 파일 조각을 heapq.merge로 병합)
+"""
+import heapq
+import json
+import tempfile
+
+CHUNK_SIZE = 1 << 16
+SORT_CHUNK_LINES = 50000
+
+
+def json_default(obj):
+    """json.dump(..., default=json_default) - Session 등 to_dict()가 있는 객체를 dict로"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """최상위 배열 '[...]' 파일에서 항목을 하나씩 읽어 yield"""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = f.read(chunk_size).lstrip('\ufeff \t\r\n')
+        if not buf.startswith('['):
+            raise ValueError(f"{path}: 최상위 JSON 배열이 아닙니다.")
+        pos = 1
+        eof = False
+
+        while True:
+            # 공백과 구분자(,) 건너뛰기
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    raise ValueError(f"{path}: 배열이 닫히지 않았습니다.")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            if buf[pos] == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                item, end = None, len(buf)
+
+            # 버퍼 끝에서 끝난 값은 잘렸을 수 있으므로 더 읽고 다시 해석
+            if end >= len(buf) and not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            yield item
+            pos = end
+
+
+def _sorted_run(lines):
+    run = tempfile.TemporaryFile('w+', encoding='utf-8')
+    lines.sort()
+    for line in lines:
+        run.write(line)
+        run.write('\n')
+    run.seek(0)
+    return run
+
+
+def external_sort(lines, chunk_lines=SORT_CHUNK_LINES):
+    """
+    개행 없는 문자열 줄들을 정렬해 yield - 메모리에는 chunk_lines 줄만 올림
+    chunk_lines 줄씩 정렬해 임시 파일에 쓰고, 끝나면 파일들을 heapq.merge로 병합
+    """
+    runs = []
+    chunk = []
+    try:
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= chunk_lines:
+                runs.append(_sorted_run(chunk))
+                chunk = []
+        if not runs:
+            chunk.sort()
+            yield from chunk
+            return
+        if chunk:
+            runs.append(_sorted_run(chunk))
+        chunk = []
+        yield from heapq.merge(*((line[:-1] for line in run) for run in runs))
+    finally:
+        for run in runs:
+            run.close()
+
+
+def iter_ndjson(path):
+    """NDJSON 파일을 한 줄씩 읽어 yield"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class NDJSONWriter:
+    """레코드를 한 줄에 하나씩 기록 (with 문으로 사용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=json_default))
+        self._file.write('\n')
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self._file.close()
+        return False
+
+
+class JSONArrayWriter:
+    """json.dump(records, f, ensure_ascii=False, indent=2)와 같은 결과를 점진적으로 기록"""
+
+    def __init__(self, path, indent=2):
+        self.path = path
+        self.indent = indent
+        self.count = 0
+        self._file = None
+        self._pad = ' ' * indent
+
+    def __enter__(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('[')
+        return self
+
+    def write(self, record):
+        text = json.dumps(record, ensure_ascii=False, indent=self.indent, default=json_default)
+        self._file.write(',\n' if self.count else '\n')
+        self._file.write(self._pad + text.replace('\n', '\n' + self._pad))
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self._file.write('\n]' if self.count else ']')
+        self._file.close()
+        return False
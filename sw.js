@@ -1,28 +1,71 @@
-const CACHE_NAME = 'campus-helper-cache-v3';
-const urlsToCache = [
+// 앱 셸(HTML/CSS/JS)은 네트워크 우선 + 오프라인 대비 캐시,
+// 데이터는 dist/manifest.json, shards/index.json이 가리키는 콘텐츠 해시 파일을 캐시 우선으로 사용 (이름이 곧 버전)
+const SHELL_CACHE = 'campus-helper-shell';
+const DATA_CACHE = 'campus-helper-data';
+const SHARD_CACHE = 'campus-helper-shards';
+const MANIFEST_URL = '/dist/manifest.json';
+const SHARD_INDEX_URL = '/shards/index.json';
+const shellUrls = [
     '/',
     '/app.html',
     '/index.html',
     '/style.css',
-    '/script.js',
-    '/timetable.json',
-    '/professors.json',
-    '/classrooms.json'
+    '/script.js'
 ];
 
+// manifest에 있는 해시 파일 URL 목록
+function manifestUrls(manifest) {
+    return Object.values(manifest.files || {}).map(entry => new URL(entry.path, self.location.origin + MANIFEST_URL).href);
+}
+
+// 샤드 인덱스에 있는 샤드 URL 목록 (path는 사이트 루트 기준)
+function shardUrls(index) {
+    return Object.values(index.days || {}).concat(Object.values(index.buildings || {}))
+        .map(entry => new URL(entry.path, self.location.origin + '/').href);
+}
+
+// 새 샤드 인덱스를 받으면 더 이상 쓰지 않는 샤드만 삭제 (샤드는 필요할 때 받으므로 미리 받지 않음)
+async function pruneShardCache(index) {
+    const cache = await caches.open(SHARD_CACHE);
+    const wanted = new Set([...shardUrls(index), new URL(SHARD_INDEX_URL, self.location.origin).href]);
+    const cached = await cache.keys();
+    await Promise.all(cached
+        .filter(request => !wanted.has(request.url))
+        .map(request => cache.delete(request)));
+}
+
+// 새 manifest를 받으면 더 이상 쓰지 않는 해시 파일만 삭제 (해시 파일은 앱이 요청할 때 캐시 우선으로 받으므로 미리 받지 않음)
+// manifest가 있으면 앱은 해시된 샤드 인덱스(dist/shards-index.<hash>.json)를 받으므로 샤드 정리도 여기서 함
+async function syncDataCache(manifest) {
+    const cache = await caches.open(DATA_CACHE);
+    const wanted = new Set([...manifestUrls(manifest), new URL(MANIFEST_URL, self.location.origin).href]);
+    const cached = await cache.keys();
+    await Promise.all(cached
+        .filter(request => !wanted.has(request.url))
+        .map(request => cache.delete(request)));
+    const shardIndex = manifest.files && manifest.files['shards/index.json'];
+    if (shardIndex) {
+        const response = await cacheFirst(new URL(shardIndex.path, self.location.origin + MANIFEST_URL).href, DATA_CACHE);
+        if (response.ok) {
+            await pruneShardCache(await response.json());
+        }
+    }
+}
+
 self.addEventListener('install', (event) => {
     event.waitUntil(
-        caches.open(CACHE_NAME)
+        caches.open(SHELL_CACHE)
             .then((cache) => {
                 console.log('Opened cache');
-                return cache.addAll(urlsToCache);
+                return cache.addAll(shellUrls);
             })
     );
     self.skipWaiting();
 });
 
 self.addEventListener('activate', (event) => {
-    const cacheWhitelist = [CACHE_NAME];
+    // 이전 버전(campus-helper-cache-v3 등) 캐시 정리
+    const cacheWhitelist = [SHELL_CACHE, DATA_CACHE, SHARD_CACHE];
     event.waitUntil(
         caches.keys().then((cacheNames) => {
             return Promise.all(
@@ -37,17 +80,56 @@ self.addEventListener('activate', (event) => {
     self.clients.claim();
 });
 
+async function networkFirst(request, cacheName) {
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            const cache = await caches.open(cacheName);
+            cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        const cached = await caches.match(request, { ignoreSearch: true });
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+async function cacheFirst(request, cacheName) {
+    const cached = await caches.match(request);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok) {
+        const cache = await caches.open(cacheName);
+        cache.put(request, response.clone());
+    }
+    return response;
+}
+
+// manifest/샤드 인덱스: 네트워크 우선으로 받고, 받은 내용으로 캐시 정리
+async function handleIndex(request, cacheName, sync) {
+    const response = await networkFirst(request, cacheName);
+    if (response.ok) {
+        response.clone().json().then(sync).catch(() => {});
+    }
+    return response;
+}
+
 self.addEventListener('fetch', (event) => {
-    event.respondWith(
-        caches.match(event.request)
-            .then((response) => {
-                // Cache hit - return response
-                if (response) {
-                    return response;
-                }
-                return fetch(event.request);
-            }
-        )
-    );
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin) {
+        return;
+    }
+    if (url.pathname === MANIFEST_URL) {
+        event.respondWith(handleIndex(event.request, DATA_CACHE, syncDataCache));
+    } else if (url.pathname === SHARD_INDEX_URL) {
+        event.respondWith(handleIndex(event.request, SHARD_CACHE, pruneShardCache));
+    } else if (url.pathname.startsWith('/dist/')) {
+        // 해시 파일명은 내용이 바뀌면 이름도 바뀌므로 캐시에 있으면 그대로 사용
+        event.respondWith(cacheFirst(event.request, DATA_CACHE));
+    } else if (url.pathname.startsWith('/shards/')) {
+        event.respondWith(cacheFirst(event.request, SHARD_CACHE));
+    } else {
+        event.respondWith(networkFirst(event.request, SHELL_CACHE));
+    }
 });
-
@@ -0,0 +1,303 @@
+"""
+합성 학사 데이터(개설강좌 리스트) 생성기
+
+부하 테스트용으로 `개설강좌 리스트.json`과 같은 원본 스키마의 레코드를 원하는 규모만큼 만듭니다.
+원본 파일의 특이점을 그대로 재현합니다:
+ - 첫 행은 헤더 행 {'강의시수': '이론', 'Column9': '실습'}
+ - 줄바꿈이 들어간 키 ('이수\\n구분', '인원\\n제한', '수강\\n인원')
+ - 강의시간 형식 혼합: "J202(목A)", "화E(P203)", "목 A,B(J202)"
+ - 시간 미정 자리표시자 "(?)", "()"
+ - 공동 담당 교수 "홍길동,김철수", 담당교수 키 누락, '비고' / '교양이수영역' 선택 키
+
+같은 시드와 설정이면 항상 같은 바이트를 출력합니다.
+레코드는 한 건씩 만들어 바로 기록하지만, 겹침 판정용 점유 비트마스크와 강의실/교수 이름 목록은 끝까지 메모리에 남습니다.
+기본 설정(강의실/교수 수가 분반 수에 비례)에서는 분반 수에 비례해 100만 분반당 최대 RSS 약 400MB입니다
+(실측: 2만 24MB, 20만 92MB, 100만 395MB).
+강의실/교수 배정은 5분 단위 비트마스크로 겹침을 피하되, 자리가 없으면 겹친 채로 배정합니다 (conflicts로 집계).
+강의실 / 교수 수를 주지 않으면 분반 수에 비례해 정합니다 (원본처럼 강의실당 5개, 교수당 3개 분반 안팎).
+교시는 변환기 교시표(time_slots.PERIOD_MAP)에 있는 코드만 씁니다.
+
+사용법:
+    python3 synthetic_export.py --sections 100000 --seed 7 --output synthetic_export.json
+    python3 synthetic_export.py --sections 2000000 --buildings 40 --rooms 400000 --professors 700000
+"""
+import argparse
+import random
+
+from converter import BUILDING_MAP
+from streaming import JSONArrayWriter
+from time_slots import DAY_MAP, PERIOD_TIMES, parse_slot_string, time_to_minutes
+
+OUTPUT_FILE = 'synthetic_export.json'
+HEADER_ROW = {'강의시수': '이론', 'Column9': '실습'}
+PLACEHOLDER_SLOTS = ('(?)', '()')
+PLACEMENT_TRIES = 24  # 겹치지 않는 강의실/시간을 무작위로 찾아보는 횟수
+# 강의실 / 교수 수를 주지 않았을 때 하나가 맡는 분반 수 (원본: 분반 1836, 강의실 292, 교수 515)
+SECTIONS_PER_ROOM = 5
+SECTIONS_PER_PROFESSOR = 3
+
+DAYS_KOR = list(DAY_MAP)[:5]  # 토요일 수업은 드묾 -> 월~금만 배정
+NUMERIC_PERIODS = [str(i) for i in range(1, 14)]
+LETTER_PERIODS = list('ABCDEFG')
+# 변환기가 읽지 못하는 교시를 쓰면 합성 데이터가 파싱 대신 누락만 재게 됨
+assert all(parse_slot_string(f"J202(월{period})") for period in NUMERIC_PERIODS + LETTER_PERIODS)
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송전홍유고문양손배백허남심노하곽성차주우구민류나진지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용'
+GIVEN_SYLLABLES = '민서현지우준도하예윤수영진호정은성경미태혜재유희원주승아동연상철선소인나기용혁종광석규'
+TOPICS = [
+    '인공지능', '데이터', '프로그래밍', '경영', '회계', '마케팅', '간호', '건축', '조경', '디자인',
+    '한국어', '영어', '일본어', '중국어', '사회복지', '심리', '교육', '유아교육', '미술', '음악',
+    '체육', '관광', '호텔', '외식', '항공', '법', '행정', '경제', '미디어', '사진',
+    '게임', '전자', '정보보안', '생명과학', '화학', '물리', '수학', '통계', '문학', '철학',
+]
+SUFFIXES = [
+    '개론', '원론', '기초', '실습', '세미나', '특강', '연구', '프로젝트', '설계1', '설계2',
+    '1', '2', '이론', '응용', '캡스톤디자인', '과현대사회', '와창의적사고', '실무', '방법론', '특론',
+]
+
+# 원본 분포를 흉내 낸 가중치
+COURSE_TYPES = (['전선', '전필', '교선', '교필선', '교필', '교직'], [973, 443, 206, 150, 44, 20])
+CREDITS = (['3', '1', '2', '0', '6', '0.5'], [1110, 307, 253, 133, 15, 6])
+CAPACITIES = (['-111', '0', '15', '20', '25', '30', '35', '40', '50'], [25, 13, 9, 15, 9, 17, 16, 8, 5])
+NOTES = ['현장전문가 활용 전공교육혁신모델 교과목', '원격수업', '영어강의', '{dept}/042-520-{phone}']
+
+# 강의시간 형식: (room-first, day-first, multi-period) 가중치
+DEFAULT_FORMAT_WEIGHTS = (90, 6, 4)
+
+
+def korean_names(count, rng):
+    """중복 없는 한국식 이름 count개 (부족하면 숫자 접미사)"""
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = rng.choice(SURNAMES) + rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+        if name in seen:
+            name += str(len(names))
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def building_codes(count):
+    """converter.BUILDING_MAP의 실제 건물 코드 먼저, 모자라면 두 글자 코드로 채움"""
+    codes = [code for code in BUILDING_MAP if code.isalpha()]
+    extra = (a + b for a in 'QRTUVXZ' for b in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    while len(codes) < count:
+        codes.append(next(extra))
+    return codes[:count]
+
+
+def period_mask(period):
+    """교시 -> 5분 단위 비트마스크 (07:00 기준)"""
+    start, end = (time_to_minutes(t) - 7 * 60 for t in PERIOD_TIMES[period])
+    return ((1 << ((end - start + 4) // 5)) - 1) << (start // 5)
+
+
+PERIOD_MASKS = {period: period_mask(period) for period in NUMERIC_PERIODS + LETTER_PERIODS}
+
+
+class RegistrarExportGenerator:
+    """시드 고정 합성 레코드 생성기 (iter_records()는 헤더 행부터 한 건씩 yield)"""
+
+    def __init__(self, sections, seed=0, buildings=19, rooms=None, professors=None, departments=60,
+                 placeholder_rate=0.15, multi_professor_rate=0.03, format_weights=DEFAULT_FORMAT_WEIGHTS):
+        if rooms is None:
+            rooms = -(-sections // SECTIONS_PER_ROOM)
+        if professors is None:
+            professors = -(-sections // SECTIONS_PER_PROFESSOR)
+        if min(sections, buildings, rooms, professors, departments) < 1:
+            raise ValueError("sections, buildings, rooms, professors, departments는 1 이상이어야 합니다.")
+        self.sections = sections
+        self.seed = seed
+        self.placeholder_rate = placeholder_rate
+        self.multi_professor_rate = multi_professor_rate
+        self.format_weights = format_weights
+        self.conflicts = 0
+
+        rng = random.Random(seed)
+        self.rng = rng
+        self.professors = korean_names(professors, rng)
+        self.departments = self._department_codes(departments, rng)
+        codes = building_codes(buildings)
+        self.rooms = [self._room_name(codes[i % len(codes)], i // len(codes)) for i in range(rooms)]
+        # (대상 번호, 요일) -> 점유 비트마스크 - 배정된 (강의실/교수, 요일)마다 하나씩 쌓이며 지우지 않음
+        self.room_busy = {}
+        self.professor_busy = {}
+
+    @staticmethod
+    def _department_codes(count, rng):
+        letters = 'ABCDEFGHIKLMNOPRSTUW'
+        codes = []
+        seen = set()
+        while len(codes) < count:
+            code = ''.join(rng.choice(letters) for _ in range(3))
+            if code not in seen and code != 'GEN':
+                seen.add(code)
+                codes.append(code)
+        return ['GEN'] + codes[:count - 1]
+
+    @staticmethod
+    def _room_name(building, index):
+        floor = index // 20 % 9 + 1
+        name = f"{building}{floor}{index % 20 + 1:02d}"
+        if index >= 180:
+            # 같은 호실 번호의 분실 (A516-1, G301-5)
+            name += f"-{index // 180}"
+        return name
+
+    def _is_free(self, busy, key, day, mask):
+        return not busy.get((key, day), 0) & mask
+
+    def _book(self, room, professors, day, mask):
+        self.room_busy[(room, day)] = self.room_busy.get((room, day), 0) | mask
+        for professor in professors:
+            self.professor_busy[(professor, day)] = self.professor_busy.get((professor, day), 0) | mask
+
+    def _meeting_pattern(self, rng):
+        """[(요일, [교시...]), ...] - 75분 교시 주 2회 또는 50분 교시 연강"""
+        if rng.random() < 0.45:
+            first = rng.randrange(3)
+            days = [DAYS_KOR[first], DAYS_KOR[first + 2]] if rng.random() < 0.7 else [rng.choice(DAYS_KOR)]
+            periods = [rng.choice(LETTER_PERIODS)]
+            if len(days) == 1:
+                start = LETTER_PERIODS.index(periods[0])
+                periods = LETTER_PERIODS[start:start + 2]
+            return [(day, periods) for day in days]
+        length = rng.choice([1, 2, 2, 3, 3, 4])
+        start = rng.randrange(len(NUMERIC_PERIODS) - length + 1)
+        days = rng.sample(DAYS_KOR, rng.choice([1, 1, 2]))
+        return [(day, NUMERIC_PERIODS[start:start + length]) for day in days]
+
+    def _room_free(self, room, masks):
+        return all(self._is_free(self.room_busy, room, day, mask) for day, mask in masks)
+
+    def _professors_free(self, professors, masks):
+        return all(self._is_free(self.professor_busy, p, day, mask) for p in professors for day, mask in masks)
+
+    def _schedule(self, rng, professors):
+        """
+        강의실/강의시간 문자열
+        겹치지 않는 강의실/시간을 무작위로 몇 번 찾아보고, 없으면 교수가 빈 시간에 대해 강의실을 차례로 훑음
+        그래도 없으면 겹친 채로 배정 (conflicts로 집계)
+        """
+        fallback = None
+        for _ in range(PLACEMENT_TRIES):
+            pattern = self._meeting_pattern(rng)
+            masks = [(day, sum(PERIOD_MASKS[p] for p in periods)) for day, periods in pattern]
+            room = rng.randrange(len(self.rooms))
+            if not self._professors_free(professors, masks):
+                continue
+            if self._room_free(room, masks):
+                break
+            fallback = fallback or (pattern, masks, room)
+        else:
+            free = None
+            if fallback:
+                pattern, masks, room = fallback
+                count = len(self.rooms)
+                free = next((r % count for r in range(room, room + count) if self._room_free(r % count, masks)), None)
+            if free is None:
+                self.conflicts += 1
+            else:
+                room = free
+        for day, mask in masks:
+            self._book(room, professors, day, mask)
+
+        name = self.rooms[room]
+        room_first, day_first, _ = self.format_weights
+        pick = rng.random() * sum(self.format_weights)
+        if pick >= room_first + day_first:
+            return ', '.join(f"{day} {','.join(periods)}({name})" for day, periods in pattern)
+        if pick >= room_first and all(len(p) == 1 for _, periods in pattern for p in periods):
+            # "화E(P203)" 형식은 한 글자 교시만 씀
+            return ', '.join(f"{day}{period}({name})" for day, periods in pattern for period in periods)
+        return ', '.join(f"{name}({day}{period})" for day, periods in pattern for period in periods)
+
+    def _record(self, rng, course, section_number):
+        code, subject, course_type, credit, department = course
+        professor_ids = [rng.randrange(len(self.professors))]
+        if rng.random() < self.multi_professor_rate:
+            professor_ids.append(rng.randrange(len(self.professors)))
+
+        if rng.random() < self.placeholder_rate:
+            slots = rng.choice(PLACEHOLDER_SLOTS)
+        else:
+            slots = self._schedule(rng, professor_ids)
+
+        capacity = rng.choices(*CAPACITIES)[0]
+        limit = int(capacity) if int(capacity) > 0 else 40
+        record = {'이수\n구분': course_type, '과목코드': code, '과목명': subject, '분반': f"{section_number:02d}"}
+        if course_type.startswith('교') and rng.random() < 0.01:
+            record['교양이수영역'] = rng.choice(['인문', '사회', '자연', '예술'])
+        if rng.random() > 0.007:
+            record['담당교수'] = ','.join(self.professors[i] for i in professor_ids)
+        hours = '0' if credit in ('0', '0.5') else str(rng.choice([1, 2, 3]))
+        record.update({
+            '학점': credit,
+            '강의시수': hours,
+            'Column9': rng.choice(['0', '0', '0', '2']),
+            '인원\n제한': capacity,
+            '수강\n인원': str(rng.randint(0, limit)),
+            '강의실/강의시간': slots,
+        })
+        if rng.random() < 0.38:
+            note = rng.choice(NOTES)
+            record['비고'] = note.format(dept=f"{department}학과", phone=rng.randint(5000, 5999))
+        record['강의계획서'] = '국문'
+        record['Column15'] = '영문'
+        return record
+
+    def iter_records(self):
+        rng = self.rng
+        yield dict(HEADER_ROW)
+        emitted = 0
+        course_index = 0
+        while emitted < self.sections:
+            department = self.departments[course_index % len(self.departments)]
+            number = 20000 + course_index // len(self.departments)
+            course = (
+                f"{department}{number}",
+                rng.choice(TOPICS) + rng.choice(SUFFIXES),
+                rng.choices(*COURSE_TYPES)[0],
+                rng.choices(*CREDITS)[0],
+                department,
+            )
+            count = min(rng.choice([1, 1, 1, 2, 2, 3, 4, 6]), self.sections - emitted)
+            for section_number in range(1, count + 1):
+                yield self._record(rng, course, section_number)
+            emitted += count
+            course_index += 1
+
+
+def write_export(path=OUTPUT_FILE, **options):
+    """합성 원본 파일을 path에 기록하고 생성기 반환 (conflicts 등 통계 확인용)"""
+    generator = RegistrarExportGenerator(**options)
+    with JSONArrayWriter(path) as writer:
+        for record in generator.iter_records():
+            writer.write(record)
+    return generator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 개설강좌 리스트 생성")
+    parser.add_argument('--sections', type=int, default=1836, help="분반 수 (헤더 행 제외 레코드 수)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--buildings', type=int, default=19)
+    parser.add_argument('--rooms', type=int, help=f"강의실 수 (기본: 분반 {SECTIONS_PER_ROOM}개당 1개)")
+    parser.add_argument('--professors', type=int, help=f"교수 수 (기본: 분반 {SECTIONS_PER_PROFESSOR}개당 1명)")
+    parser.add_argument('--departments', type=int, default=60)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    args = parser.parse_args()
+
+    generator = write_export(
+        args.output, sections=args.sections, seed=args.seed, buildings=args.buildings,
+        rooms=args.rooms, professors=args.professors, departments=args.departments
+    )
+    print(f"✅ {args.output} 생성 완료 (분반 {args.sections:,}개, 강의실 {len(generator.rooms):,}개, "
+          f"교수 {len(generator.professors):,}명, seed {args.seed})")
+    if generator.conflicts:
+        print(f"  ⚠️ 빈 강의실을 찾지 못해 겹친 채로 배정한 분반: {generator.conflicts:,}개")
+
+
+if __name__ == "__main__":
+    main()
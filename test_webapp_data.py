@@ -1,18 +1,43 @@
 #!/usr/bin/env python3
 """
 웹앱 데이터 연결 상태 검증
+
+사용법:
+    python3 test_webapp_data.py                   # timetable.json
+    python3 test_webapp_data.py --db timetable.db # SQLite 저장소의 timetable 뷰
 """
+import argparse
 import json
 from collections import Counter
 
+from create_lookups import build_lookups
+from timetable_db import SchemaVersionError, connect, load_records
+
+def load_data(db=None):
+    if not db:
+        with open('timetable.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    conn = connect(db)
+    try:
+        return load_records(conn)
+    finally:
+        conn.close()
+
 def main():
+    parser = argparse.ArgumentParser(description="웹앱 데이터 연결 상태 검증")
+    parser.add_argument('--db', help="timetable.json 대신 SQLite 저장소에서 읽기 (예: timetable.db)")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("🔍 웹앱 데이터 연결 검증")
     print("=" * 80)
     
     # 데이터 로드
-    with open('timetable.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    try:
+        data = load_data(args.db)
+    except SchemaVersionError as e:
+        print(f"🔴 {e}")
+        raise SystemExit(1)
     
     print(f"\n✅ 데이터 로드 성공: {len(data)}개 레코드\n")
     
@@ -21,18 +46,14 @@ def main():
     print("👨‍🏫 교수님 선택창 데이터")
     print("=" * 80)
     
-    professors = []
-    for item in data:
-        prof = item.get('professor', '').strip()
-        if prof and prof not in ['', '01', '02', '03', '04', '05', '06', '07', '08', '09', '10']:
-            professors.append(prof)
+    # 교수 선택창과 같은 규칙 (create_lookups.py) - 한 번 순회로 세션 수 집계
+    professors = build_lookups(data).professor_counts
     
-    unique_profs = sorted(set(professors))
+    unique_profs = sorted(professors)
     print(f"총 교수: {len(unique_profs)}명")
     print(f"\n샘플 (앞 20명):")
     for i, prof in enumerate(unique_profs[:20], 1):
-        count = professors.count(prof)
-        print(f"  {i:2d}. {prof} ({count}개 강의)")
+        print(f"  {i:2d}. {prof} ({professors[prof]}개 강의)")
     
     # 2. 건물별 검색 데이터
     print("\n" + "=" * 80)
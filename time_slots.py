@@ -0,0 +1,201 @@
+"""
+'강의실/강의시간' 문자열 공용 파서
+
+converter.py, convert_school_to_webapp.py, verify_times.py가 각자 들고 있던
+교시표와 정규식을 한 곳으로 모은 모듈입니다.
+ - 교시표(PERIOD_MAP)는 여기 하나만 유지합니다.
+ - 정규식은 모듈 로드 시 한 번만 컴파일합니다.
+ - 같은 슬롯 문자열은 LRU 캐시로 재사용하며, cache_stats()로 적중률을 확인할 수 있습니다.
+ - "HH:MM" <-> 자정 기준 분 변환(time_to_minutes / minutes_to_time)도 여기 하나만 둡니다.
+"""
+import re
+from functools import lru_cache
+
+DAY_MAP = {'월': 'MON', '화': 'TUE', '수': 'WED', '목': 'THU', '금': 'FRI', '토': 'SAT'}
+
+PERIOD_MAP = {
+    '0': {'start': '08:00', 'duration': 50}, '1': {'start': '09:00', 'duration': 50},
+    '2': {'start': '10:00', 'duration': 50}, '3': {'start': '11:00', 'duration': 50},
+    '4': {'start': '12:00', 'duration': 50}, '5': {'start': '13:00', 'duration': 50},
+    '6': {'start': '14:00', 'duration': 50}, '7': {'start': '15:00', 'duration': 50},
+    '8': {'start': '16:00', 'duration': 50}, '9': {'start': '17:00', 'duration': 50},
+    '10': {'start': '18:00', 'duration': 50}, '11': {'start': '19:00', 'duration': 50},
+    '12': {'start': '20:00', 'duration': 50}, '13': {'start': '21:00', 'duration': 50},
+    'Z': {'start': '08:10', 'duration': 75}, 'A': {'start': '09:30', 'duration': 75},
+    'B': {'start': '11:00', 'duration': 75}, 'C': {'start': '13:30', 'duration': 75},
+    'D': {'start': '15:00', 'duration': 75}, 'E': {'start': '16:30', 'duration': 75},
+    'F': {'start': '18:00', 'duration': 75}, 'G': {'start': '19:30', 'duration': 75},
+    'H': {'start': '21:00', 'duration': 75},
+}
+
+# 시간/강의실 정보가 없는 자리표시자 (-> ONLINE 처리)
+PLACEHOLDERS = ('(?)', '(), ()', '')
+
+# 교시 코드 하나: 두 자리 숫자 교시(10~13)를 한 자리보다 먼저 시도
+PERIOD = r'(1[0-3]|\d|[A-Z])'
+# 형식: "J202(목A)", "J123(수12)"
+ROOM_FIRST_RE = re.compile(r'([\w.-]+)\s*\(([가-힣])' + PERIOD + r'\)')
+# 형식: "화E(P203)"
+DAY_FIRST_RE = re.compile(r'([가-힣])' + PERIOD + r'\(([\w.-]+)\)')
+# 형식: "목 A,B(J202)"
+MULTI_PERIOD_RE = re.compile(r'([가-힣])\s+([A-Z\d,]+)\(([\w.-]+)\)')
+# 슬롯 구분: 쉼표로 나누되 "목 A,B(J202)"는 교시 사이 쉼표에서 자르지 않고 한 조각으로
+FRAGMENT_RE = re.compile(r'[가-힣]\s+[A-Z\d]+(?:,[A-Z\d]+)+\([\w.-]+\)|[^,]+')
+
+# (슬롯 문자열, parse_slot_string 결과) - python3 time_slots.py로 확인하는 회귀 사례
+SELF_CHECKS = [
+    ('J202(목A)', (('THU', '09:30', '10:45', 'J202'),)),
+    ('J123(수12)', (('WED', '20:00', '20:50', 'J123'),)),
+    ('화13(P203)', (('TUE', '21:00', '21:50', 'P203'),)),
+    ('J209(금10), J209(금11), J209(금12)',
+     (('FRI', '18:00', '18:50', 'J209'), ('FRI', '19:00', '19:50', 'J209'), ('FRI', '20:00', '20:50', 'J209'))),
+    ('목 A,B(J202)', (('THU', '09:30', '10:45', 'J202'), ('THU', '11:00', '12:15', 'J202'))),
+    ('목 A,B(J202), W310(수7)',
+     (('THU', '09:30', '10:45', 'J202'), ('THU', '11:00', '12:15', 'J202'), ('WED', '15:00', '15:50', 'W310'))),
+    ('MC515(목14)', ()),
+    ('(?)', ()),
+]
+
+# 슬롯 문자열 캐시 크기 (한 학기 고유 문자열은 수천 개 수준)
+CACHE_SIZE = 8192
+
+
+def time_to_minutes(value):
+    """"HH:MM" -> 자정 기준 분 (빈 값/형식 오류는 ValueError 또는 AttributeError - 빈 값 처리는 호출 측에서)"""
+    h, m = value.split(':')
+    return int(h) * 60 + int(m)
+
+
+def minutes_to_time(value):
+    """자정 기준 분 -> "HH:MM" (음수는 시각 없음 -> '')"""
+    if value < 0:
+        return ''
+    return f"{value // 60:02d}:{value % 60:02d}"
+
+
+def calculate_end_time(start_time, duration):
+    if not start_time: return ''
+    return minutes_to_time(time_to_minutes(start_time) + duration)
+
+
+# 교시 코드 -> (시작, 종료) 미리 계산
+PERIOD_TIMES = {
+    period: (info['start'], calculate_end_time(info['start'], info['duration']))
+    for period, info in PERIOD_MAP.items()
+}
+
+
+def match_fragment(part):
+    """조각 하나 -> (정규식 분기 이름, 요일(한글), 교시 목록, 강의실), 어느 형식에도 맞지 않으면 None"""
+    match = ROOM_FIRST_RE.match(part)
+    if match:
+        classroom, day_kor, period = match.groups()
+        return 'room_first', day_kor, [period], classroom
+    match = DAY_FIRST_RE.match(part)
+    if match:
+        day_kor, period, classroom = match.groups()
+        return 'day_first', day_kor, [period], classroom
+    match = MULTI_PERIOD_RE.match(part)
+    if match:
+        day_kor, periods_str, classroom = match.groups()
+        return 'multi_period', day_kor, periods_str.split(','), classroom
+    return None
+
+
+def split_fragments(time_str):
+    """슬롯 문자열 -> 앞뒤 공백을 뗀 조각 리스트 (빈 조각 제외)"""
+    return [part.strip() for part in FRAGMENT_RE.findall(time_str) if part.strip()]
+
+
+def parse_fragment(part):
+    """
+    split_fragments로 나눈 조각 하나를 (day, start, end, classroom) 튜플 리스트로 변환
+    예: "J202(목A)" -> [("THU", "09:30", "10:45", "J202")]
+    """
+    part = part.strip()
+    if not part:
+        return []
+
+    matched = match_fragment(part)
+    if not matched:
+        return []
+    _, day_kor, periods, classroom = matched
+
+    day_eng = DAY_MAP.get(day_kor)
+    if not day_eng:
+        return []
+
+    slots = []
+    for period in periods:
+        times = PERIOD_TIMES.get(period.strip().upper())
+        if times:
+            slots.append((day_eng, times[0], times[1], classroom))
+    return slots
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_slot_string(time_str):
+    """
+    '강의실/강의시간' 전체 문자열을 (day, start, end, classroom) 튜플의 튜플로 변환
+    결과가 비어 있으면 호출 측에서 ONLINE으로 처리합니다.
+    """
+    if not time_str or time_str.strip() in PLACEHOLDERS:
+        return ()
+
+    # 여러 강의 시간은 쉼표로 구분: "J202(목A), J202(목B)"
+    slots = []
+    for part in split_fragments(time_str):
+        slots.extend(parse_fragment(part))
+    return tuple(slots)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def slot_patterns(time_str):
+    """
+    조각마다 읽힌 정규식 분기 이름 (계측용 - instrumentation.py)
+    'room_first' / 'day_first' / 'multi_period' / 'no_match', 자리표시자 전체는 'placeholder'
+    """
+    if not time_str or time_str.strip() in PLACEHOLDERS:
+        return ('placeholder',)
+    names = []
+    for part in split_fragments(time_str):
+        matched = match_fragment(part)
+        names.append(matched[0] if matched else 'no_match')
+    return tuple(names)
+
+
+def cache_stats():
+    """parse_slot_string 캐시 통계 (hits, misses, size, hit_rate)"""
+    info = parse_slot_string.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_cache():
+    parse_slot_string.cache_clear()
+    slot_patterns.cache_clear()
+
+
+def run_self_checks():
+    """SELF_CHECKS 회귀 사례 확인 -> 실패 목록 [(문자열, 기대, 실제)]"""
+    clear_cache()
+    return [
+        (time_str, expected, parse_slot_string(time_str))
+        for time_str, expected in SELF_CHECKS
+        if parse_slot_string(time_str) != expected
+    ]
+
+
+if __name__ == "__main__":
+    failures = run_self_checks()
+    for time_str, expected, actual in failures:
+        print(f"🔴 {time_str!r}: 예상 {expected}, 실제 {actual}")
+    if failures:
+        raise SystemExit(1)
+    print(f"✅ 슬롯 파서 회귀 사례 {len(SELF_CHECKS)}개 통과")
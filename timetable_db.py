@@ -0,0 +1,416 @@
+"""
+SQLite 시간표 저장소 (timetable.db)
+
+converter.py --db 또는 이 스크립트로 timetable.json을 정규화된 테이블로 옮겨,
+분석/검증 스크립트가 JSON을 다시 파싱하고 리스트를 훑는 대신 SQL로 바로 질의할 수 있게 합니다.
+
+테이블:
+    courses(code, subject, credits, department)                        -- 속성이 다르면 같은 과목코드라도 다른 행
+    sections(course_id, class_number, student_count, type, professor)  -- professor는 원문 그대로, 속성 전체가 키
+    professors(name), section_professors(section_id, professor_id)     -- 쉼표로 묶인 공동 담당 분리
+    rooms(building, room)
+    meetings(section_id, day, start, end, start_minute, end_minute, room_id, seq)
+    subjects_fts  -- 과목명/과목코드 FTS5 (trigram 토크나이저가 있으면 부분 문자열 검색 가능)
+                     trigram은 3글자 미만 질의("영어", "수학")를 찾지 못하므로 그때는 LIKE로 검색
+    timetable     -- timetable.json과 같은 모양의 뷰 (seq 순서 = 원래 순서)
+
+인덱스: meetings(day, start_minute, end_minute, ...), rooms(building, room), section_professors(professor_id, ...)
+
+사용법:
+    python3 timetable_db.py build
+    python3 timetable_db.py query free-rooms MON 10:30
+    python3 timetable_db.py sql "SELECT day, COUNT(*) FROM timetable GROUP BY day"
+    python3 timetable_db.py check    # 검색 회귀 사례 (SEARCH_CHECKS)
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+from time_slots import time_to_minutes
+
+DB_FILE = 'timetable.db'
+SCHEMA_VERSION = 2
+
+RECORD_FIELDS = [
+    'code', 'subject', 'professor', 'credits', 'department', 'class_number', 'student_count',
+    'day', 'start', 'end', 'classroom', 'building_name', 'type'
+]
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE courses (
+    id INTEGER PRIMARY KEY,
+    code TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    credits TEXT NOT NULL,
+    department TEXT NOT NULL,
+    UNIQUE (code, subject, credits, department)
+);
+CREATE TABLE sections (
+    id INTEGER PRIMARY KEY,
+    course_id INTEGER NOT NULL REFERENCES courses(id),
+    class_number TEXT NOT NULL,
+    student_count INTEGER,
+    type TEXT NOT NULL,
+    professor TEXT NOT NULL,
+    UNIQUE (course_id, class_number, student_count, type, professor)
+);
+CREATE TABLE professors (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE section_professors (
+    section_id INTEGER NOT NULL REFERENCES sections(id),
+    professor_id INTEGER NOT NULL REFERENCES professors(id),
+    PRIMARY KEY (section_id, professor_id)
+);
+CREATE TABLE rooms (
+    id INTEGER PRIMARY KEY,
+    building TEXT NOT NULL,
+    room TEXT NOT NULL,
+    UNIQUE (building, room)
+);
+CREATE TABLE meetings (
+    id INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    section_id INTEGER NOT NULL REFERENCES sections(id),
+    day TEXT NOT NULL,
+    start TEXT NOT NULL,
+    "end" TEXT NOT NULL,
+    start_minute INTEGER,
+    end_minute INTEGER,
+    room_id INTEGER REFERENCES rooms(id)
+);
+-- 요일/시간 범위 질의가 테이블을 읽지 않도록 필요한 컬럼을 모두 포함 (covering index)
+CREATE INDEX meetings_day_time ON meetings (day, start_minute, end_minute, room_id, section_id);
+CREATE INDEX meetings_room ON meetings (room_id, day, start_minute, end_minute);
+CREATE INDEX meetings_section ON meetings (section_id);
+CREATE INDEX section_professors_professor ON section_professors (professor_id, section_id);
+
+CREATE VIEW timetable AS
+SELECT c.code, c.subject, s.professor, c.credits, c.department, s.class_number, s.student_count,
+       m.day, m.start, m."end", COALESCE(r.room, '') AS classroom, COALESCE(r.building, '') AS building_name,
+       s.type, m.seq
+FROM meetings m
+JOIN sections s ON s.id = m.section_id
+JOIN courses c ON c.id = s.course_id
+LEFT JOIN rooms r ON r.id = m.room_id
+ORDER BY m.seq;
+"""
+
+# 자주 쓰는 질의 (query 서브커맨드)
+QUERIES = {
+    'top-professors': (
+        "강의 시간(슬롯) 기준 상위 교수",
+        """SELECT s.professor, COUNT(*) AS slots
+           FROM meetings m JOIN sections s ON s.id = m.section_id
+           WHERE s.professor != '' GROUP BY s.professor ORDER BY slots DESC LIMIT :limit""",
+        {'limit': 10}
+    ),
+    'free-rooms': (
+        "day, time 시점에 비어 있는 강의실 (예: MON 10:30)",
+        """SELECT r.building, r.room FROM rooms r
+           WHERE r.building != '' AND r.room != '' AND NOT EXISTS (
+               SELECT 1 FROM meetings m
+               WHERE m.room_id = r.id AND m.day = :day
+                 AND m.start_minute <= :minute AND m.end_minute > :minute)
+           ORDER BY r.building, r.room""",
+        {}
+    ),
+    'professor': (
+        "교수 한 명의 시간표 (예: 홍길동)",
+        """SELECT t.code, t.subject, t.class_number, t.day, t.start, t."end", t.building_name, t.classroom
+           FROM professors p
+           JOIN section_professors sp ON sp.professor_id = p.id
+           JOIN meetings m ON m.section_id = sp.section_id
+           JOIN timetable t ON t.seq = m.seq
+           WHERE p.name = :name ORDER BY m.seq""",
+        {}
+    ),
+    'search': (
+        "과목명/과목코드 전문 검색 (예: 프로그래밍)",
+        """SELECT c.code, c.subject FROM subjects_fts f JOIN courses c ON c.id = f.rowid
+           WHERE subjects_fts MATCH :text ORDER BY c.id LIMIT :limit""",
+        {'limit': 50}
+    ),
+    'buildings': (
+        "건물별 강의 수",
+        """SELECT r.building, COUNT(*) AS sessions FROM meetings m JOIN rooms r ON r.id = m.room_id
+           WHERE r.building != '' GROUP BY r.building ORDER BY sessions DESC""",
+        {}
+    ),
+}
+
+
+# trigram 토크나이저가 찾을 수 있는 최소 질의 길이 - 더 짧으면 SHORT_SEARCH_SQL
+TRIGRAM_LENGTH = 3
+SHORT_SEARCH_SQL = """SELECT c.code, c.subject FROM courses c
+    WHERE c.subject LIKE :pattern ESCAPE '\\' OR c.code LIKE :pattern ESCAPE '\\'
+    ORDER BY c.id LIMIT :limit"""
+
+# 검색 회귀 사례: (질의, 기대 과목코드 목록) - SEARCH_FIXTURE로 만든 DB에서 확인
+SEARCH_FIXTURE = [
+    {'code': 'GEN1001', 'subject': '영어회화', 'class_number': '01', 'day': 'MON', 'start': '09:00', 'end': '10:15'},
+    {'code': 'MAT2001', 'subject': '공업수학', 'class_number': '01', 'day': 'TUE', 'start': '10:30', 'end': '11:45'},
+    {'code': 'CSE3001', 'subject': '인공지능개론', 'class_number': '01', 'day': 'WED', 'start': '13:00', 'end': '14:15'},
+    {'code': 'CSE3002', 'subject': '자료구조(50%원격)', 'class_number': '02', 'day': 'ONLINE', 'start': '', 'end': ''},
+]
+SEARCH_CHECKS = [
+    ('영어', ['GEN1001']),
+    ('수학', ['MAT2001']),
+    ('인공', ['CSE3001']),
+    ('인공지능', ['CSE3001']),
+    ('구', ['CSE3002']),
+    ('CSE', ['CSE3001', 'CSE3002']),
+    ('50%', ['CSE3002']),
+    ('5_', []),
+]
+
+
+def minute_or_null(value):
+    """시각이 없는 세션(ONLINE 등)은 NULL"""
+    return time_to_minutes(value) if value else None
+
+
+def fts_tokenizer(conn):
+    row = conn.execute("SELECT value FROM meta WHERE key = 'fts_tokenizer'").fetchone()
+    return row[0] if row else ''
+
+
+def escape_like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class SchemaVersionError(Exception):
+    pass
+
+
+def connect(path=DB_FILE):
+    """
+    build_database로 만든 저장소 열기
+    파일이 없으면 FileNotFoundError (빈 DB를 새로 만들지 않음),
+    meta.schema_version이 SCHEMA_VERSION과 다르면 SchemaVersionError (예전 스키마로 잘못 질의하지 않도록)
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None              # meta 테이블이 없거나 SQLite 파일이 아님
+    version = row[0] if row else None
+    if version != str(SCHEMA_VERSION):
+        conn.close()
+        command = "python3 timetable_db.py" + ("" if path == DB_FILE else f" --db {path}") + " build"
+        raise SchemaVersionError(
+            f"{path}의 스키마 버전({version or '없음'})이 현재 버전({SCHEMA_VERSION})과 다릅니다. "
+            f"'{command}'로 다시 만드세요."
+        )
+    return conn
+
+
+def create_fts(conn):
+    """trigram 토크나이저(SQLite 3.34+)가 있으면 사용해 한글 부분 문자열 검색을 지원"""
+    for tokenizer in ('trigram', 'unicode61'):
+        try:
+            conn.execute(f"CREATE VIRTUAL TABLE subjects_fts USING fts5(subject, code, tokenize='{tokenizer}')")
+            return tokenizer
+        except sqlite3.OperationalError:
+            continue
+    return None
+
+
+def build_database(timetable, path=DB_FILE, source=None):
+    """timetable 레코드(목록 또는 iter_json_array처럼 한 번만 훑는 이터러블)로 path에 새 DB를 만듦 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    tokenizer = create_fts(conn)
+
+    courses, sections, professors, rooms = {}, {}, {}, {}
+    count = 0
+
+    def row_id(cache, key, insert_sql, values):
+        if key not in cache:
+            cache[key] = conn.execute(insert_sql, values).lastrowid
+        return cache[key]
+
+    with conn:
+        for seq, item in enumerate(timetable):
+            count += 1
+            # 첫 행의 속성으로 합치지 않도록 속성 전체를 키로 (같은 과목코드/분반이라도 값이 다르면 다른 행)
+            course_key = (item.get('code') or '', item.get('subject') or '',
+                          item.get('credits') or '', item.get('department') or '')
+            course_id = row_id(courses, course_key,
+                               "INSERT INTO courses (code, subject, credits, department) VALUES (?, ?, ?, ?)",
+                               course_key)
+            section_key = (course_id, item.get('class_number') or '', item.get('student_count'),
+                           item.get('type') or '', item.get('professor') or '')
+            is_new_section = section_key not in sections
+            section_id = row_id(sections, section_key,
+                                "INSERT INTO sections (course_id, class_number, student_count, type, professor) "
+                                "VALUES (?, ?, ?, ?, ?)",
+                                section_key)
+            if is_new_section:
+                for name in (item.get('professor') or '').split(','):
+                    name = name.strip()
+                    if name:
+                        professor_id = row_id(professors, name,
+                                              "INSERT INTO professors (name) VALUES (?)", (name,))
+                        conn.execute("INSERT OR IGNORE INTO section_professors VALUES (?, ?)",
+                                     (section_id, professor_id))
+
+            building, room = item.get('building_name') or '', item.get('classroom') or ''
+            room_id = None
+            if building or room:
+                room_id = row_id(rooms, (building, room),
+                                 "INSERT INTO rooms (building, room) VALUES (?, ?)", (building, room))
+
+            conn.execute(
+                'INSERT INTO meetings (seq, section_id, day, start, "end", start_minute, end_minute, room_id) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (seq, section_id, item.get('day') or '', item.get('start') or '', item.get('end') or '',
+                 minute_or_null(item.get('start')), minute_or_null(item.get('end')), room_id)
+            )
+
+        if tokenizer:
+            conn.execute("INSERT INTO subjects_fts (rowid, subject, code) SELECT id, subject, code FROM courses")
+
+        meta = {
+            'schema_version': str(SCHEMA_VERSION),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'sessions': str(count),
+            'fts_tokenizer': tokenizer or '',
+        }
+        if source:
+            with open(source, 'rb') as f:
+                meta['source'] = os.path.basename(source)
+                meta['source_sha256'] = hashlib.sha256(f.read()).hexdigest()
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+
+    conn.execute("ANALYZE")
+    conn.close()
+    os.replace(tmp_path, path)
+    return {
+        'courses': len(courses), 'sections': len(sections), 'professors': len(professors),
+        'rooms': len(rooms), 'meetings': count, 'fts_tokenizer': tokenizer
+    }
+
+
+def iter_records(conn):
+    """timetable 뷰를 timetable.json과 같은 순서 / 모양의 dict로 한 건씩 읽음"""
+    for row in conn.execute("SELECT * FROM timetable"):
+        yield {field: row[field] for field in RECORD_FIELDS}
+
+
+def load_records(conn):
+    """timetable 뷰를 timetable.json과 같은 dict 목록으로 읽음"""
+    return list(iter_records(conn))
+
+
+def run_query(conn, name, args):
+    description, sql, defaults = QUERIES[name]
+    params = dict(defaults)
+    if name == 'free-rooms':
+        if len(args) != 2:
+            raise ValueError(description)
+        params.update(day=args[0], minute=time_to_minutes(args[1]))
+    elif name == 'professor':
+        params['name'] = ' '.join(args)
+    elif name == 'search':
+        text = ' '.join(args)
+        if len(text) < TRIGRAM_LENGTH or fts_tokenizer(conn) != 'trigram':
+            # trigram은 3글자 미만을 찾지 못하고, unicode61은 단어 단위라 부분 문자열을 못 찾음
+            sql = SHORT_SEARCH_SQL
+            params['pattern'] = '%' + escape_like(text) + '%'
+        else:
+            # FTS5 질의 문법과 충돌하지 않도록 문구 검색으로 감쌈
+            params['text'] = '"' + text.replace('"', '""') + '"'
+    elif args:
+        params['limit'] = int(args[0])
+    return conn.execute(sql, params).fetchall()
+
+
+def run_search_checks():
+    """SEARCH_FIXTURE로 임시 DB를 만들어 SEARCH_CHECKS 확인 -> 실패 목록 [(질의, 기대, 실제)]"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, DB_FILE)
+        build_database(SEARCH_FIXTURE, path)
+        conn = connect(path)
+        try:
+            failures = []
+            for query, expected in SEARCH_CHECKS:
+                actual = [row['code'] for row in run_query(conn, 'search', [query])]
+                if actual != expected:
+                    failures.append((query, expected, actual))
+            return failures
+        finally:
+            conn.close()
+
+
+def print_rows(rows, elapsed):
+    if rows:
+        print(' | '.join(rows[0].keys()))
+    for row in rows:
+        print(' | '.join('' if value is None else str(value) for value in row))
+    print(f"({len(rows)}행, {elapsed * 1000:.1f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite 시간표 저장소")
+    parser.add_argument('--db', default=DB_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="timetable.json -> timetable.db")
+    build.add_argument('--timetable', default='timetable.json')
+    query = sub.add_parser('query', help="미리 정의된 질의 실행")
+    query.add_argument('name', choices=list(QUERIES))
+    query.add_argument('args', nargs='*')
+    sql = sub.add_parser('sql', help="임의의 SQL 실행")
+    sql.add_argument('statement')
+    sub.add_parser('check', help="검색 회귀 사례 확인 (2글자 질의 등)")
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        failures = run_search_checks()
+        for query, expected, actual in failures:
+            print(f"🔴 search {query!r}: 예상 {expected}, 실제 {actual}")
+        if failures:
+            raise SystemExit(1)
+        print(f"✅ 검색 회귀 사례 {len(SEARCH_CHECKS)}개 통과")
+        return
+
+    if args.command == 'build':
+        with open(args.timetable, 'r', encoding='utf-8') as f:
+            timetable = json.load(f)
+        counts = build_database(timetable, args.db, args.timetable)
+        print(f"✅ {args.db} 생성 완료: 과목 {counts['courses']}개, 분반 {counts['sections']}개, "
+              f"세션 {counts['meetings']}개, 교수 {counts['professors']}명, 강의실 {counts['rooms']}개 "
+              f"(FTS5: {counts['fts_tokenizer'] or '없음'})")
+        return
+
+    if not os.path.exists(args.db):
+        print(f"🔴 {args.db}이(가) 없습니다. 'python3 timetable_db.py build'를 먼저 실행하세요.")
+        return
+    try:
+        conn = connect(args.db)
+    except SchemaVersionError as e:
+        print(f"🔴 {e}")
+        return
+    started = time.perf_counter()
+    try:
+        if args.command == 'query':
+            rows = run_query(conn, args.name, args.args)
+        else:
+            rows = conn.execute(args.statement).fetchall()
+    except (sqlite3.Error, ValueError) as e:
+        print(f"🔴 질의 실패: {e}")
+        return
+    print_rows(rows, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
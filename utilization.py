@@ -0,0 +1,203 @@
+"""
+강의실 활용률 / 히트맵 분석 (NumPy 벡터화)
+
+timetable.columnar.json의 정수 컬럼(요일, 시작/종료 분, 건물/강의실 사전 인덱스, 수강 인원)을
+그대로 NumPy 배열로 올려, 행마다 파이썬 루프를 돌지 않고 다음을 계산합니다.
+ - 강의실 x 요일 x 5분 슬롯 점유 행렬 (차분 배열 + 누적합, 동시 사용 수 포함)
+ - 건물별 / 시간대별 활용률 (운영 시간 대비 점유 비율)
+ - 수강 인원 가중 좌석-시간 (건물별, 요일 x 시간별)
+ - 요일 x 시간 히트맵 데이터 ({x, y, v} 점 목록 - chartjs-chart-matrix 데이터 형식)
+
+numpy가 필요합니다 (pip install numpy).
+
+사용법:
+    python3 utilization.py                            # utilization.json
+    python3 utilization.py --open 09:00 --close 18:00 --days MON TUE WED THU FRI
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from columnar import COLUMNAR_OUTPUT_FILE, encode_columnar
+from occupancy import DAY_END_MINUTE, DAY_START_MINUTE, DAYS, SLOT_MINUTES, SLOTS_PER_DAY
+from time_slots import time_to_minutes
+
+UTILIZATION_FILE = 'utilization.json'
+FORMAT_VERSION = 1
+SLOTS_PER_HOUR = 60 // SLOT_MINUTES
+HOURS = list(range(DAY_START_MINUTE // 60, DAY_END_MINUTE // 60))
+WEEKDAYS = DAYS[:5]
+
+
+class TimetableArrays:
+    """오프라인 세션(요일/시간/강의실이 모두 있는 행)만 담은 컬럼 배열"""
+
+    def __init__(self, payload):
+        columns = payload["columns"]
+        strings = payload["strings"]
+        day_codes = np.asarray(payload["days"])
+
+        day_code = np.asarray(columns["day"], dtype=np.int16)
+        start = np.asarray(columns["start"], dtype=np.int32)
+        end = np.asarray(columns["end"], dtype=np.int32)
+        building = np.asarray(columns["building_name"], dtype=np.int32)
+        classroom = np.asarray(columns["classroom"], dtype=np.int32)
+        students = np.asarray(columns.get("student_count", np.zeros(len(day_code))), dtype=np.int32)
+
+        # 컬럼형 요일 코드 -> DAYS 인덱스 (-1 = ONLINE / 미정)
+        day_index = np.array([DAYS.index(code) if code in DAYS else -1 for code in day_codes], dtype=np.int16)
+        day = day_index[day_code]
+
+        blank_building = np.array([not s.strip() for s in strings["building_name"]])
+        blank_classroom = np.array([not s.strip() for s in strings["classroom"]])
+        valid = (day >= 0) & (start >= 0) & (end > start) & ~blank_building[building] & ~blank_classroom[classroom]
+
+        # (건물, 강의실) 쌍 -> 강의실 번호
+        pair = building[valid].astype(np.int64) * len(strings["classroom"]) + classroom[valid]
+        keys, self.room = np.unique(pair, return_inverse=True)
+        room_building = keys // len(strings["classroom"])
+        room_classroom = keys % len(strings["classroom"])
+        self.rooms = [
+            (strings["building_name"][b], strings["classroom"][c]) for b, c in zip(room_building, room_classroom)
+        ]
+        self.buildings, self.room_building = np.unique(
+            np.asarray(strings["building_name"], dtype=object)[room_building].astype(str), return_inverse=True
+        )
+
+        self.day = day[valid].astype(np.int64)
+        self.start = np.clip(start[valid], DAY_START_MINUTE, DAY_END_MINUTE)
+        self.end = np.clip(end[valid], DAY_START_MINUTE, DAY_END_MINUTE)
+        self.students = students[valid]
+        self.session_building = self.room_building[self.room]
+
+    @classmethod
+    def load(cls, columnar_path=COLUMNAR_OUTPUT_FILE, timetable_path='timetable.json'):
+        if os.path.exists(columnar_path):
+            with open(columnar_path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        with open(timetable_path, 'r', encoding='utf-8') as f:
+            return cls(encode_columnar(json.load(f)))
+
+    def __len__(self):
+        return len(self.day)
+
+    def _slot_bounds(self):
+        """세션마다 [첫 슬롯, 끝 슬롯) - 구간과 조금이라도 겹치는 슬롯 포함"""
+        first = (self.start - DAY_START_MINUTE) // SLOT_MINUTES
+        last = -(-(self.end - DAY_START_MINUTE) // SLOT_MINUTES)
+        return first, last
+
+    def concurrency(self):
+        """강의실 x 요일 x 슬롯 동시 사용 세션 수 (int16) - 1 이상이면 사용 중, 2 이상이면 중복 배정"""
+        first, last = self._slot_bounds()
+        diff = np.zeros((len(self.rooms), len(DAYS), SLOTS_PER_DAY + 1), dtype=np.int16)
+        np.add.at(diff, (self.room, self.day, first), 1)
+        np.add.at(diff, (self.room, self.day, last), -1)
+        return np.cumsum(diff[:, :, :SLOTS_PER_DAY], axis=2, dtype=np.int16)
+
+    def seat_slots(self):
+        """요일 x 슬롯 동시 착석 인원 (수강 인원 가중)"""
+        first, last = self._slot_bounds()
+        diff = np.zeros((len(DAYS), SLOTS_PER_DAY + 1), dtype=np.int64)
+        np.add.at(diff, (self.day, first), self.students)
+        np.add.at(diff, (self.day, last), -self.students)
+        return np.cumsum(diff[:, :SLOTS_PER_DAY], axis=1)
+
+
+def window_mask(days, open_minute, close_minute):
+    """요일 x 슬롯 운영 시간 마스크"""
+    slot_start = DAY_START_MINUTE + np.arange(SLOTS_PER_DAY) * SLOT_MINUTES
+    in_hours = (slot_start >= open_minute) & (slot_start < close_minute)
+    in_days = np.isin(np.asarray(DAYS), days)
+    return in_days[:, None] & in_hours[None, :]
+
+
+def compute_utilization(arrays, days=WEEKDAYS, open_time='09:00', close_time='18:00'):
+    """활용률 / 좌석-시간 / 히트맵 dict (utilization.json 내용)"""
+    concurrency = arrays.concurrency()
+    occupied = concurrency > 0
+    window = window_mask(days, time_to_minutes(open_time), time_to_minutes(close_time))
+    window_slots = int(window.sum())
+    room_busy = (occupied & window).sum(axis=(1, 2))
+
+    # 건물별: 강의실 운영 슬롯 중 사용 슬롯 비율
+    building_rooms = np.bincount(arrays.room_building, minlength=len(arrays.buildings))
+    building_busy = np.bincount(arrays.room_building, weights=room_busy, minlength=len(arrays.buildings))
+    building_util = building_busy / np.maximum(building_rooms * window_slots, 1)
+    durations = (arrays.end - arrays.start) / 60
+    building_seat_hours = np.bincount(
+        arrays.session_building, weights=arrays.students * durations, minlength=len(arrays.buildings)
+    )
+
+    # 요일 x 시간: 전체 강의실 중 사용 중인 비율 (시간 내 슬롯 평균)
+    by_slot = occupied.mean(axis=0)                                   # 요일 x 슬롯
+    by_hour = by_slot.reshape(len(DAYS), len(HOURS), SLOTS_PER_HOUR).mean(axis=2)
+    seats_by_hour = arrays.seat_slots().reshape(len(DAYS), len(HOURS), SLOTS_PER_HOUR).sum(axis=2)
+    seats_by_hour = seats_by_hour * SLOT_MINUTES / 60                 # 좌석-시간
+    day_mask = np.isin(np.asarray(DAYS), days)
+    hour_util = by_hour[day_mask].mean(axis=0)
+
+    def pct(value):
+        return round(float(value) * 100, 1)
+
+    return {
+        "version": FORMAT_VERSION,
+        "window": {"days": list(days), "open": open_time, "close": close_time},
+        "sessions": len(arrays),
+        "rooms": len(arrays.rooms),
+        "overall_utilization": pct(room_busy.sum() / max(len(arrays.rooms) * window_slots, 1)),
+        "double_booked_slots": int((concurrency > 1).sum()),
+        "buildings": {
+            str(name): {
+                "rooms": int(building_rooms[i]),
+                "utilization": pct(building_util[i]),
+                "seat_hours": round(float(building_seat_hours[i]), 1),
+            }
+            for i, name in enumerate(arrays.buildings)
+        },
+        "hours": {f"{hour:02d}": pct(hour_util[i]) for i, hour in enumerate(HOURS)},
+        "heatmap": {
+            "x": [f"{hour:02d}" for hour in HOURS],
+            "y": DAYS,
+            "data": [
+                {"x": f"{hour:02d}", "y": day, "v": pct(by_hour[d, h]), "seats": round(float(seats_by_hour[d, h]), 1)}
+                for d, day in enumerate(DAYS) for h, hour in enumerate(HOURS)
+            ],
+        },
+    }
+
+
+def print_summary(result):
+    window = result["window"]
+    print(f"--- 강의실 활용률 ({', '.join(window['days'])} {window['open']}-{window['close']}) ---")
+    print(f"강의실 {result['rooms']}개, 세션 {result['sessions']}개, 전체 활용률 {result['overall_utilization']}%")
+    if result["double_booked_slots"]:
+        print(f"⚠️ 중복 배정된 강의실-슬롯: {result['double_booked_slots']}개 (5분 단위)")
+    print("\n[건물별]")
+    ranked = sorted(result["buildings"].items(), key=lambda x: x[1]["utilization"], reverse=True)
+    for name, stats in ranked:
+        print(f"  {name}: {stats['utilization']:5.1f}% (강의실 {stats['rooms']}개, 좌석-시간 {stats['seat_hours']:,.0f})")
+    print("\n[시간대별]")
+    for hour, value in result["hours"].items():
+        print(f"  {hour}시: {value:5.1f}% {'█' * int(value // 2)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의실 활용률 / 히트맵 분석")
+    parser.add_argument('--days', nargs='+', default=WEEKDAYS, choices=DAYS, help="운영 요일")
+    parser.add_argument('--open', default='09:00', help="운영 시작 시각")
+    parser.add_argument('--close', default='18:00', help="운영 종료 시각")
+    parser.add_argument('--output', default=UTILIZATION_FILE)
+    args = parser.parse_args()
+
+    result = compute_utilization(TimetableArrays.load(), args.days, args.open, args.close)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, separators=(',', ':'))
+    print_summary(result)
+    print(f"\n✅ {args.output} 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
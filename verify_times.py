@@ -1,116 +1,172 @@
+import argparse
 import json
-import re
+import os
+import sys
+from collections import Counter, defaultdict, deque
 
-def verify_timetable_times():
+from converter import OUTPUT_FILE, SOURCE_FILE, convert_record, iter_raw_records
+from session import Session
+from streaming import iter_json_array
+from timetable_db import SchemaVersionError, connect, iter_records
+
+# 세션 하나를 식별하는 키: 같은 날 두 번 만나는 분반도 시작 시각으로 구분됨
+KEY_FIELDS = ('code', 'class_number', 'day', 'start')
+# 키가 같을 때 비교하는 필드 -> 불일치 종류
+CHECKED_FIELDS = {'end': 'time', 'classroom': 'room', 'building_name': 'building', 'student_count': 'student_count'}
+CATEGORIES = ('missing', 'extra', 'time', 'room', 'building', 'student_count')
+EXAMPLE_LIMIT = 20
+
+
+def session_key(item):
+    return tuple(item.get(field) for field in KEY_FIELDS)
+
+
+def describe(item):
+    return (f"{item.get('code')}-{item.get('class_number')} {item.get('day')} "
+            f"{item.get('start')}-{item.get('end')} {item.get('building_name')} {item.get('classroom')} "
+            f"({item.get('student_count')}명)")
+
+
+class DifferentialReport:
+    def __init__(self):
+        self.counts = Counter()
+        self.examples = defaultdict(list)
+
+    def add(self, category, message):
+        self.counts[category] += 1
+        if len(self.examples[category]) < EXAMPLE_LIMIT:
+            self.examples[category].append(message)
+
+    @property
+    def mismatches(self):
+        return sum(self.counts[category] for category in CATEGORIES)
+
+    def to_dict(self):
+        return {
+            "checked": self.counts['checked'],
+            "converted": self.counts['converted'],
+            "matched": self.counts['matched'],
+            "mismatches": {category: self.counts[category] for category in CATEGORIES},
+            "examples": {category: self.examples[category] for category in CATEGORIES if self.examples[category]},
+        }
+
+
+def iter_converted(converted_file, db=None):
+    """변환 결과 세션: db(timetable.db)가 있으면 timetable 뷰, 없으면 timetable.json"""
+    if not db:
+        yield from iter_json_array(converted_file)
+        return
+    conn = connect(db)
+    try:
+        yield from iter_records(conn)
+    finally:
+        conn.close()
+
+
+def verify_timetable_times(source_file=SOURCE_FILE, converted_file=OUTPUT_FILE, report_path=None, db=None):
     """
-    Verifies that the start/end times in timetable.json correctly match
-    the period codes in the original '개설강좌 리스트.json' based on
-    the conversion rules in converter.py.
+    Streams the raw '개설강좌 리스트.json' and timetable.json together and checks that
+    every session the converter's own parser (converter.convert_record) produces is in
+    timetable.json with the same times, room, building and student count.
+
+    timetable.json is indexed once into a multimap keyed on (code, class_number, day, start),
+    so sections meeting twice on one day no longer overwrite each other. One O(n) pass.
+    With db, the converted side is read from the timetable view of that SQLite store instead.
     """
-    
-    # --- Conversion Rules (from converter.py) ---
-    DAY_MAP = {'월': 'MON', '화': 'TUE', '수': 'WED', '목': 'THU', '금': 'FRI', '토': 'SAT'}
-    PERIOD_MAP = {
-        '0': {'start': '08:00', 'duration': 50}, '1': {'start': '09:00', 'duration': 50},
-        '2': {'start': '10:00', 'duration': 50}, '3': {'start': '11:00', 'duration': 50},
-        '4': {'start': '12:00', 'duration': 50}, '5': {'start': '13:00', 'duration': 50},
-        '6': {'start': '14:00', 'duration': 50}, '7': {'start': '15:00', 'duration': 50},
-        '8': {'start': '16:00', 'duration': 50}, '9': {'start': '17:00', 'duration': 50},
-        '10': {'start': '18:00', 'duration': 50}, '11': {'start': '19:00', 'duration': 50},
-        '12': {'start': '20:00', 'duration': 50}, '13': {'start': '21:00', 'duration': 50},
-        'Z': {'start': '08:10', 'duration': 75}, 'A': {'start': '09:30', 'duration': 75},
-        'B': {'start': '11:00', 'duration': 75}, 'C': {'start': '13:30', 'duration': 75},
-        'D': {'start': '15:00', 'duration': 75}, 'E': {'start': '16:30', 'duration': 75},
-        'F': {'start': '18:00', 'duration': 75}, 'G': {'start': '19:30', 'duration': 75},
-        'H': {'start': '21:00', 'duration': 75},
-    }
-
-    def calculate_end_time(start_time, duration):
-        if not start_time: return ''
-        h, m = map(int, start_time.split(':'))
-        total_minutes = h * 60 + m + duration
-        end_h, end_m = divmod(total_minutes, 60)
-        return f"{end_h:02d}:{end_m:02d}"
-
-    # --- Load Data ---
-    try:
-        with open('개설강좌 리스트.json', 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
-        with open('timetable.json', 'r', encoding='utf-8') as f:
-            converted_data = json.load(f)
-    except FileNotFoundError as e:
-        print(f"오류: 파일을 찾을 수 없습니다 - {e.filename}")
-        return
+    report = DifferentialReport()
+
+    if db:
+        converted_file = db
+    for path in (source_file, converted_file):
+        if not os.path.exists(path):
+            print(f"오류: 파일을 찾을 수 없습니다 - {path}")
+            return None
+
+    # --- 변환 결과 multimap (Session으로 들고 있어 dict보다 작음) ---
+    converted = defaultdict(deque)
+    for item in iter_converted(converted_file, db):
+        try:
+            item = Session.from_dict(item)
+        except KeyError:
+            pass                        # 요일/시각 형식이 어긋난 항목은 dict 그대로 비교
+        converted[session_key(item)].append(item)
+        report.counts['converted'] += 1
 
-    # Create a quick lookup map from the converted data
-    converted_map = {}
-    for item in converted_data:
-        key = (item['code'], item['class_number'], item['day'])
-        converted_map[key] = {'start': item['start'], 'end': item['end']}
-
-    # --- Verification Logic ---
-    mismatches = []
-    total_checks = 0
-
-    for record in raw_data:
-        time_str = record.get("강의실/강의시간", "")
-        if not time_str or time_str.strip() in ['(?)', '(), ()', '']:
-            continue
-
-        base_key_tuple = (record.get("과목코드", "").strip(), record.get("분반", "").strip())
-        
-        parts = time_str.split(',')
-        for part in parts:
-            part = part.strip()
-            # Regex patterns from converter.py
-            match1 = re.match(r'([\w.-]+)\s*\(([\uac00-\ud7a3])([A-Z\d])\)', part)
-            match2 = re.match(r'([\uac00-\ud7a3])\s+([A-Z\d,]+)\(([\w.-]+)\)', part)
-            match3 = re.match(r'([\uac00-\ud7a3])([A-Z\d])\(([\w.-]+)\)', part) # Added in previous fix
-
-            if not (match1 or match2 or match3):
+    # --- 원본 한 건씩: 변환기 파서로 기대 세션을 만들고 multimap에서 꺼내 비교 ---
+    unmatched = defaultdict(list)
+    for record in iter_raw_records(source_file):
+        for expected in convert_record(record):
+            report.counts['checked'] += 1
+            key = session_key(expected)
+            candidates = converted.get(key)
+            if not candidates:
+                unmatched[key[:3]].append(expected)
                 continue
+            actual = candidates.popleft()
+            differences = [
+                (CHECKED_FIELDS[field], field) for field in CHECKED_FIELDS
+                if expected.get(field) != actual.get(field)
+            ]
+            if not differences:
+                report.counts['matched'] += 1
+            for category, field in differences:
+                report.add(category, f"{describe(expected)} | {field}: 예상 {expected.get(field)!r}, 실제 {actual.get(field)!r}")
 
-            if match1:
-                _, day_kor, period = match1.groups()
-            elif match2:
-                day_kor, period, _ = match2.groups()
-            elif match3:
-                day_kor, period, _ = match3.groups()
-
-            day_eng = DAY_MAP.get(day_kor)
-            time_info = PERIOD_MAP.get(period.upper())
-
-            if day_eng and time_info:
-                total_checks += 1
-                expected_start = time_info['start']
-                expected_end = calculate_end_time(expected_start, time_info['duration'])
-                
-                # Find in converted data
-                lookup_key = (*base_key_tuple, day_eng)
-                actual_times = converted_map.get(lookup_key)
-
-                if not actual_times:
-                    mismatches.append(f"누락: {lookup_key} 과목이 timetable.json에 없습니다.")
-                elif actual_times['start'] != expected_start or actual_times['end'] != expected_end:
-                    mismatches.append(
-                        f"불일치: {lookup_key} | "
-                        f"예상: {expected_start}-{expected_end} | "
-                        f"실제: {actual_times['start']}-{actual_times['end']}"
-                    )
-
-    # --- Report Results ---
-    print("--- 시간표 시간대 정확성 검증 결과 ---")
-    print(f"총 {total_checks}개의 시간 데이터를 검증했습니다.")
-    if not mismatches:
-        print("✅ 모든 시간대가 정확하게 변환되었습니다.")
+    # --- 남은 세션: 같은 (과목, 분반, 요일)이면 시작 시각 불일치, 아니면 누락 / 추가 ---
+    leftovers = defaultdict(list)
+    for key, items in converted.items():
+        for item in items:
+            leftovers[key[:3]].append(item)
+    for group, expected_items in unmatched.items():
+        actual_items = leftovers.pop(group, [])
+        for expected, actual in zip(expected_items, actual_items):
+            report.add('time', f"{describe(expected)} | 실제 {actual.get('start')}-{actual.get('end')}")
+        for expected in expected_items[len(actual_items):]:
+            report.add('missing', f"{describe(expected)} 이(가) {converted_file}에 없습니다.")
+        for actual in actual_items[len(expected_items):]:
+            report.add('extra', f"{describe(actual)} 은(는) 원본에 없습니다.")
+    for actual_items in leftovers.values():
+        for actual in actual_items:
+            report.add('extra', f"{describe(actual)} 은(는) 원본에 없습니다.")
+
+    print_report(report)
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+    return report
+
+
+def print_report(report):
+    print("--- 시간표 변환 차분 검증 결과 ---")
+    print(f"원본 기준 {report.counts['checked']}개 세션 / 변환 결과 {report.counts['converted']}개 세션을 비교했습니다.")
+    if not report.mismatches:
+        print(f"✅ {report.counts['matched']}개 세션의 시간/강의실/건물/수강 인원이 모두 일치합니다.")
     else:
-        print(f"🚨 총 {len(mismatches)}개의 불일치 항목을 발견했습니다:")
-        for mismatch in mismatches[:20]: # Show up to 20 mismatches
-            print(f"- {mismatch}")
-        if len(mismatches) > 20:
-            print(f"... 외 {len(mismatches) - 20}개 더 있습니다.")
+        print(f"🚨 총 {report.mismatches}개의 불일치 항목을 발견했습니다 (일치 {report.counts['matched']}개):")
+        for category in CATEGORIES:
+            if report.counts[category]:
+                print(f"  [{category}] {report.counts[category]}개")
+                for message in report.examples[category][:5]:
+                    print(f"    - {message}")
     print("------------------------------------")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="원본과 timetable.json 차분 검증")
+    parser.add_argument('--source', default=SOURCE_FILE)
+    parser.add_argument('--timetable', default=OUTPUT_FILE)
+    parser.add_argument('--report', help="검증 결과 JSON 저장 경로")
+    parser.add_argument('--db', help="timetable.json 대신 SQLite 저장소의 timetable 뷰와 비교 (예: timetable.db)")
+    args = parser.parse_args()
+
+    try:
+        report = verify_timetable_times(args.source, args.timetable, args.report, args.db)
+    except SchemaVersionError as e:
+        print(f"🔴 {e}")
+        sys.exit(1)
+    if report is None or report.mismatches:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    verify_timetable_times()
+    main()